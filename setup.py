@@ -2,11 +2,65 @@
 
 import io
 import os
+import subprocess
+import sys
 
 from setuptools import setup
+
+try:
+    from setuptools.errors import ExecError as DistutilsExecError
+except ImportError:  # setuptools < 59, distutils still in the stdlib
+    from distutils.errors import DistutilsExecError
+
 import versioneer
 
 commands = versioneer.get_cmdclass().copy()
+base_build_py = commands["build_py"]
+
+
+# run in a separate interpreter, so that the ecdsa package from the build
+# directory is used, and not one that is already installed
+_WRITE_TABLES = """
+import sys
+build_lib, path = sys.argv[1:]
+sys.path.insert(0, build_lib)
+try:
+    from ecdsa import precompute
+except ImportError as e:
+    sys.stderr.write("%s\\n" % e)
+    sys.exit(3)
+precompute.write_tables(path)
+"""
+
+
+class cmd_build_py(base_build_py):
+    """Build the package with the precomputation tables for curves."""
+
+    def run(self):
+        base_build_py.run(self)
+        if self.dry_run:
+            return
+        # the tables are an optimisation only, when they are missing the
+        # library will calculate them at run time, so don't fail the build
+        # when the package can't be imported
+        ret = subprocess.call(
+            [
+                sys.executable,
+                "-E",
+                "-s",
+                "-c",
+                _WRITE_TABLES,
+                os.path.abspath(self.build_lib),
+                os.path.join(self.build_lib, "ecdsa", "_tables"),
+            ]
+        )
+        if ret == 3:
+            self.warn("precomputation tables not generated")
+        elif ret:
+            raise DistutilsExecError("generating precomputation tables failed")
+
+
+commands["build_py"] = cmd_build_py
 
 # Use README.md to set markdown long_description
 directory = os.path.abspath(os.path.dirname(__file__))
@@ -44,5 +98,7 @@ setup(
         "Programming Language :: Python :: 3.12",
     ],
     install_requires=["six>=1.9.0"],
+    # needed to generate the precomputation tables during the build
+    setup_requires=["six>=1.9.0"],
     extras_require={"gmpy2": "gmpy2", "gmpy": "gmpy"},
 )
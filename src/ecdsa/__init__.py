@@ -44,6 +44,9 @@ from .ecdh import (
     InvalidSharedSecretError,
 )
 from .der import UnexpectedDER
+from . import noncepool
+from . import precompute
+from .precompute import warmup
 from . import _version
 
 # This code comes from http://github.com/tlsfuzzer/python-ecdsa
@@ -53,7 +56,9 @@ __all__ = [
     "ecdsa",
     "ellipticcurve",
     "keys",
+    "noncepool",
     "numbertheory",
+    "precompute",
     "test_pyecdsa",
     "util",
     "six",
@@ -71,6 +76,7 @@ _hush_pyflakes = [
     InvalidSharedSecretError,
     ECDH,
     NoCurveError,
+    warmup,
     NIST192p,
     NIST224p,
     NIST256p,
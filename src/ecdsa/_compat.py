@@ -1,6 +1,7 @@
 """
 Common functions for providing cross-python version compatibility.
 """
+import os
 import sys
 import re
 import binascii
@@ -76,6 +77,17 @@ if sys.version_info < (3, 0):  # pragma: no branch
             return int(b2a_hex(val[::-1]), 16)
         raise ValueError("Only 'big' and 'little' endian supported")
 
+    def replace_file(src, dst):
+        """Rename src to dst, replacing dst if it exists."""
+        try:
+            os.rename(src, dst)
+        except OSError:
+            # on Windows rename() doesn't replace existing files
+            if not os.path.exists(dst):
+                raise
+            os.remove(dst)
+            os.rename(src, dst)
+
     def int_to_bytes(val, length=None, byteorder="big"):
         """Return number converted to bytes"""
         if length is None:
@@ -122,6 +134,8 @@ else:
         """Return number of bits necessary to represent an integer."""
         return val.bit_length()
 
+    replace_file = os.replace
+
     def int_to_bytes(val, length=None, byteorder="big"):
         """Convert integer to bytes."""
         if length is None:
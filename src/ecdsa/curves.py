@@ -75,9 +75,13 @@ class Curve:
         self.oid = oid
         if oid:
             self.encoded_oid = der.encode_oid(*oid)
+        self.__encodings_state = None
+        self.__encodings = {}
 
     def __eq__(self, other):
         if isinstance(other, Curve):
+            if self is other:
+                return True
             return (
                 self.curve == other.curve and self.generator == other.generator
             )
@@ -86,6 +90,31 @@ class Curve:
     def __ne__(self, other):
         return not self == other
 
+    def __hash__(self):
+        return hash((self.curve, self.generator.x(), self.generator.y()))
+
+    def __reduce__(self):
+        # pickle the well-known curves by name so that the unpickled keys
+        # share the generator (and its precomputation table) with the module
+        if _curve_registry()[1].get(self.name) is self:
+            return (curve_by_name, (self.name,))
+        return (
+            Curve,
+            (
+                self.name,
+                self.curve,
+                self.generator,
+                self.oid,
+                self.openssl_name,
+            ),
+        )
+
+    def __setstate__(self, state):
+        # objects pickled by old versions don't have the memoised encodings
+        self.__dict__.update(state)
+        self.__encodings_state = None
+        self.__encodings = {}
+
     def __repr__(self):
         return self.name
 
@@ -113,6 +142,23 @@ class Curve:
                 "Only 'named_curve' and 'explicit' encodings supported"
             )
 
+        # the encoding is memoised as long as the parameters are not replaced
+        state = (self.curve, self.generator, self.oid)
+        old_state = self.__encodings_state
+        if old_state is None or any(
+            i is not j for i, j in zip(state, old_state)
+        ):
+            self.__encodings_state = state
+            self.__encodings = {}
+        key = (encoding, point_encoding)
+        ret = self.__encodings.get(key)
+        if ret is None:
+            ret = self.__encode_der(encoding, point_encoding)
+            self.__encodings[key] = ret
+        return ret
+
+    def __encode_der(self, encoding, point_encoding):
+        """Serialise the curve parameters, without caching."""
         if encoding == "named_curve":
             if not self.oid:
                 raise UnknownCurveError(
@@ -185,6 +231,12 @@ class Curve:
                 "Only named_curve and explicit encodings supported"
             )
         data = normalise_bytes(data)
+        well_known = _curve_registry()[2]
+        if "explicit" in valid_encodings:
+            # the same parameters were decoded before
+            ret = _explicit_curves.get(bytes(data))
+            if ret is not None:
+                return ret
         if not der.is_sequence(data):
             if "named_curve" not in valid_encodings:
                 raise der.UnexpectedDER(
@@ -247,17 +299,25 @@ class Curve:
             curve_fp,
             base_bytes,
             valid_encodings=("uncompressed", "compressed", "hybrid"),
-            order=order,
-            generator=True,
         )
-        tmp_curve = Curve("unknown", curve_fp, base, None)
+        params = _curve_params(curve_fp, base)
 
         # if the curve matches one of the well-known ones, use the well-known
         # one in preference, as it will have the OID and name associated
-        for i in curves:
-            if tmp_curve == i:
-                return i
-        return tmp_curve
+        ret = well_known.get(params)
+        if ret is None:
+            # reuse the curve (and the precomputation table of its generator)
+            # if the same parameters were decoded before
+            key = (params, order, cofactor)
+            ret = _explicit_curves.get(key)
+            if ret is None:
+                base = ellipticcurve.PointJacobi(
+                    curve_fp, base.x(), base.y(), 1, order, generator=True
+                )
+                ret = Curve("unknown", curve_fp, base, None)
+                _cache_explicit_curve(key, ret)
+        _cache_explicit_curve(bytes(data), ret)
+        return ret
 
     @classmethod
     def from_pem(cls, string, valid_encodings=None):
@@ -546,6 +606,64 @@ curves = [
 ]
 
 
+def _curve_params(curve, generator):
+    """
+    Return the parameters that uniquely identify the curve and base point.
+
+    The parameters are reduced to canonical form, so they can be used as
+    dictionary keys: two :py:class:`Curve` objects compare equal if and only
+    if they have the same parameters.
+    """
+    p = curve.p()
+    if isinstance(curve, ellipticcurve.CurveEdTw):
+        coeffs = (b"E", p, curve.a() % p, curve.d() % p)
+    else:
+        coeffs = (b"W", p, curve.a() % p, curve.b() % p)
+    return coeffs + (generator.x(), generator.y())
+
+
+# indexes of the curves list by OID, by name (and OpenSSL name) and by
+# parameters, rebuilt if curves are added to the list
+_registry = (0, {}, {}, {})
+
+
+def _curve_registry():
+    """Return dictionaries of well-known curves by OID, name and parameters."""
+    global _registry
+    if _registry[0] != len(curves):
+        by_oid = {}
+        by_name = {}
+        by_params = {}
+        # the first curve in the list wins in case of duplicates
+        for c in curves:
+            by_oid.setdefault(c.oid, c)
+            by_name.setdefault(c.name, c)
+            if c.openssl_name:
+                by_name.setdefault(c.openssl_name, c)
+            by_params.setdefault(_curve_params(c.curve, c.generator), c)
+        _registry = (len(curves), by_oid, by_name, by_params)
+        # decoded explicit parameters may match the new curves now
+        _explicit_curves.clear()
+    return _registry[1:]
+
+
+# curves decoded from explicit parameters, by the DER encoding and by the
+# parameters, so that parsing many keys on a custom curve creates the
+# generator (and its precomputation table) just once
+_explicit_curves = {}
+
+_EXPLICIT_CURVES_LIMIT = 128
+
+
+def _cache_explicit_curve(key, curve):
+    """Remember a curve decoded from explicit parameters."""
+    if len(_explicit_curves) >= _EXPLICIT_CURVES_LIMIT:
+        # the parameters come from untrusted keys, so don't let them
+        # use an unbounded amount of memory
+        _explicit_curves.clear()
+    _explicit_curves[key] = curve
+
+
 def find_curve(oid_curve):
     """Select a curve based on its OID
 
@@ -557,9 +675,9 @@ def find_curve(oid_curve):
 
     :rtype: ~ecdsa.curves.Curve
     """
-    for c in curves:
-        if c.oid == oid_curve:
-            return c
+    ret = _curve_registry()[0].get(oid_curve)
+    if ret is not None:
+        return ret
     raise UnknownCurveError(
         "I don't know about the curve with oid %s."
         "I only know about these: %s" % (oid_curve, [c.name for c in curves])
@@ -580,9 +698,9 @@ def curve_by_name(name):
 
     :rtype: ~ecdsa.curves.Curve
     """
-    for c in curves:
-        if name == c.name or (c.openssl_name and name == c.openssl_name):
-            return c
+    ret = _curve_registry()[1].get(name)
+    if ret is not None:
+        return ret
     raise UnknownCurveError(
         "Curve with name {0!r} unknown, only curves supported: {1}".format(
             name, [c.name for c in curves]
@@ -87,10 +87,21 @@ class Signature(object):
     :ivar int s: the ``s`` element of the ECDSA signature
     """
 
+    __slots__ = ("r", "s", "__weakref__")
+
     def __init__(self, r, s):
         self.r = r
         self.s = s
 
+    def __getstate__(self):
+        return (self.r, self.s)
+
+    def __setstate__(self, state):
+        if isinstance(state, dict):
+            # objects pickled by old versions
+            state = (state["r"], state["s"])
+        self.r, self.s = state
+
     def recover_public_keys(self, hash, generator):
         """
         Returns two public keys for which the signature is valid
@@ -131,6 +142,8 @@ class Signature(object):
 class Public_key(object):
     """Public key for ECDSA."""
 
+    __slots__ = ("curve", "generator", "point", "order", "__weakref__")
+
     def __init__(self, generator, point, verify=True):
         """Low level ECDSA public key object.
 
@@ -147,11 +160,14 @@ class Public_key(object):
         self.point = point
         n = generator.order()
         p = self.curve.p()
-        if not (0 <= point.x() < p) or not (0 <= point.y() < p):
+        # for points in Jacobi coordinates every call needs an inversion
+        x = point.x()
+        y = point.y()
+        if not (0 <= x < p) or not (0 <= y < p):
             raise InvalidPointError(
                 "The public point has x or y out of range."
             )
-        if verify and not self.curve.contains_point(point.x(), point.y()):
+        if verify and not self.curve.contains_point(x, y):
             raise InvalidPointError("Point does not lay on the curve")
         if not n:
             raise InvalidPointError("Generator point must have order.")
@@ -165,6 +181,18 @@ class Public_key(object):
         ):
             raise InvalidPointError("Generator point order is bad.")
 
+    def __getstate__(self):
+        return (self.generator, self.point, getattr(self, "order", None))
+
+    def __setstate__(self, state):
+        if isinstance(state, dict):
+            # objects pickled by old versions
+            state = (state["generator"], state["point"], state.get("order"))
+        self.generator, self.point, order = state
+        self.curve = self.generator.curve()
+        if order is not None:
+            self.order = order
+
     def __eq__(self, other):
         """Return True if the keys are identical, False otherwise.
 
@@ -184,13 +212,17 @@ class Public_key(object):
         """Verify that signature is a valid signature of hash.
         Return True if the signature is valid.
         """
+        return self.verifies_ints(hash, signature.r, signature.s)
+
+    def verifies_ints(self, hash, r, s):
+        """Verify that r and s are a valid signature of hash.
+        Return True if the signature is valid.
+        """
 
         # From X9.62 J.3.1.
 
         G = self.generator
         n = G.order()
-        r = signature.r
-        s = signature.s
         if r < 1 or r > n - 1:
             return False
         if s < 1 or s > n - 1:
@@ -209,21 +241,82 @@ class Public_key(object):
 class Private_key(object):
     """Private key for ECDSA."""
 
-    def __init__(self, public_key, secret_multiplier):
+    __slots__ = (
+        "__public_key",
+        "__generator",
+        "secret_multiplier",
+        "order",
+        "__weakref__",
+    )
+
+    def __init__(self, public_key, secret_multiplier, generator=None):
         """public_key is of class Public_key;
         secret_multiplier is a large integer.
-        """
 
-        self.public_key = public_key
+        public_key can be None if the generator is provided, in that case
+        the public key will be calculated on first access to the
+        public_key attribute.
+        """
+        if public_key is None and generator is None:
+            raise ValueError("Either public_key or generator is required")
+        self.__public_key = public_key
+        self.__generator = generator or public_key.generator
         self.secret_multiplier = secret_multiplier
 
+    @property
+    def public_key(self):
+        """The Public_key associated with this private key."""
+        if self.__public_key is None:
+            point = self.__generator * self.secret_multiplier
+            if hasattr(point, "scale"):
+                point = point.scale()
+            self.__public_key = Public_key(self.__generator, point, False)
+        return self.__public_key
+
+    @public_key.setter
+    def public_key(self, value):
+        self.__public_key = value
+
+    def __getstate__(self):
+        return (
+            self.__public_key,
+            self.__generator,
+            self.secret_multiplier,
+            getattr(self, "order", None),
+        )
+
+    def __setstate__(self, state):
+        if isinstance(state, dict):
+            # objects pickled by old versions
+            state = dict(
+                (k.replace("_Private_key__", ""), v) for k, v in state.items()
+            )
+            public_key = state["public_key"]
+            state = (
+                public_key,
+                state.get("generator") or public_key.generator,
+                state["secret_multiplier"],
+                state.get("order"),
+            )
+        (
+            self.__public_key,
+            self.__generator,
+            self.secret_multiplier,
+            order,
+        ) = state
+        if order is not None:
+            self.order = order
+
     def __eq__(self, other):
         """Return True if the points are identical, False otherwise."""
         if isinstance(other, Private_key):
-            return (
-                self.public_key == other.public_key
-                and self.secret_multiplier == other.secret_multiplier
-            )
+            if self.secret_multiplier != other.secret_multiplier:
+                return False
+            # avoid calculating the public keys just for comparison, they
+            # are equal if the generators are equal
+            if self.__public_key is None or other.__public_key is None:
+                return self.__generator == other.__generator
+            return self.__public_key == other.__public_key
         return NotImplemented
 
     def __ne__(self, other):
@@ -244,8 +337,18 @@ class Private_key(object):
         May raise RuntimeError, in which case retrying with a new
         random value k is in order.
         """
+        return Signature(*self.sign_ints(hash, random_k))
+
+    def sign_ints(self, hash, random_k):
+        """Return the r and s values of a signature for the provided hash,
+        using the provided random nonce. See sign() for requirements on the
+        nonce.
 
-        G = self.public_key.generator
+        May raise RuntimeError, in which case retrying with a new
+        random value k is in order.
+        """
+
+        G = self.__generator
         n = G.order()
         k = random_k % n
         # Fix the bit-length of the random nonce,
@@ -266,7 +369,81 @@ class Private_key(object):
         ) % n
         if s == 0:
             raise RSZeroError("amazingly unlucky random number s")
-        return Signature(r, s)
+        return r, s
+
+    def sign_ints_many(self, hashes, random_ks):
+        """Return the r and s values of signatures for the provided hashes,
+        using the provided random nonces, one for every hash. See sign() for
+        requirements on the nonces.
+
+        Faster than calling sign_ints() for every hash, as the points k*G
+        are normalised and the nonces are inverted with just one modular
+        inversion each.
+
+        Unlike sign_ints(), it doesn't raise RSZeroError, None is returned
+        in place of the signature for which the nonce was unlucky.
+        """
+        d = self.secret_multiplier
+        n = self.__generator.order()
+        ret = []
+        for hash, pair in zip(
+            hashes, nonce_pairs(self.__generator, random_ks)
+        ):
+            if pair is None:
+                ret.append(None)
+                continue
+            r, k_inv = pair
+            s = k_inv * (hash + (d * r) % n) % n
+            ret.append((r, s) if s else None)
+        return ret
+
+    def sign_ints_with_nonce_pair(self, hash, r, k_inverse):
+        """Return the r and s values of a signature for the provided hash,
+        using the "r" value and the inverse of the random nonce computed
+        ahead of time by nonce_pairs().
+
+        Every pair must be used for just one signature, see sign().
+
+        May raise RuntimeError, in which case retrying with a new
+        pair is in order.
+        """
+        n = self.__generator.order()
+        s = k_inverse * (hash + (self.secret_multiplier * r) % n) % n
+        if s == 0:
+            raise RSZeroError("amazingly unlucky random number s")
+        return r, s
+
+
+def nonce_pairs(generator, random_ks):
+    """Return the "r" values and the inverses of the random nonces, the
+    parts of ECDSA signatures that don't depend on the key or the signed
+    hash.
+
+    The points k*G are normalised and the nonces are inverted with just
+    one modular inversion each. The nonces have the same requirements as
+    the ones for Private_key.sign().
+
+    :return: list of (r, inverse of k) tuples, None in place of the tuple
+        for nonces that give r equal zero
+    """
+    G = generator
+    n = G.order()
+    ks = [k % n for k in random_ks]
+    points = []
+    for k in ks:
+        # Fix the bit-length of the nonce, like in Private_key.sign_ints()
+        ks_ = k + n
+        if bit_length(ks_) == bit_length(n):
+            points.append((ks_ + n) * G)
+        else:
+            points.append(ks_ * G)
+    if isinstance(G, ellipticcurve.PointJacobi):
+        ellipticcurve.PointJacobi.scale_many(points)
+    ret = []
+    for p1, k_inv in zip(points, numbertheory.inverse_mod_many(ks, n)):
+        r = p1.x() % n
+        ret.append((r, k_inv) if r else None)
+    return ret
 
 
 def int_to_string(x):
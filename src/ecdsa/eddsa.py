@@ -80,12 +80,21 @@ generator_ed448 = ellipticcurve.PointEdwards(
 )
 
 
+def _dom_prefix(curve):
+    """Return the prefix hashed with the data by Pure EdDSA on the curve."""
+    # Ed448 uses dom4() with empty context, Ed25519 doesn't use any prefix
+    if curve == curve_ed448:
+        return b"SigEd448\x00\x00"
+    return b""
+
+
 class PublicKey(object):
     """Public key for the Edwards Digital Signature Algorithm."""
 
     def __init__(self, generator, public_key, public_point=None):
         self.generator = generator
         self.curve = generator.curve()
+        self.__dom = _dom_prefix(self.curve)
         self.__encoded = public_key
         # plus one for the sign bit and round up
         self.baselen = (bit_length(self.curve.p()) + 1 + 7) // 8
@@ -102,6 +111,11 @@ class PublicKey(object):
                 self.curve, public_key
             )
 
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        # objects pickled by old versions don't include the prefix
+        self.__dom = _dom_prefix(self.curve)
+
     def __eq__(self, other):
         if isinstance(other, PublicKey):
             return (
@@ -144,10 +158,7 @@ class PublicKey(object):
         if S >= self.generator.order():
             raise ValueError("Invalid signature")
 
-        dom = bytearray()
-        if self.curve == curve_ed448:
-            dom = bytearray(b"SigEd448" + b"\x00\x00")
-
+        dom = self.__dom
         k = bytes_to_int(
             self.curve.hash_func(dom + R.to_bytes() + self.__encoded + data),
             "little",
@@ -165,6 +176,7 @@ class PrivateKey(object):
     def __init__(self, generator, private_key):
         self.generator = generator
         self.curve = generator.curve()
+        self.__dom = _dom_prefix(self.curve)
         # plus one for the sign bit and round up
         self.baselen = (bit_length(self.curve.p()) + 1 + 7) // 8
         if len(private_key) != self.baselen:
@@ -181,6 +193,14 @@ class PrivateKey(object):
         a = self._key_prune(a)
         scalar = bytes_to_int(a, "little")
         self.__s = scalar
+        # the part of the hashed data for "r" that doesn't depend on message
+        self.__r_prefix = bytes(self.__dom + self.__h[self.baselen :])
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        # objects pickled by old versions don't include the prefixes
+        self.__dom = _dom_prefix(self.curve)
+        self.__r_prefix = bytes(self.__dom + self.__h[self.baselen :])
 
     @property
     def private_key(self):
@@ -235,13 +255,10 @@ class PrivateKey(object):
         data = compat26_str(data)
         A = self.public_key().public_key()
 
-        prefix = self.__h[self.baselen :]
-
-        dom = bytearray()
-        if self.curve == curve_ed448:
-            dom = bytearray(b"SigEd448" + b"\x00\x00")
-
-        r = bytes_to_int(self.curve.hash_func(dom + prefix + data), "little")
+        dom = self.__dom
+        r = bytes_to_int(
+            self.curve.hash_func(self.__r_prefix + data), "little"
+        )
         R = (self.generator * r).to_bytes()
 
         k = bytes_to_int(self.curve.hash_func(dom + R + A + data), "little")
@@ -250,3 +267,37 @@ class PrivateKey(object):
         S = (r + k * self.__s) % self.generator.order()
 
         return R + int_to_bytes(S, self.baselen, "little")
+
+    def sign_many(self, messages):
+        """
+        Perform Pure EdDSA signatures over all the messages.
+
+        Returns the same signatures as calling :py:meth:`sign` for every
+        message, but is faster, as the R points of all signatures are
+        normalised with just one modular inversion.
+
+        :param messages: the messages to sign
+        :type messages: iterable of bytes-like objects
+        :rtype: list(bytes)
+        """
+        messages = [compat26_str(i) for i in messages]
+        A = self.public_key().public_key()
+        hash_func = self.curve.hash_func
+        n = self.generator.order()
+        dom = self.__dom
+        r_prefix = self.__r_prefix
+
+        rs = [
+            bytes_to_int(hash_func(r_prefix + i), "little") for i in messages
+        ]
+        points = ellipticcurve.PointEdwards.scale_many(
+            [self.generator * r for r in rs]
+        )
+
+        ret = []
+        for data, r, point in zip(messages, rs, points):
+            R = point.to_bytes()
+            k = bytes_to_int(hash_func(dom + R + A + data), "little") % n
+            S = (r + k * self.__s) % n
+            ret.append(R + int_to_bytes(S, self.baselen, "little"))
+        return ret
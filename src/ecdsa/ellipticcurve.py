@@ -54,6 +54,48 @@ from .errors import MalformedPointError
 from .util import orderlen, string_to_number, number_to_string
 
 
+# Table stores consulted before calculating the precomputation table of
+# a point with the generator flag set and notified after it was calculated.
+# Use ecdsa.precompute.add_table_store() to modify it.
+_precompute_stores = []
+
+
+# points for which the precomputation table is being calculated by
+# ecdsa.precompute.warmup(), keyed by id(), until it's done multiplication
+# doesn't use (and doesn't calculate) the table; the points themselves are
+# kept so that a new point that reuses the id() is not mistaken for them
+_precompute_deferred = {}
+
+
+def _load_precompute(point):
+    """Return precomputation table of point from a table store, or None."""
+    for store in _precompute_stores:
+        table = store.get(point)
+        if table:
+            return table
+    return None
+
+
+def _save_precompute(point, table):
+    """Pass the newly calculated precomputation table to table stores."""
+    for store in _precompute_stores:
+        store.put(point, table)
+
+
+# Function converting the precomputation tables (lists of tuples) to a more
+# compact representation before they are assigned to points, None keeps
+# the lists. Use ecdsa.precompute.set_packed_tables() to modify it.
+_precompute_packer = None
+
+
+def _pack_precompute(point, table):
+    """Return the table in the representation selected for the points."""
+    packer = _precompute_packer
+    if packer is None or not isinstance(table, list):
+        return table
+    return packer(point, table)
+
+
 @python_2_unicode_compatible
 class CurveFp(object):
     """
@@ -103,6 +145,8 @@ class CurveFp(object):
         intrinsic curve characteristic (but it's complex to compute),
         only the prime and curve parameters are considered.
         """
+        if self is other:
+            return True
         if isinstance(other, CurveFp):
             p = self.__p
             return (
@@ -181,6 +225,8 @@ class CurveEdTw(object):
 
     def __eq__(self, other):
         """Returns True if other is an identical curve."""
+        if self is other:
+            return True
         if isinstance(other, CurveEdTw):
             p = self.__p
             return (
@@ -230,6 +276,9 @@ class CurveEdTw(object):
 class AbstractPoint(object):
     """Class for common methods of elliptic curve points."""
 
+    # keep the points weakly referenceable, like before they used slots
+    __slots__ = ("__weakref__",)
+
     @staticmethod
     def _from_raw_encoding(data, raw_encoding_length):
         """
@@ -502,6 +551,14 @@ class PointJacobi(AbstractPoint):
     y = Y / Z³
     """
 
+    __slots__ = (
+        "__curve",
+        "__coords",
+        "__order",
+        "__generator",
+        "__precompute",
+    )
+
     def __init__(self, curve, x, y, z, order=None, generator=False):
         """
         Initialise a point that uses Jacobi representation internally.
@@ -577,9 +634,21 @@ class PointJacobi(AbstractPoint):
         )
         return PointJacobi(curve, coord_x, coord_y, 1, order, generator)
 
-    def _maybe_precompute(self):
+    def _is_generator(self):
+        """Return True if the point has the generator flag set."""
+        return bool(self.__generator)
+
+    def _maybe_precompute(self, force=False):
         if not self.__generator or self.__precompute:
-            return
+            return self.__precompute
+        if not force and _precompute_deferred.get(id(self)) is self:
+            # the table is being calculated in background, don't wait for it
+            return self.__precompute
+
+        precompute = _load_precompute(self)
+        if precompute:
+            self.__precompute = _pack_precompute(self, precompute)
+            return self.__precompute
 
         # since this code will execute just once, and it's fully deterministic,
         # depend on atomicity of the last assignment to switch from empty
@@ -601,24 +670,43 @@ class PointJacobi(AbstractPoint):
             doubler = doubler.double().scale()
             precompute.append((doubler.x(), doubler.y()))
 
-        self.__precompute = precompute
+        _save_precompute(self, precompute)
+        self.__precompute = _pack_precompute(self, precompute)
+        return self.__precompute
 
-    def __getstate__(self):
-        # while this code can execute at the same time as _maybe_precompute()
-        # is updating the __precompute or scale() is updating the __coords,
-        # there is no requirement for consistency between __coords and
-        # __precompute
-        state = self.__dict__.copy()
-        return state
+    def __reduce__(self):
+        """
+        Return compact representation of the point for pickling.
+
+        The precomputation table is not included, points with the generator
+        flag set will recreate it on first use.
+        """
+        coord_x, coord_y, coord_z = self.__coords
+        order = self.__order
+        return (
+            self.__class__,
+            (
+                self.__curve,
+                int(coord_x),
+                int(coord_y),
+                int(coord_z),
+                order and int(order),
+                self.__generator,
+            ),
+        )
 
     def __setstate__(self, state):
-        self.__dict__.update(state)
+        # needed for loading of objects pickled by old versions
+        for name, value in state.items():
+            setattr(self, name, value)
 
     def __eq__(self, other):
         """Compare for equality two points with each-other.
 
         Note: only points that lay on the same curve can be equal.
         """
+        if self is other:
+            return True
         x1, y1, z1 = self.__coords
         if other is INFINITY:
             return not y1 or not z1
@@ -709,6 +797,33 @@ class PointJacobi(AbstractPoint):
         self.__coords = (x, y, 1)
         return self
 
+    @staticmethod
+    def scale_many(points):
+        """
+        Scale all points so that z == 1.
+
+        Faster than calling :py:meth:`scale` on every point, as it needs
+        just one modular inversion. All points need to lay on the same curve.
+
+        Modifies points in place, returns the points.
+
+        :param points: points to scale
+        :type points: list(PointJacobi)
+        :rtype: list(PointJacobi)
+        """
+        to_scale = [i for i in points if i.__coords[2] not in (0, 1)]
+        if not to_scale:
+            return points
+        p = to_scale[0].__curve.p()
+        inverses = numbertheory.inverse_mod_many(
+            [i.__coords[2] for i in to_scale], p
+        )
+        for point, z_inv in zip(to_scale, inverses):
+            x, y, _ = point.__coords
+            zz_inv = z_inv * z_inv % p
+            point.__coords = (x * zz_inv % p, y * zz_inv * z_inv % p, 1)
+        return points
+
     def to_affine(self):
         """Return point in affine form."""
         _, y, z = self.__coords
@@ -1073,6 +1188,8 @@ class Point(AbstractPoint):
     """A point on a short Weierstrass elliptic curve. Altering x and y is
     forbidden, but they can be read by the x() and y() methods."""
 
+    __slots__ = ("__curve", "__x", "__y", "__order")
+
     def __init__(self, curve, x, y, order=None):
         """curve, x, y, order; order (optional) is the order of this point."""
         super(Point, self).__init__()
@@ -1137,11 +1254,30 @@ class Point(AbstractPoint):
         )
         return Point(curve, coord_x, coord_y, order)
 
+    def __reduce__(self):
+        # keep INFINITY a singleton
+        if self is INFINITY:
+            return "INFINITY"
+        return super(Point, self).__reduce__()
+
+    def __getstate__(self):
+        return (self.__curve, self.__x, self.__y, self.__order)
+
+    def __setstate__(self, state):
+        if isinstance(state, dict):
+            # objects pickled by old versions
+            for name, value in state.items():
+                setattr(self, name, value)
+        else:
+            self.__curve, self.__x, self.__y, self.__order = state
+
     def __eq__(self, other):
         """Return True if the points are identical, False otherwise.
 
         Note: only points that lay on the same curve can be equal.
         """
+        if self is other:
+            return True
         if isinstance(other, Point):
             return (
                 self.__curve == other.__curve
@@ -1278,6 +1414,14 @@ class PointEdwards(AbstractPoint):
     x*y = T / Z
     """
 
+    __slots__ = (
+        "__curve",
+        "__coords",
+        "__order",
+        "__generator",
+        "__precompute",
+    )
+
     def __init__(self, curve, x, y, z, t, order=None, generator=False):
         """
         Initialise a point that uses the extended coordinates internally.
@@ -1336,9 +1480,21 @@ class PointEdwards(AbstractPoint):
             curve, coord_x, coord_y, 1, coord_x * coord_y, order, generator
         )
 
-    def _maybe_precompute(self):
+    def _is_generator(self):
+        """Return True if the point has the generator flag set."""
+        return bool(self.__generator)
+
+    def _maybe_precompute(self, force=False):
         if not self.__generator or self.__precompute:
             return self.__precompute
+        if not force and _precompute_deferred.get(id(self)) is self:
+            # the table is being calculated in background, don't wait for it
+            return self.__precompute
+
+        precompute = _load_precompute(self)
+        if precompute:
+            self.__precompute = _pack_precompute(self, precompute)
+            return self.__precompute
 
         # since this code will execute just once, and it's fully deterministic,
         # depend on atomicity of the last assignment to switch from empty
@@ -1370,9 +1526,37 @@ class PointEdwards(AbstractPoint):
             i *= 2
             doubler = doubler.double()
 
-        self.__precompute = precompute
+        _save_precompute(self, precompute)
+        self.__precompute = _pack_precompute(self, precompute)
         return self.__precompute
 
+    def __reduce__(self):
+        """
+        Return compact representation of the point for pickling.
+
+        The precomputation table is not included, points with the generator
+        flag set will recreate it on first use.
+        """
+        coord_x, coord_y, coord_z, coord_t = self.__coords
+        order = self.__order
+        return (
+            self.__class__,
+            (
+                self.__curve,
+                int(coord_x),
+                int(coord_y),
+                int(coord_z),
+                int(coord_t),
+                order and int(order),
+                self.__generator,
+            ),
+        )
+
+    def __setstate__(self, state):
+        # needed for loading of objects pickled by old versions
+        for name, value in state.items():
+            setattr(self, name, value)
+
     def x(self):
         """Return affine x coordinate."""
         X1, _, Z1, _ = self.__coords
@@ -1416,11 +1600,41 @@ class PointEdwards(AbstractPoint):
         self.__coords = (x, y, 1, t)
         return self
 
+    @staticmethod
+    def scale_many(points):
+        """
+        Scale all points so that z == 1.
+
+        Faster than calling :py:meth:`scale` on every point, as it needs
+        just one modular inversion. All points need to lay on the same curve.
+
+        Modifies points in place, returns the points.
+
+        :param points: points to scale
+        :type points: list(PointEdwards)
+        :rtype: list(PointEdwards)
+        """
+        to_scale = [i for i in points if i.__coords[2] not in (0, 1)]
+        if not to_scale:
+            return points
+        p = to_scale[0].__curve.p()
+        inverses = numbertheory.inverse_mod_many(
+            [i.__coords[2] for i in to_scale], p
+        )
+        for point, z_inv in zip(to_scale, inverses):
+            X1, Y1, _, _ = point.__coords
+            x = X1 * z_inv % p
+            y = Y1 * z_inv % p
+            point.__coords = (x, y, 1, x * y % p)
+        return points
+
     def __eq__(self, other):
         """Compare for equality two points with each-other.
 
         Note: only points on the same curve can be equal.
         """
+        if self is other:
+            return True
         x1, y1, z1, t1 = self.__coords
         if other is INFINITY:
             return not x1 or not t1
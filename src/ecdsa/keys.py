@@ -12,7 +12,8 @@ from . import rfc6979
 from . import ellipticcurve
 from .curves import NIST192p, Curve, Ed25519, Ed448
 from .ecdsa import RSZeroError
-from .util import string_to_number, number_to_string, randrange
+from .util import string_to_number, number_to_string, randrange, LRUCache
+from .util import randrange_many
 from .util import sigencode_string, sigdecode_string, bit_length
 from .util import (
     oid_ecPublicKey,
@@ -31,7 +32,11 @@ __all__ = [
     "BadDigestError",
     "VerifyingKey",
     "SigningKey",
+    "Signer",
+    "Verifier",
     "MalformedPointError",
+    "set_point_cache",
+    "set_verifying_key_cache",
 ]
 
 
@@ -88,6 +93,120 @@ def _truncate_and_convert_digest(digest, curve, allow_truncate):
     return number
 
 
+# cache of public points that were decoded and validated already, keyed by
+# the curve, the encoding and the set of allowed encodings,
+# see set_point_cache()
+_point_cache = None
+
+
+def set_point_cache(max_size=1024):
+    """
+    Enable or disable the process-wide cache of validated public points.
+
+    When enabled, :func:`VerifyingKey.from_string`,
+    :func:`VerifyingKey.from_der`, :func:`VerifyingKey.from_pem` (and the
+    :class:`~ecdsa.ecdh.ECDH` methods that use them) remember the points
+    decoded from the encodings, so that loading the same public key again
+    doesn't need to decompress the point or check that it lays on the curve
+    (or that it has the correct order, for curves with a cofactor).
+
+    Only the points of keys loaded with point validation enabled are cached.
+    The cache is shared by all threads. The cache is disabled by default.
+
+    :param int max_size: maximum number of points kept, least recently used
+        points are removed first, use 0 or None to disable the cache
+    """
+    global _point_cache
+    if max_size:
+        _point_cache = LRUCache(max_size)
+    else:
+        _point_cache = None
+
+
+# cache of VerifyingKey objects by the encoding they were loaded from,
+# see set_verifying_key_cache()
+_key_cache = None
+
+
+def set_verifying_key_cache(max_size=1024):
+    """
+    Enable or disable the process-wide cache of loaded public keys.
+
+    When enabled, :func:`VerifyingKey.from_string`,
+    :func:`VerifyingKey.from_der` and :func:`VerifyingKey.from_pem` (and the
+    :class:`~ecdsa.ecdh.ECDH` methods that use them) return the same
+    object when called again with the same encoding, curve, hash function
+    and other options, without parsing or validating the key again. As
+    the returned keys are shared, they are read-only: setting their
+    attributes raises :py:class:`AttributeError`. The keys can still be
+    precomputed with :func:`VerifyingKey.precompute`, the precomputation
+    tables are then shared too.
+
+    Keys loaded with ``lazy=True`` are returned from the cache, but are not
+    added to it.
+
+    :param int max_size: maximum number of keys kept, least recently used
+        keys are removed first, use 0 or None to disable the cache
+    """
+    global _key_cache
+    if max_size:
+        _key_cache = LRUCache(max_size)
+    else:
+        _key_cache = None
+
+
+def _frozen(encodings):
+    """Convert the set of encoding names to a hashable object."""
+    if encodings is None:
+        return None
+    return frozenset(encodings)
+
+
+def _public_key_from_point(point, curve, validate_point):
+    """Wrap a point in :py:class:`~ecdsa.ecdsa.Public_key` for the curve."""
+    try:
+        pubkey = ecdsa.Public_key(curve.generator, point, validate_point)
+    except ecdsa.InvalidPointError:
+        raise MalformedPointError("Point does not lay on the curve")
+    pubkey.order = curve.order
+    return pubkey
+
+
+def _decode_public_key(curve, string, validate_point, valid_encodings):
+    """Decode and validate the public key from its encoding."""
+    edwards = isinstance(curve.curve, CurveEdTw)
+    cache = _point_cache
+    if cache is not None and (validate_point or edwards):
+        if valid_encodings is not None:
+            valid_encodings = frozenset(valid_encodings)
+        key = (curve, string, valid_encodings)
+        point = cache.get(key)
+        if point is not None:
+            # the point was validated before it was put in the cache
+            if edwards:
+                return eddsa.PublicKey(curve.generator, string, point)
+            return _public_key_from_point(point, curve, False)
+    else:
+        key = None
+
+    if edwards:
+        try:
+            pubkey = eddsa.PublicKey(curve.generator, string)
+        except ValueError:
+            raise MalformedPointError("Malformed point for the curve")
+    else:
+        point = PointJacobi.from_bytes(
+            curve.curve,
+            string,
+            validate_encoding=validate_point,
+            valid_encodings=valid_encodings,
+        )
+        pubkey = _public_key_from_point(point, curve, validate_point)
+    if key is not None:
+        cache.put(key, pubkey.point)
+    return pubkey
+
+
 class VerifyingKey(object):
     """
     Class for handling keys that can verify signatures (public keys).
@@ -97,10 +216,21 @@ class VerifyingKey(object):
     :ivar default_hashfunc: the function that will be used for hashing the
         data. Should implement the same API as hashlib.sha1
     :vartype default_hashfunc: callable
-    :ivar pubkey: the actual public key
+    :ivar pubkey: the actual public key, for keys loaded with ``lazy=True``
+        the public point is decoded and validated on first access
     :vartype pubkey: ~ecdsa.ecdsa.Public_key
     """
 
+    __slots__ = (
+        "curve",
+        "default_hashfunc",
+        "__encoded_point",
+        "__pubkey",
+        "__encodings_state",
+        "__encodings",
+        "__weakref__",
+    )
+
     def __init__(self, _error__please_use_generate=None):
         """Unsupported, please use one of the classmethods to initialise."""
         if not _error__please_use_generate:
@@ -109,8 +239,57 @@ class VerifyingKey(object):
             )
         self.curve = None
         self.default_hashfunc = None
+        self.__encoded_point = None
+        self.__encodings_state = None
+        self.__encodings = None
         self.pubkey = None
 
+    @property
+    def pubkey(self):
+        """The :py:class:`~ecdsa.ecdsa.Public_key` wrapped by the object."""
+        if self.__encoded_point is not None:
+            self.__decode_point()
+        return self.__pubkey
+
+    @pubkey.setter
+    def pubkey(self, value):
+        self.__encoded_point = None
+        self.__encodings_state = None
+        self.__pubkey = value
+
+    def __cached_encodings(self):
+        """
+        Return the dictionary with memoised serialisations of the key.
+
+        The dictionary is cleared if the curve or the public point were
+        replaced since the serialisations were calculated.
+        """
+        pubkey = self.pubkey
+        state = (self.curve, pubkey, pubkey.point)
+        old_state = self.__encodings_state
+        if old_state is None or any(
+            i is not j for i, j in zip(state, old_state)
+        ):
+            self.__encodings_state = state
+            self.__encodings = {}
+        return self.__encodings
+
+    def _canonical_encoding(self):
+        """
+        Return the :term:`compressed` encoding of the public point.
+
+        The encoding is unique for a given point so it's used for hashing
+        and comparing keys. It is calculated once and then cached.
+        """
+        return bytes(self.to_string("compressed"))
+
+    def __decode_point(self):
+        """Decode and validate the public point saved by a lazy load."""
+        string, validate_point, valid_encodings = self.__encoded_point
+        self.pubkey = _decode_public_key(
+            self.curve, string, validate_point, valid_encodings
+        )
+
     def __repr__(self):
         pub_key = self.to_string("compressed")
         if self.default_hashfunc:
@@ -124,13 +303,66 @@ class VerifyingKey(object):
     def __eq__(self, other):
         """Return True if the points are identical, False otherwise."""
         if isinstance(other, VerifyingKey):
-            return self.curve == other.curve and self.pubkey == other.pubkey
+            if self is other:
+                return True
+            if self.curve != other.curve:
+                return False
+            # comparing the encodings is much faster than comparing points
+            # so use them if they have been calculated already
+            encoding = self.__cached_encodings().get("compressed")
+            other_encoding = other.__cached_encodings().get("compressed")
+            if encoding is not None and other_encoding is not None:
+                return encoding == other_encoding
+            return self.pubkey == other.pubkey
         return NotImplemented
 
     def __ne__(self, other):
         """Return False if the points are identical, True otherwise."""
         return not self == other
 
+    def __hash__(self):
+        """Return hash of the public point encoding."""
+        return hash(self._canonical_encoding())
+
+    def __reduce__(self):
+        """
+        Return compact representation of the key for pickling.
+
+        Only the curve, hash function and the public point (without its
+        precomputation table) are pickled, keys that weren't decoded yet
+        are pickled in the encoded form.
+        """
+        if self.__encoded_point is not None:
+            point = None
+        else:
+            point = self.pubkey.point
+        return (
+            self.__class__,
+            (True,),
+            (self.curve, self.default_hashfunc, point, self.__encoded_point),
+        )
+
+    def __setstate__(self, state):
+        self.__encodings_state = None
+        self.__encodings = None
+        if isinstance(state, dict):
+            # objects pickled by old versions
+            self.pubkey = None
+            for name, value in state.items():
+                setattr(self, name, value)
+            return
+        curve, self.default_hashfunc, point, encoded_point = state
+        self.curve = curve
+        if encoded_point is not None:
+            self.pubkey = None
+            self.__encoded_point = encoded_point
+        elif isinstance(curve.curve, CurveEdTw):
+            self.pubkey = eddsa.PublicKey(
+                curve.generator, bytes(point.to_bytes()), point
+            )
+        else:
+            self.pubkey = _public_key_from_point(point, curve, False)
+
     @classmethod
     def from_public_point(
         cls, point, curve=NIST192p, hashfunc=sha1, validate_point=True
@@ -166,13 +398,7 @@ class VerifyingKey(object):
             point = ellipticcurve.PointJacobi.from_affine(point)
         self.curve = curve
         self.default_hashfunc = hashfunc
-        try:
-            self.pubkey = ecdsa.Public_key(
-                curve.generator, point, validate_point
-            )
-        except ecdsa.InvalidPointError:
-            raise MalformedPointError("Point does not lay on the curve")
-        self.pubkey.order = curve.order
+        self.pubkey = _public_key_from_point(point, curve, validate_point)
         return self
 
     def precompute(self, lazy=False):
@@ -195,25 +421,32 @@ class VerifyingKey(object):
            use (when set to True)
         """
         if isinstance(self.curve.curve, CurveEdTw):
-            pt = self.pubkey.point
+            # scale the point once, instead of calculating the affine
+            # coordinates for every call of x() and y()
+            pt = self.pubkey.point.scale()
+            x, y = pt.x(), pt.y()
             self.pubkey.point = ellipticcurve.PointEdwards(
                 pt.curve(),
-                pt.x(),
-                pt.y(),
+                x,
+                y,
                 1,
-                pt.x() * pt.y(),
+                x * y % pt.curve().p(),
                 self.curve.order,
                 generator=True,
             )
         else:
-            self.pubkey.point = ellipticcurve.PointJacobi.from_affine(
-                self.pubkey.point, True
+            # points decoded from strings don't have the order set, so it
+            # can't be copied from the point
+            pt = self.pubkey.point
+            self.pubkey.point = ellipticcurve.PointJacobi(
+                pt.curve(), pt.x(), pt.y(), 1, self.curve.order, True
             )
         # as precomputation in now delayed to the time of first use of the
         # point and we were asked specifically to precompute now, make
         # sure the precomputation is performed now to preserve the behaviour
+        # (even if a warm-up in background was asked to do it)
         if not lazy:
-            self.pubkey.point * 2
+            self.pubkey.point._maybe_precompute(force=True)
 
     @classmethod
     def from_string(
@@ -223,6 +456,7 @@ class VerifyingKey(object):
         hashfunc=sha1,
         validate_point=True,
         valid_encodings=None,
+        lazy=False,
     ):
         """
         Initialise the object from byte encoding of public key.
@@ -255,30 +489,61 @@ class VerifyingKey(object):
             name). All formats by default (specified with ``None``).
             Ignored for EdDSA.
         :type valid_encodings: :term:`set-like object`
+        :param bool lazy: if set to True, the decoding and validation of
+            the public point is delayed to the time of first use of the key
+            (verification, comparison, export, etc.). Any errors in the
+            encoding will be reported then, with the same exceptions as
+            are raised with the default ``False``.
 
         :raises MalformedPointError: if the public point does not lay on the
             curve or the encoding is invalid
 
-        :return: Initialised VerifyingKey object
+        :return: Initialised VerifyingKey object, read-only if the
+            key cache is enabled, see :func:`set_verifying_key_cache`
         :rtype: VerifyingKey
         """
-        if isinstance(curve.curve, CurveEdTw):
+        # make a copy, as with lazy loading the caller may modify the
+        # buffer before we get to decoding it
+        string = bytes(normalise_bytes(string))
+        cache = _key_cache
+        if cache is not None and cls is VerifyingKey:
+            key = (
+                "string",
+                curve,
+                string,
+                hashfunc,
+                validate_point,
+                _frozen(valid_encodings),
+            )
+            ret = cache.get(key)
+            if ret is not None:
+                return ret
+        else:
+            key = None
+
+        if lazy or isinstance(curve.curve, CurveEdTw):
             self = cls(_error__please_use_generate=True)
             self.curve = curve
-            self.default_hashfunc = None  # ignored for EdDSA
-            try:
-                self.pubkey = eddsa.PublicKey(curve.generator, string)
-            except ValueError:
-                raise MalformedPointError("Malformed point for the curve")
-            return self
-
-        point = PointJacobi.from_bytes(
-            curve.curve,
-            string,
-            validate_encoding=validate_point,
-            valid_encodings=valid_encodings,
-        )
-        return cls.from_public_point(point, curve, hashfunc, validate_point)
+            if isinstance(curve.curve, CurveEdTw):
+                self.default_hashfunc = None  # ignored for EdDSA
+            else:
+                self.default_hashfunc = hashfunc
+            self.__encoded_point = (string, validate_point, valid_encodings)
+            if not lazy:
+                self.__decode_point()
+        else:
+            # the point is validated while decoding, subclasses can still
+            # customise the key through from_public_point()
+            pubkey = _decode_public_key(
+                curve, string, validate_point, valid_encodings
+            )
+            self = cls.from_public_point(
+                pubkey.point, curve, hashfunc, validate_point=False
+            )
+        if not lazy and key is not None:
+            self.__class__ = _CachedVerifyingKey
+            cache.put(key, self)
+        return self
 
     @classmethod
     def from_pem(
@@ -287,6 +552,7 @@ class VerifyingKey(object):
         hashfunc=sha1,
         valid_encodings=None,
         valid_curve_encodings=None,
+        lazy=False,
     ):
         """
         Initialise from public key stored in :term:`PEM` format.
@@ -310,6 +576,8 @@ class VerifyingKey(object):
             for curve parameters. By default (``None``) all are supported:
             ``named_curve`` and ``explicit``.
         :type valid_curve_encodings: :term:`set-like object`
+        :param bool lazy: delay decoding and validation of the public point
+            to the time of first use, see :func:`~VerifyingKey.from_string()`
 
 
         :return: Initialised VerifyingKey object
@@ -320,6 +588,7 @@ class VerifyingKey(object):
             hashfunc=hashfunc,
             valid_encodings=valid_encodings,
             valid_curve_encodings=valid_curve_encodings,
+            lazy=lazy,
         )
 
     @classmethod
@@ -329,6 +598,7 @@ class VerifyingKey(object):
         hashfunc=sha1,
         valid_encodings=None,
         valid_curve_encodings=None,
+        lazy=False,
     ):
         """
         Initialise the key stored in :term:`DER` format.
@@ -363,10 +633,45 @@ class VerifyingKey(object):
             for curve parameters. By default (``None``) all are supported:
             ``named_curve`` and ``explicit``.
         :type valid_curve_encodings: :term:`set-like object`
+        :param bool lazy: delay decoding and validation of the public point
+            to the time of first use, see :func:`~VerifyingKey.from_string()`.
+            The DER structure itself is always parsed immediately.
 
-        :return: Initialised VerifyingKey object
+        :return: Initialised VerifyingKey object, read-only if the
+            key cache is enabled, see :func:`set_verifying_key_cache`
         :rtype: VerifyingKey
         """
+        cache = _key_cache
+        if cache is not None and cls is VerifyingKey:
+            string = bytes(normalise_bytes(string))
+            key = (
+                "der",
+                string,
+                hashfunc,
+                _frozen(valid_encodings),
+                _frozen(valid_curve_encodings),
+            )
+            ret = cache.get(key)
+            if ret is not None:
+                return ret
+            ret = cls.__from_der(
+                string, hashfunc, valid_encodings, valid_curve_encodings, lazy
+            )
+            if not lazy:
+                # from_string() returns read-only keys only if it cached them
+                if type(ret) is VerifyingKey:
+                    ret.__class__ = _CachedVerifyingKey
+                cache.put(key, ret)
+            return ret
+        return cls.__from_der(
+            string, hashfunc, valid_encodings, valid_curve_encodings, lazy
+        )
+
+    @classmethod
+    def __from_der(
+        cls, string, hashfunc, valid_encodings, valid_curve_encodings, lazy
+    ):
+        """Decode the key from DER, see from_der()."""
         if valid_encodings is None:
             valid_encodings = set(["uncompressed", "compressed", "hybrid"])
         string = normalise_bytes(string)
@@ -388,7 +693,7 @@ class VerifyingKey(object):
             point_str, empty = der.remove_bitstring(point_str_bitstring, 0)
             if empty:
                 raise der.UnexpectedDER("trailing junk after public key")
-            return cls.from_string(point_str, curve, None)
+            return cls.from_string(point_str, curve, None, lazy=lazy)
         if not oid_pk == oid_ecPublicKey:
             raise der.UnexpectedDER(
                 "Unexpected object identifier in DER "
@@ -409,6 +714,7 @@ class VerifyingKey(object):
             curve,
             hashfunc=hashfunc,
             valid_encodings=valid_encodings,
+            lazy=lazy,
         )
 
     @classmethod
@@ -537,12 +843,22 @@ class VerifyingKey(object):
         Python 2 days when character strings and byte strings shared type.
         On Python 3 the returned type will be `bytes`.
 
+        The encoding is calculated once and then returned from cache.
+
         :return: :term:`raw encoding` of the public key (public point) on the
             curve
         :rtype: bytes
         """
         assert encoding in ("raw", "uncompressed", "compressed", "hybrid")
-        return self.pubkey.point.to_bytes(encoding)
+        encodings = self.__cached_encodings()
+        ret = encodings.get(encoding)
+        if ret is None:
+            ret = self.pubkey.point.to_bytes(encoding)
+            encodings[encoding] = ret
+        if isinstance(ret, bytearray):
+            # don't let the caller modify the cached value
+            return bytearray(ret)
+        return ret
 
     def to_pem(
         self, point_encoding="uncompressed", curve_parameters_encoding=None
@@ -570,10 +886,16 @@ class VerifyingKey(object):
         .. warning:: The PEM is encoded to US-ASCII, it needs to be
             re-encoded if the system is incompatible (e.g. uses UTF-16)
         """
-        return der.topem(
-            self.to_der(point_encoding, curve_parameters_encoding),
-            "PUBLIC KEY",
-        )
+        encodings = self.__cached_encodings()
+        key = ("pem", point_encoding, curve_parameters_encoding)
+        ret = encodings.get(key)
+        if ret is None:
+            ret = der.topem(
+                self.to_der(point_encoding, curve_parameters_encoding),
+                "PUBLIC KEY",
+            )
+            encodings[key] = ret
+        return ret
 
     def to_der(
         self, point_encoding="uncompressed", curve_parameters_encoding=None
@@ -598,21 +920,31 @@ class VerifyingKey(object):
         """
         if point_encoding == "raw":
             raise ValueError("raw point_encoding not allowed in DER")
+        encodings = self.__cached_encodings()
+        key = ("der", point_encoding, curve_parameters_encoding)
+        ret = encodings.get(key)
+        if ret is not None:
+            return ret
         point_str = self.to_string(point_encoding)
         if isinstance(self.curve.curve, CurveEdTw):
-            return der.encode_sequence(
+            ret = der.encode_sequence(
                 der.encode_sequence(der.encode_oid(*self.curve.oid)),
                 der.encode_bitstring(bytes(point_str), 0),
             )
-        return der.encode_sequence(
-            der.encode_sequence(
-                encoded_oid_ecPublicKey,
-                self.curve.to_der(curve_parameters_encoding, point_encoding),
-            ),
-            # 0 is the number of unused bits in the
-            # bit string
-            der.encode_bitstring(point_str, 0),
-        )
+        else:
+            ret = der.encode_sequence(
+                der.encode_sequence(
+                    encoded_oid_ecPublicKey,
+                    self.curve.to_der(
+                        curve_parameters_encoding, point_encoding
+                    ),
+                ),
+                # 0 is the number of unused bits in the
+                # bit string
+                der.encode_bitstring(point_str, 0),
+            )
+        encodings[key] = ret
+        return ret
 
     def verify(
         self,
@@ -663,8 +995,11 @@ class VerifyingKey(object):
         data = normalise_bytes(data)
         if isinstance(self.curve.curve, CurveEdTw):
             signature = normalise_bytes(signature)
+            # decode the key outside the try block, malformed key is not
+            # a bad signature
+            pubkey = self.pubkey
             try:
-                return self.pubkey.verify(data, signature)
+                return pubkey.verify(data, signature)
             except (ValueError, MalformedPointError) as e:
                 raise BadSignatureError("Signature verification failed", e)
 
@@ -672,6 +1007,49 @@ class VerifyingKey(object):
         digest = hashfunc(data).digest()
         return self.verify_digest(signature, digest, sigdecode, allow_truncate)
 
+    def verifier(
+        self,
+        signature,
+        hashfunc=None,
+        sigdecode=sigdecode_string,
+        allow_truncate=True,
+    ):
+        """
+        Create an object for verifying a signature over data passed in
+        chunks.
+
+        Like :func:`~VerifyingKey.verify`, but the data is hashed as it's
+        passed to :func:`Verifier.update`, so it doesn't need to be kept
+        in memory. Not supported with EdDSA, as pure EdDSA needs to hash
+        the whole message more than once.
+
+        :param signature: encoding of the signature
+        :type signature: sigdecode method dependent
+        :param hashfunc: The hash function that will be used for
+            verification, the default hash function of the key by default
+        :type hashfunc: callable
+        :param sigdecode: Callable to define the way the signature needs to
+            be decoded, see :func:`~VerifyingKey.verify`
+        :type sigdecode: callable
+        :param bool allow_truncate: if True, the digest can have bigger
+            bit-size than the order of the curve. Defaults to True.
+
+        :raises ValueError: if used with an Edwards curve key
+
+        :return: object for passing the signed data
+        :rtype: Verifier
+        """
+        if isinstance(self.curve.curve, CurveEdTw):
+            raise ValueError("Method unsupported for Edwards curves")
+        hashfunc = hashfunc or self.default_hashfunc
+
+        def finalize(digest):
+            return self.verify_digest(
+                signature, digest, sigdecode, allow_truncate
+            )
+
+        return Verifier(hashfunc(), finalize)
+
     def verify_digest(
         self,
         signature,
@@ -728,6 +1106,109 @@ class VerifyingKey(object):
             return True
         raise BadSignatureError("Signature verification failed")
 
+    def verify_ints(self, e, r, s):
+        """
+        Verify a signature given as integers over a digest given as integer.
+
+        This is a low level method for verifying many signatures in a tight
+        loop, it doesn't decode the signature, doesn't convert the digest
+        and doesn't raise exceptions for invalid signatures.
+
+        :param int e: the digest of the signed data converted to an integer
+            (and truncated to the bit size of the curve order if necessary)
+        :param int r: the ``r`` element of the signature
+        :param int s: the ``s`` element of the signature
+
+        :raises ValueError: if used with an Edwards curve key
+
+        :return: True if the signature is valid, False otherwise
+        :rtype: bool
+        """
+        if isinstance(self.curve.curve, CurveEdTw):
+            raise ValueError("Method unsupported for Edwards curves")
+        return self.pubkey.verifies_ints(e, r, s)
+
+    def tweak_add(self, t):
+        """
+        Derive the public key with the point ``t * G`` added to it.
+
+        If the private key associated with this key is ``d``, the returned
+        key is associated with the private key ``d + t`` (see
+        :py:meth:`SigningKey.tweak_add`). Use :py:meth:`tweak_add_many`
+        to derive multiple keys.
+
+        :param int t: the tweak, it's reduced modulo the curve order
+
+        :raises ValueError: if used with an Edwards curve key or if the
+            derived public point is the point at infinity
+
+        :return: the derived key, with the same default hash function
+        :rtype: VerifyingKey
+        """
+        return self.tweak_add_many([t])[0]
+
+    def tweak_add_many(self, tweaks):
+        """
+        Derive public keys with the points ``t * G`` added to it.
+
+        Faster than calling :py:meth:`tweak_add` repeatedly, as the derived
+        points are converted to affine coordinates together.
+
+        :param tweaks: the tweaks, they are reduced modulo the curve order
+        :type tweaks: iterable of ints
+
+        :raises ValueError: if used with an Edwards curve key or if any of
+            the derived public points is the point at infinity
+
+        :return: the derived keys, in the order of the tweaks
+        :rtype: list(VerifyingKey)
+        """
+        if isinstance(self.curve.curve, CurveEdTw):
+            raise ValueError("Method unsupported for Edwards curves")
+        curve = self.curve
+        generator = curve.generator
+        n = curve.order
+        point = self.pubkey.point
+        points = []
+        for t in tweaks:
+            child = point + generator * (t % n)
+            if child == ellipticcurve.INFINITY:
+                raise ValueError("Derived public key is point at infinity")
+            points.append(child)
+        PointJacobi.scale_many(points)
+        cls = type(self)
+        if cls is _CachedVerifyingKey:
+            # derived keys are not in the cache, so they should be writable
+            cls = VerifyingKey
+        # sum of points on the curve is on the curve, so no need to
+        # validate them again
+        return [
+            cls.from_public_point(
+                i, curve, self.default_hashfunc, validate_point=False
+            )
+            for i in points
+        ]
+
+
+class _CachedVerifyingKey(VerifyingKey):
+    """Read-only VerifyingKey shared through the key cache."""
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        # the memoised encodings don't change the key
+        if name.startswith("_VerifyingKey__encodings"):
+            object.__setattr__(self, name, value)
+        else:
+            raise AttributeError(
+                "Keys from the key cache are read-only, can't set "
+                "{0!r}".format(name)
+            )
+
+    def __reduce__(self):
+        # unpickled keys are not in the cache, so they should be writable
+        return (VerifyingKey,) + VerifyingKey.__reduce__(self)[1:]
+
 
 class SigningKey(object):
     """
@@ -739,10 +1220,25 @@ class SigningKey(object):
         data. Should implement the same API as :py:class:`hashlib.sha1`
     :ivar int baselen: the length of a :term:`raw encoding` of private key
     :ivar `~ecdsa.keys.VerifyingKey` verifying_key: the public key
-        associated with this private key
+        associated with this private key, calculated on first access
     :ivar `~ecdsa.ecdsa.Private_key` privkey: the actual private key
+    :ivar `~ecdsa.noncepool.NoncePool` nonce_pool: the pool of precomputed
+        nonces used for probabilistic signatures, None by default
     """
 
+    __slots__ = (
+        "curve",
+        "default_hashfunc",
+        "baselen",
+        "privkey",
+        "__verifying_key",
+        "__nonce_pool",
+        "__nonce_generator",
+        "__encodings_state",
+        "__encodings",
+        "__weakref__",
+    )
+
     def __init__(self, _error__please_use_generate=None):
         """Unsupported, please use one of the classmethods to initialise."""
         if not _error__please_use_generate:
@@ -752,21 +1248,168 @@ class SigningKey(object):
         self.baselen = None
         self.verifying_key = None
         self.privkey = None
+        self.__nonce_pool = None
+        self.__nonce_generator = None
+        self.__encodings_state = None
+        self.__encodings = None
+
+    @property
+    def verifying_key(self):
+        """
+        The :py:class:`VerifyingKey` associated with this private key.
+
+        It's calculated from the private key on first use, so errors in
+        generation of the public key are raised here, and not when the
+        private key is loaded or generated.
+        """
+        if self.__verifying_key is None and self.privkey is not None:
+            self.__verifying_key = self.__calculate_verifying_key()
+        return self.__verifying_key
+
+    @verifying_key.setter
+    def verifying_key(self, value):
+        self.__verifying_key = value
+
+    @property
+    def nonce_pool(self):
+        """
+        The :py:class:`~ecdsa.noncepool.NoncePool` used for signatures.
+
+        When set, the probabilistic signing methods that use the default
+        entropy source take the nonces from the pool, as long as it's not
+        empty. The pool isn't pickled with the key.
+        """
+        return self.__nonce_pool
+
+    @nonce_pool.setter
+    def nonce_pool(self, value):
+        if value is not None and value.curve != self.curve:
+            raise ValueError("Nonce pool is for a different curve")
+        self.__nonce_pool = value
+
+    def __nonces(self, hashfunc):
+        """
+        Return the RFC6979 nonce generator for the hash function.
+
+        The generator for the last used hash function is kept with the key,
+        as long as the private key is not replaced.
+        """
+        cached = self.__nonce_generator
+        if (
+            cached is None
+            or cached[0] is not self.privkey
+            or cached[1].hash_func is not hashfunc
+        ):
+            generator = rfc6979.NonceGenerator(
+                self.curve.generator.order(),
+                self.privkey.secret_multiplier,
+                hashfunc,
+            )
+            cached = (self.privkey, generator)
+            self.__nonce_generator = cached
+        return cached[1]
+
+    def __sign_with_pool(self, number):
+        """
+        Sign the number with a nonce from the pool.
+
+        :return: the "r" and "s" parameters of the signature, None if
+            the pool is empty
+        """
+        pool = self.__nonce_pool
+        while True:
+            pair = pool.take()
+            if pair is None:
+                return None
+            try:
+                return self.privkey.sign_ints_with_nonce_pair(number, *pair)
+            except RSZeroError:
+                pass
+
+    def __calculate_verifying_key(self):
+        """Derive the public key from the private key."""
+        curve = self.curve
+        verifying_key = VerifyingKey(_error__please_use_generate=True)
+        verifying_key.curve = curve
+        if isinstance(curve.curve, CurveEdTw):
+            # the public key object already has the point, so there's
+            # no need to encode it and decode it again
+            verifying_key.default_hashfunc = None  # ignored for EdDSA
+            verifying_key.pubkey = self.privkey.public_key()
+            return verifying_key
+        verifying_key.default_hashfunc = self.default_hashfunc
+        pubkey = self.privkey.public_key
+        pubkey.order = curve.order
+        verifying_key.pubkey = pubkey
+        return verifying_key
 
     def __eq__(self, other):
         """Return True if the points are identical, False otherwise."""
         if isinstance(other, SigningKey):
-            return (
-                self.curve == other.curve
-                and self.verifying_key == other.verifying_key
-                and self.privkey == other.privkey
-            )
+            if self.curve != other.curve or self.privkey != other.privkey:
+                return False
+            # the public key is derived from the private key, so don't
+            # calculate it just for comparison, but a key loaded with
+            # trust_public_key may carry a different one, so compare
+            # them when both are already known
+            if (
+                self.__verifying_key is not None
+                and other.__verifying_key is not None
+            ):
+                return self.__verifying_key == other.__verifying_key
+            return True
         return NotImplemented
 
     def __ne__(self, other):
         """Return False if the points are identical, True otherwise."""
         return not self == other
 
+    def __hash__(self):
+        """Return hash of the private key encoding."""
+        # don't use the public key, it may not have been calculated yet
+        return hash(bytes(self.to_string()))
+
+    def __reduce__(self):
+        """
+        Return compact representation of the key for pickling.
+
+        Only the curve, hash function, encoding of the private key and
+        the verifying key (if it was calculated already) are pickled.
+        """
+        return (
+            self.__class__,
+            (True,),
+            (
+                self.curve,
+                self.default_hashfunc,
+                bytes(self.to_string()),
+                self.__verifying_key,
+            ),
+        )
+
+    def __setstate__(self, state):
+        self.__nonce_pool = None
+        self.__nonce_generator = None
+        self.__encodings_state = None
+        self.__encodings = None
+        if isinstance(state, dict):
+            # objects pickled by old versions
+            self.verifying_key = None
+            for name, value in state.items():
+                setattr(self, name, value)
+            return
+        curve, self.default_hashfunc, string, verifying_key = state
+        self.curve = curve
+        self.baselen = curve.baselen
+        if isinstance(curve.curve, CurveEdTw):
+            self.privkey = eddsa.PrivateKey(curve.generator, string)
+        else:
+            self.privkey = ecdsa.Private_key(
+                None, string_to_number(string), curve.generator
+            )
+            self.privkey.order = curve.order
+        self.verifying_key = verifying_key
+
     @classmethod
     def _twisted_edwards_keygen(cls, curve, entropy):
         """Generate a private key on a Twisted Edwards curve."""
@@ -774,18 +1417,12 @@ class SigningKey(object):
             entropy = os.urandom
         random = entropy(curve.baselen)
         private_key = eddsa.PrivateKey(curve.generator, random)
-        public_key = private_key.public_key()
-
-        verifying_key = VerifyingKey.from_string(
-            public_key.public_key(), curve
-        )
 
         self = cls(_error__please_use_generate=True)
         self.curve = curve
         self.default_hashfunc = None
         self.baselen = curve.baselen
         self.privkey = private_key
-        self.verifying_key = verifying_key
         return self
 
     @classmethod
@@ -818,6 +1455,61 @@ class SigningKey(object):
             return cls._twisted_edwards_keygen(curve, entropy)
         return cls._weierstrass_keygen(curve, entropy, hashfunc)
 
+    @classmethod
+    def generate_many(cls, curve, count, entropy=None, hashfunc=sha1):
+        """
+        Generate many random private keys.
+
+        Faster than calling :func:`~SigningKey.generate` `count` times: the
+        entropy for all keys is read at once and, for Weierstrass curves,
+        the public keys are calculated together, with just one modular
+        inversion to normalise all of them. For Edwards curves the public
+        keys are calculated on first use, like with
+        :func:`~SigningKey.generate`.
+
+        To derive reproducible keys from a seed, use a deterministic entropy
+        source, like :class:`~ecdsa.util.CounterKDF`.
+
+        :param curve: The curve on which the points need to reside
+        :type curve: ~ecdsa.curves.Curve
+        :param int count: number of keys to generate
+        :param entropy: Source of randomness for generating the private keys,
+            should provide cryptographically secure random numbers if the keys
+            need to be secure. Uses os.urandom() by default.
+        :type entropy: callable
+        :param hashfunc: The default hash function that will be used for
+            signing, needs to implement the same interface
+            as hashlib.sha1
+        :type hashfunc: callable
+
+        :return: Initialised SigningKey objects
+        :rtype: list(SigningKey)
+        """
+        if isinstance(curve.curve, CurveEdTw):
+            if not entropy:
+                entropy = os.urandom
+            baselen = curve.baselen
+            random = entropy(baselen * count)
+            return [
+                cls.from_string(random[i : i + baselen], curve)
+                for i in range(0, baselen * count, baselen)
+            ]
+        secexps = randrange_many(curve.order, count, entropy)
+        generator = curve.generator
+        points = [generator * i for i in secexps]
+        if isinstance(generator, PointJacobi):
+            PointJacobi.scale_many(points)
+        ret = []
+        for secexp, point in zip(secexps, points):
+            self = cls.from_secret_exponent(secexp, curve, hashfunc)
+            # the points were calculated from the secret exponents, there's
+            # no need to check if they're on the curve
+            self.privkey.public_key = ecdsa.Public_key(
+                generator, point, verify=False
+            )
+            ret.append(self)
+        return ret
+
     @classmethod
     def from_secret_exponent(cls, secexp, curve=NIST192p, hashfunc=sha1):
         """
@@ -826,6 +1518,10 @@ class SigningKey(object):
         Note: it's a low level method, it's recommended to use the
         :func:`~SigningKey.generate` method to create private keys.
 
+        The public key is not calculated by this method, it's derived from
+        the secret multiplier on first use of the
+        :attr:`~SigningKey.verifying_key`.
+
         :param int secexp: secret multiplier (the actual private key in ECDSA).
             Needs to be an integer between 1 and the curve order.
         :param curve: The curve on which the point needs to reside
@@ -837,8 +1533,10 @@ class SigningKey(object):
 
         :raises MalformedPointError: when the provided secexp is too large
             or too small for the curve selected
-        :raises RuntimeError: if the generation of public key from private
-            key failed
+        :raises RuntimeError: on first use of the returned key's
+            :attr:`~SigningKey.verifying_key` (not by this method, as the
+            public key is calculated lazily), if the generation of public
+            key from private key failed
 
         :return: Initialised SigningKey object
         :rtype: SigningKey
@@ -858,14 +1556,7 @@ class SigningKey(object):
                 "Invalid value for secexp, expected integer "
                 "between 1 and {0}".format(n)
             )
-        pubkey_point = curve.generator * secexp
-        if hasattr(pubkey_point, "scale"):
-            pubkey_point = pubkey_point.scale()
-        self.verifying_key = VerifyingKey.from_public_point(
-            pubkey_point, curve, hashfunc, False
-        )
-        pubkey = self.verifying_key.pubkey
-        self.privkey = ecdsa.Private_key(pubkey, secexp)
+        self.privkey = ecdsa.Private_key(None, secexp, curve.generator)
         self.privkey.order = n
         return self
 
@@ -889,8 +1580,10 @@ class SigningKey(object):
 
         :raises MalformedPointError: if the length of encoding doesn't match
             the provided curve or the encoded values is too large
-        :raises RuntimeError: if the generation of public key from private
-            key failed
+        :raises RuntimeError: on first use of the returned key's
+            :attr:`~SigningKey.verifying_key` (not by this method, as the
+            public key is calculated lazily), if the generation of public
+            key from private key failed
 
         :return: Initialised SigningKey object
         :rtype: SigningKey
@@ -908,15 +1601,18 @@ class SigningKey(object):
             self.default_hashfunc = None  # Ignored for EdDSA
             self.baselen = curve.baselen
             self.privkey = eddsa.PrivateKey(curve.generator, string)
-            self.verifying_key = VerifyingKey.from_string(
-                self.privkey.public_key().public_key(), curve
-            )
             return self
         secexp = string_to_number(string)
         return cls.from_secret_exponent(secexp, curve, hashfunc)
 
     @classmethod
-    def from_pem(cls, string, hashfunc=sha1, valid_curve_encodings=None):
+    def from_pem(
+        cls,
+        string,
+        hashfunc=sha1,
+        valid_curve_encodings=None,
+        trust_public_key=False,
+    ):
         """
         Initialise from key stored in :term:`PEM` format.
 
@@ -940,12 +1636,18 @@ class SigningKey(object):
             for curve parameters. By default (``None``) all are supported:
             ``named_curve`` and ``explicit``.
         :type valid_curve_encodings: :term:`set-like object`
+        :param bool trust_public_key: use the public key embedded in the
+            file instead of calculating it from the private key. The public
+            key is *not* checked to match the private key. See
+            :func:`~SigningKey.from_der` for details.
 
 
         :raises MalformedPointError: if the length of encoding doesn't match
             the provided curve or the encoded values is too large
-        :raises RuntimeError: if the generation of public key from private
-            key failed
+        :raises RuntimeError: on first use of the returned key's
+            :attr:`~SigningKey.verifying_key` (not by this method, as the
+            public key is calculated lazily), if the generation of public
+            key from private key failed
         :raises UnexpectedDER: if the encoding of the PEM file is incorrect
 
         :return: Initialised SigningKey object
@@ -965,10 +1667,17 @@ class SigningKey(object):
             der.unpem(string[private_key_index:]),
             hashfunc,
             valid_curve_encodings,
+            trust_public_key,
         )
 
     @classmethod
-    def from_der(cls, string, hashfunc=sha1, valid_curve_encodings=None):
+    def from_der(
+        cls,
+        string,
+        hashfunc=sha1,
+        valid_curve_encodings=None,
+        trust_public_key=False,
+    ):
         """
         Initialise from key stored in :term:`DER` format.
 
@@ -986,8 +1695,9 @@ class SigningKey(object):
               publicKey  [1] BIT STRING OPTIONAL
             }
 
-        `publicKey` field is ignored completely (errors, if any, in it will
-        be undetected).
+        `publicKey` field is ignored by default (errors, if any, in it will
+        be undetected), the public key is calculated from the private key.
+        With `trust_public_key` set, it's used as the public key instead.
 
         Two formats are supported for the `parameters` field: the named
         curve and the explicit encoding of curve parameters.
@@ -1018,11 +1728,27 @@ class SigningKey(object):
             ``named_curve`` and ``explicit``.
             Ignored for EdDSA.
         :type valid_curve_encodings: :term:`set-like object`
+        :param bool trust_public_key: if True, and the ECPrivateKey includes
+            the `publicKey` field, it will be used as the
+            :attr:`~SigningKey.verifying_key` instead of calculating it
+            from the private key (which requires a scalar multiplication).
+            The public point is decoded and checked to lay on the curve on
+            first use of the verifying key, but it is *not* checked to match
+            the private key: a mismatched public key is not detected, and
+            signatures created with such a key will not verify with its
+            :attr:`~SigningKey.verifying_key`. Checking it would need the
+            scalar multiplication this option avoids, so use it only with
+            files from a trusted source. Such a key compares unequal to a
+            key with the same private key once the public key of the other
+            key has been calculated.
+            Ignored for EdDSA.
 
         :raises MalformedPointError: if the length of encoding doesn't match
             the provided curve or the encoded values is too large
-        :raises RuntimeError: if the generation of public key from private
-            key failed
+        :raises RuntimeError: on first use of the returned key's
+            :attr:`~SigningKey.verifying_key` (not by this method, as the
+            public key is calculated lazily), if the generation of public
+            key from private key failed
         :raises UnexpectedDER: if the encoding of the DER file is incorrect
 
         :return: Initialised SigningKey object
@@ -1128,24 +1854,35 @@ class SigningKey(object):
                 )
             curve = Curve.from_der(curve_oid_str, valid_curve_encodings)
 
-        # we don't actually care about the following fields
-        #
-        # tag, pubkey_bitstring, s = der.remove_constructed(s)
-        # if tag != 1:
-        #     raise der.UnexpectedDER("expected tag 1 in DER privkey, got %d"
-        #                             % tag)
-        # pubkey_str = der.remove_bitstring(pubkey_bitstring, 0)
-        # if empty != "":
-        #     raise der.UnexpectedDER("trailing junk after DER privkey "
-        #                             "pubkeystr: %s"
-        #                             % binascii.hexlify(empty))
+        # the public key is interesting only if we will use it, skip the
+        # parameters field (in PKCS#8 files) if present
+        pubkey_str = None
+        while trust_public_key and s:
+            tag, value, s = der.remove_constructed(s)
+            if tag == 1:
+                pubkey_str, empty = der.remove_bitstring(value, 0)
+                if empty:
+                    raise der.UnexpectedDER(
+                        "trailing junk after DER privkey pubkeystr: %s"
+                        % binascii.hexlify(empty)
+                    )
+                break
 
         # our from_string method likes fixed-length privkey strings
         if len(privkey_str) < curve.baselen:
             privkey_str = (
                 b("\x00") * (curve.baselen - len(privkey_str)) + privkey_str
             )
-        return cls.from_string(privkey_str, curve, hashfunc)
+        self = cls.from_string(privkey_str, curve, hashfunc)
+        if pubkey_str is not None:
+            self.verifying_key = VerifyingKey.from_string(
+                pubkey_str,
+                curve,
+                hashfunc,
+                valid_encodings=("uncompressed", "compressed", "hybrid"),
+                lazy=True,
+            )
+        return self
 
     def to_string(self):
         """
@@ -1240,14 +1977,38 @@ class SigningKey(object):
         :return: DER encoded private key
         :rtype: bytes
         """
-        # SEQ([int(1), octetstring(privkey),cont[0], oid(secp224r1),
-        #      cont[1],bitstring])
         if point_encoding == "raw":
             raise ValueError("raw encoding not allowed in DER")
         assert format in ("ssleay", "pkcs8")
+        if isinstance(self.curve.curve, CurveEdTw) and format != "pkcs8":
+            raise ValueError("Only PKCS#8 format supported for EdDSA keys")
+
+        # the encoding is memoised as long as the keys are not replaced,
+        # the EdDSA encoding doesn't include the public key, so don't
+        # calculate it
+        if isinstance(self.curve.curve, CurveEdTw):
+            verifying_key = None
+        else:
+            verifying_key = self.verifying_key
+        state = (self.curve, self.privkey, verifying_key)
+        old_state = self.__encodings_state
+        if old_state is None or any(
+            i is not j for i, j in zip(state, old_state)
+        ):
+            self.__encodings_state = state
+            self.__encodings = {}
+        key = (point_encoding, format, curve_parameters_encoding)
+        ret = self.__encodings.get(key)
+        if ret is None:
+            ret = self.__encode_der(*key)
+            self.__encodings[key] = ret
+        return ret
+
+    def __encode_der(self, point_encoding, format, curve_parameters_encoding):
+        """Convert the private key to the DER format, without caching."""
+        # SEQ([int(1), octetstring(privkey),cont[0], oid(secp224r1),
+        #      cont[1],bitstring])
         if isinstance(self.curve.curve, CurveEdTw):
-            if format != "pkcs8":
-                raise ValueError("Only PKCS#8 format supported for EdDSA keys")
             return self._encode_eddsa()
         encoded_vk = self.get_verifying_key().to_string(point_encoding)
         priv_key_elems = [
@@ -1286,6 +2047,8 @@ class SigningKey(object):
         Return the VerifyingKey associated with this private key.
 
         Equivalent to reading the `verifying_key` field of an instance.
+        The public key is calculated on first call, subsequent calls
+        return the same object.
 
         :return: a public key that can be used to verify the signatures made
             with this SigningKey
@@ -1404,8 +2167,7 @@ class SigningKey(object):
         """
         if isinstance(self.curve.curve, CurveEdTw):
             raise ValueError("Method unsupported for Edwards curves")
-        secexp = self.privkey.secret_multiplier
-        hashfunc = hashfunc or self.default_hashfunc
+        nonces = self.__nonces(hashfunc or self.default_hashfunc)
         digest = normalise_bytes(digest)
         extra_entropy = normalise_bytes(extra_entropy)
 
@@ -1414,13 +2176,8 @@ class SigningKey(object):
 
         retry_gen = 0
         while True:
-            k = rfc6979.generate_k(
-                self.curve.generator.order(),
-                secexp,
-                hashfunc,
-                digest,
-                retry_gen=retry_gen,
-                extra_entropy=extra_entropy,
+            k = nonces.generate_k(
+                digest, retry_gen=retry_gen, extra_entropy=extra_entropy
             )
             try:
                 r, s, order = self.sign_digest(
@@ -1435,6 +2192,69 @@ class SigningKey(object):
 
         return sigencode(r, s, order)
 
+    def sign_digests_deterministic(
+        self,
+        digests,
+        hashfunc=None,
+        sigencode=sigencode_string,
+        extra_entropy=b"",
+        allow_truncate=False,
+    ):
+        """
+        Create signatures for many digests using the deterministic RFC6979
+        algorithm.
+
+        Returns the same signatures as calling
+        :func:`~SigningKey.sign_digest_deterministic` for every digest, but
+        is faster, as the points used for the "r" values are normalised
+        and the nonces are inverted with just one modular inversion each.
+
+        :param digests: hashes of data that will be signed
+        :type digests: iterable of :term:`bytes-like object`
+        :param hashfunc: hash function to use for computing the random "k"
+            values from RFC6979 process,
+            if unspecified, the default hash function selected during
+            object initialisation will be used (see
+            :attr:`.VerifyingKey.default_hashfunc`).
+        :type hashfunc: callable
+        :param sigencode: function used to encode the signatures, see
+            :func:`~SigningKey.sign_digest_deterministic`
+        :type sigencode: callable
+        :param extra_entropy: additional data that will be fed into the random
+            number generator used in the RFC6979 process. Entirely optional.
+        :type extra_entropy: :term:`bytes-like object`
+        :param bool allow_truncate: if True, the provided digests can have
+            bigger bit-size than the order of the curve, the extra bits (at
+            the end of the digest) will be truncated.
+
+        :raises ValueError: if used with an Edwards curve key
+
+        :return: encoded signatures, in the order of the digests
+        :rtype: list of bytes or sigencode function dependent type
+        """
+        if isinstance(self.curve.curve, CurveEdTw):
+            raise ValueError("Method unsupported for Edwards curves")
+        order = self.privkey.order
+        nonces = self.__nonces(hashfunc or self.default_hashfunc)
+        digests = [normalise_bytes(i) for i in digests]
+        extra_entropy = normalise_bytes(extra_entropy)
+
+        def nonce(i, retry_gen):
+            return nonces.generate_k(
+                digests[i], retry_gen=retry_gen, extra_entropy=extra_entropy
+            )
+
+        return [
+            sigencode(r, s, order)
+            for r, s in self.__sign_numbers(
+                [
+                    _truncate_and_convert_digest(i, self.curve, allow_truncate)
+                    for i in digests
+                ],
+                nonce,
+            )
+        ]
+
     def sign(
         self,
         data,
@@ -1460,7 +2280,8 @@ class SigningKey(object):
         :param data: data that will be hashed for signing
         :type data: :term:`bytes-like object`
         :param callable entropy: randomness source, :func:`os.urandom` by
-            default. Ignored with EdDSA.
+            default. If unset (together with ``k``), nonces from
+            :attr:`nonce_pool` are used first. Ignored with EdDSA.
         :param hashfunc: hash function to use for hashing the provided
             ``data``.
             If unspecified the default hash function selected during
@@ -1517,6 +2338,118 @@ class SigningKey(object):
         h = hashfunc(data).digest()
         return self.sign_digest(h, entropy, sigencode, k, allow_truncate)
 
+    def sign_many(
+        self,
+        messages,
+        entropy=None,
+        hashfunc=None,
+        sigencode=sigencode_string,
+        allow_truncate=True,
+    ):
+        """
+        Create signatures over many messages.
+
+        Returns the same kind of signatures as :func:`~SigningKey.sign`:
+        deterministic EdDSA signatures for Edwards curves and probabilistic
+        ECDSA signatures (see :func:`~SigningKey.sign_digests`) for
+        Weierstrass curves. It's faster than signing the messages one by
+        one, as the points used in all the signatures are normalised
+        with just one modular inversion.
+
+        :param messages: data that will be signed
+        :type messages: iterable of :term:`bytes-like object`
+        :param callable entropy: randomness source, :func:`os.urandom` by
+            default. Ignored with EdDSA.
+        :param hashfunc: hash function to use for hashing the messages,
+            see :func:`~SigningKey.sign`. Ignored for EdDSA.
+        :type hashfunc: callable
+        :param sigencode: function used to encode the signatures, see
+            :func:`~SigningKey.sign`. Ignored for EdDSA.
+        :type sigencode: callable
+        :param bool allow_truncate: if ``True``, the digests of the messages
+            can have bigger bit-size than the order of the curve. True by
+            default. Ignored for EdDSA.
+
+        :return: encoded signatures, in the order of the messages
+        :rtype: list of bytes or sigencode function dependent type
+        """
+        messages = [normalise_bytes(i) for i in messages]
+        if isinstance(self.curve.curve, CurveEdTw):
+            return self.privkey.sign_many(messages)
+        hashfunc = hashfunc or self.default_hashfunc
+        return self.sign_digests(
+            [hashfunc(i).digest() for i in messages],
+            entropy,
+            sigencode,
+            allow_truncate,
+        )
+
+    def signer(
+        self,
+        hashfunc=None,
+        sigencode=sigencode_string,
+        deterministic=True,
+        entropy=None,
+        extra_entropy=b"",
+        allow_truncate=True,
+    ):
+        """
+        Create an object for signing data passed in chunks.
+
+        Like :func:`~SigningKey.sign_deterministic` (or
+        :func:`~SigningKey.sign` with `deterministic` set to False), but
+        the data is hashed as it's passed to :func:`Signer.update`, so it
+        doesn't need to be kept in memory. Not supported with EdDSA, as pure
+        EdDSA needs to hash the whole message more than once.
+
+        :param hashfunc: hash function to use for hashing the data, the
+            default hash function of the key by default
+        :type hashfunc: callable
+        :param sigencode: function used to encode the signature, see
+            :func:`~SigningKey.sign`
+        :type sigencode: callable
+        :param bool deterministic: if True, use the deterministic RFC6979
+            algorithm, otherwise the probabilistic ECDSA algorithm
+        :param callable entropy: randomness source for the probabilistic
+            algorithm, :func:`os.urandom` by default
+        :param extra_entropy: additional data for the RFC6979 process,
+            see :func:`~SigningKey.sign_deterministic`
+        :type extra_entropy: :term:`bytes-like object`
+        :param bool allow_truncate: if ``True``, the digest can have bigger
+            bit-size than the order of the curve. True by default.
+
+        :raises ValueError: if used with an Edwards curve key
+
+        :return: object for passing the data to sign
+        :rtype: Signer
+        """
+        if isinstance(self.curve.curve, CurveEdTw):
+            raise ValueError("Method unsupported for Edwards curves")
+        hashfunc = hashfunc or self.default_hashfunc
+
+        if deterministic:
+
+            def finalize(digest):
+                return self.sign_digest_deterministic(
+                    digest,
+                    hashfunc=hashfunc,
+                    sigencode=sigencode,
+                    extra_entropy=extra_entropy,
+                    allow_truncate=allow_truncate,
+                )
+
+        else:
+
+            def finalize(digest):
+                return self.sign_digest(
+                    digest,
+                    entropy,
+                    sigencode,
+                    allow_truncate=allow_truncate,
+                )
+
+        return Signer(hashfunc(), finalize)
+
     def sign_digest(
         self,
         digest,
@@ -1539,7 +2472,9 @@ class SigningKey(object):
 
         :param digest: hash value that will be signed
         :type digest: :term:`bytes-like object`
-        :param callable entropy: randomness source, os.urandom by default
+        :param callable entropy: randomness source, os.urandom by default.
+            If unset (together with ``k``), nonces from :attr:`nonce_pool`
+            are used first.
         :param sigencode: function used to encode the signature.
             The function needs to accept three parameters: the two integers
             that are the signature and the order of the curve over which the
@@ -1575,6 +2510,79 @@ class SigningKey(object):
         r, s = self.sign_number(number, entropy, k)
         return sigencode(r, s, self.privkey.order)
 
+    def sign_digests(
+        self,
+        digests,
+        entropy=None,
+        sigencode=sigencode_string,
+        allow_truncate=False,
+    ):
+        """
+        Create signatures for many digests using the probabilistic ECDSA
+        algorithm.
+
+        Faster than calling :func:`~SigningKey.sign_digest` for every
+        digest, as the points used for the "r" values are normalised
+        and the nonces are inverted with just one modular inversion each.
+        Nonces that would create an invalid signature are replaced with new
+        ones, so it never raises :class:`RSZeroError`.
+
+        It's recommended to use the
+        :func:`~SigningKey.sign_digests_deterministic` method
+        instead of this one.
+
+        :param digests: hash values that will be signed
+        :type digests: iterable of :term:`bytes-like object`
+        :param callable entropy: randomness source, os.urandom by default
+        :param sigencode: function used to encode the signatures, see
+            :func:`~SigningKey.sign_digest`
+        :type sigencode: callable
+        :param bool allow_truncate: if True, the provided digests can have
+            bigger bit-size than the order of the curve, the extra bits (at
+            the end of the digest) will be truncated.
+
+        :raises ValueError: if used with an Edwards curve key
+
+        :return: encoded signatures, in the order of the digests
+        :rtype: list of bytes or sigencode function dependent type
+        """
+        if isinstance(self.curve.curve, CurveEdTw):
+            raise ValueError("Method unsupported for Edwards curves")
+        order = self.privkey.order
+        numbers = [
+            _truncate_and_convert_digest(
+                normalise_bytes(i), self.curve, allow_truncate
+            )
+            for i in digests
+        ]
+        return [
+            sigencode(r, s, order)
+            for r, s in self.__sign_numbers(
+                numbers, lambda i, retry: randrange(order, entropy)
+            )
+        ]
+
+    def __sign_numbers(self, numbers, nonce):
+        """
+        Sign the numbers with nonces returned by ``nonce(index, retry)``.
+
+        Signatures that came out invalid are created again, with nonces for
+        the next retry.
+        """
+        sigs = [None] * len(numbers)
+        pending = list(range(len(numbers)))
+        retry = 0
+        while pending:
+            ret = self.privkey.sign_ints_many(
+                [numbers[i] for i in pending],
+                [nonce(i, retry) for i in pending],
+            )
+            for i, sig in zip(pending, ret):
+                sigs[i] = sig
+            pending = [i for i, sig in zip(pending, ret) if sig is None]
+            retry += 1
+        return sigs
+
     def sign_number(self, number, entropy=None, k=None):
         """
         Sign an integer directly.
@@ -1585,7 +2593,9 @@ class SigningKey(object):
 
         :param int number: number to sign using the probabilistic ECDSA
             algorithm.
-        :param callable entropy: entropy source, os.urandom by default
+        :param callable entropy: entropy source, os.urandom by default.
+            If unset (together with ``k``), nonces from :attr:`nonce_pool`
+            are used first.
         :param int k: pre-selected nonce for signature operation. If unset
             it will be selected at random using the entropy source.
 
@@ -1602,6 +2612,11 @@ class SigningKey(object):
             raise ValueError("Method unsupported for Edwards curves")
         order = self.privkey.order
 
+        if k is None and entropy is None and self.__nonce_pool is not None:
+            sig = self.__sign_with_pool(number)
+            if sig is not None:
+                return sig
+
         if k is not None:
             _k = k
         else:
@@ -1610,3 +2625,158 @@ class SigningKey(object):
         assert 1 <= _k < order
         sig = self.privkey.sign(number, _k)
         return sig.r, sig.s
+
+    def sign_ints(self, e, entropy=None):
+        """
+        Sign a digest given as integer, return the signature as integers.
+
+        This is a low level method for creating many signatures in a tight
+        loop, it uses the probabilistic ECDSA algorithm with nonce selected
+        using the entropy source (and selects a new one in the unlikely
+        event that it creates an invalid signature).
+
+        :param int e: the digest of the data converted to an integer (and
+            truncated to the bit size of the curve order if necessary)
+        :param callable entropy: entropy source, os.urandom by default.
+            If unset, nonces from :attr:`nonce_pool` are used first.
+
+        :raises ValueError: if used with an Edwards curve key
+
+        :return: the "r" and "s" parameters of the signature
+        :rtype: tuple of ints
+        """
+        if isinstance(self.curve.curve, CurveEdTw):
+            raise ValueError("Method unsupported for Edwards curves")
+        if entropy is None and self.__nonce_pool is not None:
+            sig = self.__sign_with_pool(e)
+            if sig is not None:
+                return sig
+        privkey = self.privkey
+        order = privkey.order
+        while True:
+            try:
+                return privkey.sign_ints(e, randrange(order, entropy))
+            except RSZeroError:
+                pass
+
+    def tweak_add(self, t):
+        """
+        Derive the private key with the secret exponent ``d + t``.
+
+        The public key of the returned key is equal to the one returned
+        by :py:meth:`VerifyingKey.tweak_add` called with the same tweak.
+        The public key is calculated on first use.
+
+        :param int t: the tweak, it's reduced modulo the curve order
+
+        :raises ValueError: if used with an Edwards curve key or if the
+            derived secret exponent is zero
+
+        :return: the derived key, with the same default hash function
+        :rtype: SigningKey
+        """
+        return self.tweak_add_many([t])[0]
+
+    def tweak_add_many(self, tweaks):
+        """
+        Derive private keys with the secret exponents ``d + t``.
+
+        :param tweaks: the tweaks, they are reduced modulo the curve order
+        :type tweaks: iterable of ints
+
+        :raises ValueError: if used with an Edwards curve key or if any of
+            the derived secret exponents is zero
+
+        :return: the derived keys, in the order of the tweaks
+        :rtype: list(SigningKey)
+        """
+        if isinstance(self.curve.curve, CurveEdTw):
+            raise ValueError("Method unsupported for Edwards curves")
+        n = self.curve.order
+        secexp = self.privkey.secret_multiplier
+        ret = []
+        for t in tweaks:
+            child = (secexp + t) % n
+            if not child:
+                raise ValueError("Derived secret exponent is zero")
+            ret.append(
+                type(self).from_secret_exponent(
+                    child, self.curve, self.default_hashfunc
+                )
+            )
+        return ret
+
+
+class _Stream(object):
+    """Hashing of data passed in chunks, for :class:`Signer` and
+    :class:`Verifier`."""
+
+    __slots__ = ("__hash", "__finalize")
+
+    def __init__(self, hash_object, finalize):
+        self.__hash = hash_object
+        self.__finalize = finalize
+
+    def update(self, data):
+        """
+        Pass the next chunk of data.
+
+        :param data: the next chunk of the data
+        :type data: :term:`bytes-like object`
+
+        :raises ValueError: if called after :func:`finalize`
+        """
+        if self.__hash is None:
+            raise ValueError("Already finalized")
+        self.__hash.update(normalise_bytes(data))
+
+    def _finish(self):
+        """Return result of the finalize function for the digest."""
+        if self.__hash is None:
+            raise ValueError("Already finalized")
+        digest = self.__hash.digest()
+        self.__hash = None
+        return self.__finalize(digest)
+
+
+class Signer(_Stream):
+    """
+    Creates a signature over data passed in chunks.
+
+    Returned by :func:`SigningKey.signer`.
+    """
+
+    __slots__ = ()
+
+    def finalize(self):
+        """
+        Create the signature over all data passed to :func:`update`.
+
+        :raises ValueError: if called more than once
+
+        :return: encoded signature
+        :rtype: bytes or sigencode function dependent type
+        """
+        return self._finish()
+
+
+class Verifier(_Stream):
+    """
+    Verifies a signature over data passed in chunks.
+
+    Returned by :func:`VerifyingKey.verifier`.
+    """
+
+    __slots__ = ()
+
+    def finalize(self):
+        """
+        Verify the signature over all data passed to :func:`update`.
+
+        :raises BadSignatureError: if the signature is invalid or malformed
+        :raises ValueError: if called more than once
+
+        :return: True if the verification was successful
+        :rtype: bool
+        """
+        return self._finish()
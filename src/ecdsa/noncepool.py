@@ -0,0 +1,260 @@
+"""
+Pools of precomputed nonces for the probabilistic ECDSA.
+
+The expensive part of creating an ECDSA signature, the calculation of
+``k*G`` and of the inverse of the nonce ``k``, doesn't depend on the
+signed message or on the private key. A :class:`NoncePool` computes those
+pairs of "r" values and inverted nonces ahead of time, so that creating a
+signature with a :class:`~ecdsa.keys.SigningKey` that uses the pool needs
+just two modular multiplications.
+
+Example:
+
+.. code-block:: python
+
+    from ecdsa import SigningKey, NIST256p
+    from ecdsa.noncepool import NoncePool
+
+    sk = SigningKey.generate(NIST256p)
+    sk.nonce_pool = NoncePool(NIST256p, size=256)
+    signature = sk.sign(b"message")
+
+Every pair is removed from the pool when it's taken, so it's used for
+just one signature. When the process forks, the pool in the child process
+is emptied (and refilled) so that the parent and the child don't use the
+same nonces.
+"""
+
+import os
+import threading
+import weakref
+from collections import deque
+
+from .ecdsa import nonce_pairs
+from .ellipticcurve import CurveEdTw
+from .util import randrange_many
+
+__all__ = ["NoncePool"]
+
+
+def _notify(lock, ref):
+    """Wake up the background thread of a pool that was garbage collected."""
+    with lock:
+        lock.notify()
+
+
+def _run(ref, lock):
+    """
+    Keep the pool filled, until it's closed or garbage collected.
+
+    The thread holds just a weak reference to the pool while waiting, so
+    that a pool that wasn't closed can still be garbage collected.
+    """
+    while True:
+        with lock:
+            while True:
+                pool = ref()
+                if pool is None or pool._closed or lock is not pool._lock:
+                    return
+                if len(pool._pairs) <= pool.low_water:
+                    break
+                pool = None
+                lock.wait()
+            pool._refills += 1
+        while pool._add(pool._compute(pool._batch_size)):
+            if pool._closed or lock is not pool._lock:
+                return
+        pool = None
+
+
+class NoncePool(object):
+    """
+    Thread-safe pool of precomputed ("r", inverse of nonce) pairs for
+    signing with ECDSA over a single curve.
+
+    With `background` set, a daemon thread keeps the pool filled: it starts
+    computing new pairs when the number of pairs drops to `low_water`, and
+    stops when the pool has `size` pairs.
+    When the pool is empty, signatures are created the usual way.
+
+    :ivar `~ecdsa.curves.Curve` curve: the curve of the nonces
+    :ivar int size: the maximum number of pairs in the pool
+    :ivar int low_water: the number of pairs at which refilling starts
+    """
+
+    def __init__(
+        self,
+        curve,
+        size=64,
+        low_water=None,
+        entropy=None,
+        background=True,
+        batch_size=16,
+    ):
+        """
+        Create the pool.
+
+        :param curve: the curve of the keys that will use the pool
+        :type curve: ~ecdsa.curves.Curve
+        :param int size: the maximum number of pairs in the pool
+        :param int low_water: the number of pairs at which the background
+            thread starts filling the pool, half of size by default
+        :param callable entropy: randomness source, os.urandom by default.
+            It must not return the same data in the parent and child
+            processes after fork.
+        :param bool background: if True, start the thread that fills the
+            pool, otherwise the pool needs to be filled with :meth:`fill`
+        :param int batch_size: number of pairs computed together (with just
+            one modular inversion) by the background thread
+
+        :raises ValueError: if the curve is an Edwards curve or the sizes are
+            invalid
+        """
+        if isinstance(curve.curve, CurveEdTw):
+            raise ValueError("Nonce pools are unsupported for Edwards curves")
+        if size < 1 or batch_size < 1:
+            raise ValueError("size and batch_size must be positive")
+        if low_water is None:
+            low_water = size // 2
+        if not 0 <= low_water < size:
+            raise ValueError("low_water must be between 0 and size - 1")
+        self.curve = curve
+        self.size = size
+        self.low_water = low_water
+        self._entropy = entropy
+        self._batch_size = batch_size
+        self._background = background
+        self._closed = False
+        self._fork_lock = threading.Lock()
+        self._reset()
+        if background:
+            self._start()
+
+    def _reset(self):
+        """Start with an empty pool in the current process."""
+        self._pid = os.getpid()
+        self._lock = threading.Condition()
+        self._pairs = deque()
+        self._thread = None
+        self._generated = 0
+        self._taken = 0
+        self._misses = 0
+        self._refills = 0
+
+    def _start(self):
+        """Start the background thread."""
+        lock = self._lock
+        ref = weakref.ref(self, lambda ref: _notify(lock, ref))
+        thread = threading.Thread(target=_run, args=(ref, lock))
+        thread.daemon = True
+        self._thread = thread
+        thread.start()
+
+    def _check_fork(self):
+        """Drop the pairs inherited from the parent process."""
+        if self._pid == os.getpid():
+            return
+        # the fork lock is never taken in the process that created (or
+        # reset) the pool, so it can't be inherited in the locked state
+        with self._fork_lock:
+            if self._pid != os.getpid():
+                # the pairs were (or will be) used by the parent, and the
+                # lock may have been held by a thread that doesn't exist
+                # any more
+                self._reset()
+                if self._background and not self._closed:
+                    self._start()
+
+    def _compute(self, count):
+        """Compute `count` new pairs, without holding the lock."""
+        ks = randrange_many(self.curve.order, count, self._entropy)
+        return [i for i in nonce_pairs(self.curve.generator, ks) if i]
+
+    def _add(self, pairs):
+        """Add pairs to the pool, return False if the pool is full."""
+        with self._lock:
+            if self._closed:
+                return False
+            free = self.size - len(self._pairs)
+            self._pairs.extend(pairs[:free])
+            self._generated += min(len(pairs), free)
+            return len(self._pairs) < self.size
+
+    def fill(self, count=None):
+        """
+        Compute pairs in the calling thread.
+
+        :param int count: the number of pairs to add, by default fill the
+            pool up to size
+
+        :return: the number of pairs in the pool
+        :rtype: int
+        """
+        self._check_fork()
+        if count is None:
+            count = self.size - len(self._pairs)
+        while count > 0:
+            pairs = self._compute(min(count, self.size))
+            count -= len(pairs)
+            if not self._add(pairs):
+                break
+        return len(self)
+
+    def take(self):
+        """
+        Remove one pair from the pool and return it.
+
+        :return: the "r" value and the inverse of the nonce, or None if the
+            pool is empty
+        :rtype: tuple(int, int)
+        """
+        self._check_fork()
+        with self._lock:
+            if not self._pairs:
+                self._misses += 1
+                pair = None
+            else:
+                pair = self._pairs.popleft()
+                self._taken += 1
+            if len(self._pairs) <= self.low_water:
+                self._lock.notify()
+        return pair
+
+    def close(self):
+        """Stop the background thread and drop all the pairs."""
+        with self._lock:
+            self._closed = True
+            self._pairs.clear()
+            self._lock.notify()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def __len__(self):
+        """Return the number of pairs in the pool."""
+        return len(self._pairs)
+
+    def stats(self):
+        """
+        Return the metrics of the pool.
+
+        The returned dictionary has the following keys: ``depth`` (number of
+        pairs in the pool), ``size``, ``low_water``, ``generated`` (number of
+        pairs added to the pool), ``taken`` (number of pairs used for
+        signatures), ``misses`` (number of signatures created without
+        a pair, because the pool was empty), ``refills`` (number of times
+        the background thread started filling the pool).
+
+        :rtype: dict
+        """
+        self._check_fork()
+        with self._lock:
+            return {
+                "depth": len(self._pairs),
+                "size": self.size,
+                "low_water": self.low_water,
+                "generated": self._generated,
+                "taken": self._taken,
+                "misses": self._misses,
+                "refills": self._refills,
+            }
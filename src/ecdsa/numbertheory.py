@@ -283,6 +283,29 @@ else:  # pragma: no branch
         return lm % m
 
 
+def inverse_mod_many(values, m):
+    """Inverses of all values mod m.
+
+    Uses Montgomery's trick to calculate all of them with a single modular
+    inversion, m needs to be a prime. Zeros are returned for values
+    congruent to zero, like in inverse_mod().
+    """
+    prefixes = []
+    acc = 1
+    for a in values:
+        prefixes.append(acc)
+        if a % m:
+            acc = acc * a % m
+    acc_inv = inverse_mod(acc, m)
+    ret = [0] * len(prefixes)
+    for i in range(len(prefixes) - 1, -1, -1):
+        a = values[i] % m
+        if a:
+            ret[i] = acc_inv * prefixes[i] % m
+            acc_inv = acc_inv * a % m
+    return ret
+
+
 try:
     gcd2 = math.gcd
 except AttributeError:
@@ -0,0 +1,822 @@
+"""
+Storage of precomputation tables for scalar multiplication.
+
+Points with the generator flag set (curve generators and public keys after
+:func:`~ecdsa.keys.VerifyingKey.precompute`) use a table of precomputed
+multiples to speed up scalar multiplication. Calculating the table is
+expensive (comparable to few hundred point doublings and as many modular
+inversions), so this module provides the means to store them and load them
+instead.
+
+Table stores are objects with two methods: ``get(point)``, that returns
+the precomputation table for the point or None if the store doesn't have
+it, and ``put(point, table)``, called after a table was calculated.
+They are consulted in the order they were added with
+:func:`add_table_store`.
+
+By default the tables for the generators of the curves in
+:data:`ecdsa.curves.curves` are loaded from files generated when the package
+was built (see :class:`PrebuiltTables`), if they are missing or don't match
+the curve parameters, the tables are calculated at run time.
+
+To load or calculate the tables before they are needed, use
+:func:`warmup`.
+"""
+
+import os
+import mmap
+import struct
+import hashlib
+import tempfile
+import threading
+from binascii import hexlify
+
+from . import ellipticcurve
+from .ellipticcurve import CurveEdTw, PointJacobi, PointEdwards
+from .curves import curves as well_known_curves
+from ._compat import bytes_to_int, int_to_bytes, byte_length, replace_file
+
+__all__ = [
+    "TABLE_FORMAT_VERSION",
+    "TableFormatError",
+    "dump_table",
+    "load_table",
+    "add_table_store",
+    "remove_table_store",
+    "PrebuiltTables",
+    "write_tables",
+    "PackedTable",
+    "pack_table",
+    "set_packed_tables",
+    "pack_tables",
+    "SharedTables",
+    "DiskTableCache",
+    "WarmupFuture",
+    "warmup",
+]
+
+
+TABLE_FORMAT_VERSION = 1
+"""Version of the binary format of tables created by :func:`dump_table`."""
+
+_MAGIC = b"ECDSATBL"
+
+# magic, version, point kind, digest of curve parameters, number of entries
+# in the table, size of single integer in the table
+_HEADER = struct.Struct(">8sB1s32sII")
+
+_CHECKSUM_LEN = hashlib.sha256().digest_size
+
+if ellipticcurve.GMPY:  # pragma: no branch
+    _convert = ellipticcurve.mpz
+else:  # pragma: no branch
+    _convert = int
+
+
+class TableFormatError(ValueError):
+    """Raised when the table is corrupted or doesn't match the point."""
+
+    pass
+
+
+def _point_params(point):
+    """Return the kind of point and its curve parameters as integers."""
+    curve = point.curve()
+    prime = curve.p()
+    if isinstance(curve, CurveEdTw):
+        return b"E", [prime, curve.a() % prime, curve.d() % prime]
+    return b"J", [prime, curve.a() % prime, curve.b() % prime]
+
+
+def _params_digest(point):
+    """Return hash of the curve parameters, point coordinates and order."""
+    kind, params = _point_params(point)
+    params += [point.x(), point.y(), point.order()]
+    return hashlib.sha256(
+        kind + b",".join(str(int(i)).encode("ascii") for i in params)
+    ).digest()
+
+
+def _entry_len(kind):
+    """Return the number of integers in single table entry."""
+    return 3 if kind == b"E" else 2
+
+
+def dump_table(point, table):
+    """
+    Serialise the precomputation table of a point to a byte string.
+
+    The format has a header with the version of the format, a digest of the
+    curve parameters, point coordinates and order, followed by the table
+    entries encoded as fixed-width big-endian integers and a SHA-256
+    checksum of everything before it.
+
+    :param point: the point the table was calculated for
+    :type point: ~ecdsa.ellipticcurve.PointJacobi or
+        ~ecdsa.ellipticcurve.PointEdwards
+    :param list table: the precomputation table
+
+    :return: serialised table
+    :rtype: bytes
+    """
+    kind, width, body = _encode_entries(point, table)
+    data = (
+        _HEADER.pack(
+            _MAGIC,
+            TABLE_FORMAT_VERSION,
+            kind,
+            _params_digest(point),
+            len(table),
+            width,
+        )
+        + body
+    )
+    return data + hashlib.sha256(data).digest()
+
+
+def _encode_entries(point, table):
+    """
+    Encode the table entries as fixed-width big-endian integers.
+
+    :return: the kind of point, width of integers and the encoded entries
+    :rtype: tuple(bytes, int, bytes)
+    """
+    kind, params = _point_params(point)
+    width = byte_length(params[0])
+    body = b"".join(
+        int_to_bytes(value, width) for entry in table for value in entry
+    )
+    return kind, width, body
+
+
+def _check_table(point, data):
+    """
+    Check integrity of a serialised table, return its parameters.
+
+    :return: the number of entries, width of integers and the kind of point
+    :rtype: tuple(int, int, bytes)
+    """
+    if len(data) < _HEADER.size + _CHECKSUM_LEN:
+        raise TableFormatError("Truncated precomputation table")
+    header = bytes(data[: _HEADER.size])
+    magic, version, kind, digest, count, width = _HEADER.unpack(header)
+    if magic != _MAGIC:
+        raise TableFormatError("Not a precomputation table")
+    if version != TABLE_FORMAT_VERSION:
+        raise TableFormatError(
+            "Unsupported table format version: {0}".format(version)
+        )
+    body_len = count * width * _entry_len(kind)
+    if len(data) != _HEADER.size + body_len + _CHECKSUM_LEN:
+        raise TableFormatError("Invalid length of precomputation table")
+    checksum = hashlib.sha256(data[:-_CHECKSUM_LEN]).digest()
+    if checksum != bytes(data[-_CHECKSUM_LEN:]):
+        raise TableFormatError("Checksum of precomputation table mismatch")
+    if (
+        kind != _point_params(point)[0]
+        or digest != _params_digest(point)
+        or width != byte_length(point.curve().p())
+    ):
+        raise TableFormatError("Precomputation table is for a different point")
+    return count, width, kind
+
+
+class PackedTable(object):
+    """
+    Read-only view of a precomputation table stored in a buffer.
+
+    The entries are decoded from the fixed-width integers on access, so the
+    table doesn't need any memory beyond the buffer itself, at the cost of
+    slower scalar multiplication (decoding adds about half of the cost of
+    the multiplication itself).
+    """
+
+    __slots__ = ("_buffer", "_offset", "_count", "_width", "_entry_len")
+
+    def __init__(self, buffer, offset, count, width, entry_len):
+        """
+        :param buffer: the buffer with the integers (e.g. :class:`mmap.mmap`)
+        :param int offset: position of the first integer in buffer
+        :param int count: number of entries in the table
+        :param int width: size of a single integer in bytes
+        :param int entry_len: number of integers in an entry
+        """
+        self._buffer = buffer
+        self._offset = offset
+        self._count = count
+        self._width = width
+        self._entry_len = entry_len
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("table index out of range")
+        width = self._width
+        start = self._offset + index * width * self._entry_len
+        return tuple(
+            _convert(bytes_to_int(self._buffer[i : i + width], "big"))
+            for i in range(start, start + width * self._entry_len, width)
+        )
+
+    def __iter__(self):
+        buffer = self._buffer
+        width = self._width
+        entry_len = self._entry_len
+        pos = self._offset
+        for _ in range(self._count):
+            entry = []
+            for _ in range(entry_len):
+                entry.append(
+                    _convert(bytes_to_int(buffer[pos : pos + width], "big"))
+                )
+                pos += width
+            yield tuple(entry)
+
+
+def pack_table(point, table):
+    """
+    Convert a precomputation table to the compact, read-only form.
+
+    The entries are stored as fixed-width integers in a single byte string,
+    that takes less than half of the memory needed by a list of tuples.
+
+    :param point: the point the table was calculated for
+    :type point: ~ecdsa.ellipticcurve.PointJacobi or
+        ~ecdsa.ellipticcurve.PointEdwards
+    :param list table: the precomputation table
+
+    :rtype: PackedTable
+    """
+    kind, width, body = _encode_entries(point, table)
+    return PackedTable(body, 0, len(table), width, _entry_len(kind))
+
+
+def set_packed_tables(enabled=True):
+    """
+    Select the representation of newly calculated or loaded tables.
+
+    When enabled, the precomputation tables assigned to points from now on
+    are converted with :func:`pack_table`. That lowers the memory usage of
+    applications that precompute many public keys at the cost of slower
+    multiplication. Tables already assigned to points are not modified.
+
+    :param bool enabled: True to pack the tables, False to keep them as
+        lists of tuples (the default)
+    """
+    ellipticcurve._precompute_packer = pack_table if enabled else None
+
+
+def load_table(point, data):
+    """
+    Deserialise the precomputation table of a point.
+
+    :param point: the point for which the table was calculated
+    :type point: ~ecdsa.ellipticcurve.PointJacobi or
+        ~ecdsa.ellipticcurve.PointEdwards
+    :param data: table serialised with :func:`dump_table`
+    :type data: :term:`bytes-like object`
+
+    :raises TableFormatError: if the table is corrupted, uses unsupported
+        format or was calculated for a different point or curve
+
+    :return: the precomputation table
+    :rtype: list
+    """
+    count, width, kind = _check_table(point, data)
+    return list(
+        PackedTable(data, _HEADER.size, count, width, _entry_len(kind))
+    )
+
+
+def add_table_store(store, first=False):
+    """
+    Add a table store consulted for precomputation tables.
+
+    :param store: object with the ``get(point)`` and ``put(point, table)``
+        methods
+    :param bool first: if True the store will be consulted before all
+        already added stores, otherwise after them
+    """
+    if first:
+        ellipticcurve._precompute_stores.insert(0, store)
+    else:
+        ellipticcurve._precompute_stores.append(store)
+
+
+def remove_table_store(store):
+    """
+    Remove table store added with :func:`add_table_store`.
+
+    :raises ValueError: if the store wasn't added
+    """
+    ellipticcurve._precompute_stores.remove(store)
+
+
+def _curve_for_generator(point):
+    """Return the well-known curve that has point as generator, or None."""
+    for curve in well_known_curves:
+        gen = curve.generator
+        if gen is point:
+            return curve
+        if (
+            type(gen) is type(point)
+            and gen.curve() == point.curve()
+            and gen.order() == point.order()
+            and gen == point
+        ):
+            return curve
+    return None
+
+
+def _table_file_name(curve):
+    """Return the name of file with prebuilt table for the curve."""
+    return curve.name + ".tbl"
+
+
+_DEFAULT_TABLES_DIR = os.path.join(os.path.dirname(__file__), "_tables")
+
+
+class PrebuiltTables(object):
+    """
+    Table store with the tables for the generators of well-known curves.
+
+    The tables are generated by :func:`write_tables` when the package is
+    built. Files that are missing, corrupted or don't match the curve
+    parameters are ignored, so the tables are calculated at run time
+    instead.
+
+    :ivar str path: directory with the table files
+    """
+
+    def __init__(self, path=None):
+        """
+        :param str path: directory with the table files, by default the
+            one inside the package
+        """
+        self.path = path or _DEFAULT_TABLES_DIR
+
+    def get(self, point):
+        """Return the prebuilt table for point, or None."""
+        curve = _curve_for_generator(point)
+        if curve is None:
+            return None
+        try:
+            with open(
+                os.path.join(self.path, _table_file_name(curve)), "rb"
+            ) as table_file:
+                data = table_file.read()
+        except (IOError, OSError):
+            return None
+        try:
+            return load_table(point, data)
+        except TableFormatError:
+            return None
+
+    def put(self, point, table):
+        """Ignored, the prebuilt tables are read-only."""
+        pass
+
+
+def write_tables(path, curves=None):
+    """
+    Calculate and save tables for generators of the curves to a directory.
+
+    :param str path: directory to write the table files to, will be created
+        if it doesn't exist
+    :param list curves: curves for which to write the tables,
+        all well-known curves by default
+    """
+    if curves is None:
+        curves = well_known_curves
+    if not os.path.isdir(path):
+        os.makedirs(path)
+    for curve in curves:
+        gen = curve.generator
+        # use a fresh copy to force calculation of the table
+        if isinstance(gen, PointEdwards):
+            point = PointEdwards(
+                gen.curve(),
+                gen.x(),
+                gen.y(),
+                1,
+                gen.x() * gen.y() % gen.curve().p(),
+                gen.order(),
+                True,
+            )
+        else:
+            point = PointJacobi(
+                gen.curve(), gen.x(), gen.y(), 1, gen.order(), True
+            )
+        table = point._maybe_precompute()
+        with open(
+            os.path.join(path, _table_file_name(curve)), "wb"
+        ) as table_file:
+            table_file.write(dump_table(point, table))
+
+
+add_table_store(PrebuiltTables())
+
+
+_BUNDLE_MAGIC = b"ECDSATBS"
+
+# magic, version, number of tables
+_BUNDLE_HEADER = struct.Struct(">8sBI")
+
+# digest of curve parameters and point, offset and length of the table
+_BUNDLE_INDEX = struct.Struct(">32sQI")
+
+
+def pack_tables(points):
+    """
+    Serialise precomputation tables of multiple points for
+    :class:`SharedTables`.
+
+    The tables are calculated (or loaded from the table stores) if the
+    points don't have them yet.
+
+    :param points: points with the generator flag set
+    :type points: list(~ecdsa.ellipticcurve.PointJacobi or
+        ~ecdsa.ellipticcurve.PointEdwards)
+
+    :return: serialised tables
+    :rtype: bytes
+    """
+    tables = [
+        (
+            _params_digest(point),
+            dump_table(point, point._maybe_precompute(True)),
+        )
+        for point in points
+    ]
+    offset = _BUNDLE_HEADER.size + _BUNDLE_INDEX.size * len(tables)
+    index = []
+    for digest, table in tables:
+        index.append(_BUNDLE_INDEX.pack(digest, offset, len(table)))
+        offset += len(table)
+    return b"".join(
+        [_BUNDLE_HEADER.pack(_BUNDLE_MAGIC, TABLE_FORMAT_VERSION, len(tables))]
+        + index
+        + [table for _, table in tables]
+    )
+
+
+class SharedTables(object):
+    """
+    Table store that uses the tables directly from a shared buffer.
+
+    The buffer needs to contain tables serialised with :func:`pack_tables`.
+    The points use :class:`PackedTable` views of the buffer, so when the
+    buffer is a memory mapped file or :class:`multiprocessing.shared_memory`
+    block the tables are shared between processes instead of every process
+    having its own copy. Create the store before forking worker processes
+    (or open the same file in every worker) and add it with
+    ``add_table_store(store, first=True)``.
+
+    Tables that fail the integrity checks are ignored, so the points fall
+    back to other stores or calculating the table.
+
+    :ivar buffer: the buffer with the tables
+    """
+
+    def __init__(self, buffer):
+        """
+        :param buffer: buffer with tables serialised with
+            :func:`pack_tables`, e.g. :class:`mmap.mmap`, `bytes` or
+            the `buf` of :class:`multiprocessing.shared_memory.SharedMemory`
+
+        :raises TableFormatError: if the buffer doesn't have tables in
+            a supported format
+        """
+        self.buffer = buffer
+        if len(buffer) < _BUNDLE_HEADER.size:
+            raise TableFormatError("Truncated precomputation tables")
+        magic, version, count = _BUNDLE_HEADER.unpack(
+            bytes(buffer[: _BUNDLE_HEADER.size])
+        )
+        if magic != _BUNDLE_MAGIC:
+            raise TableFormatError("Not a precomputation tables file")
+        if version != TABLE_FORMAT_VERSION:
+            raise TableFormatError(
+                "Unsupported table format version: {0}".format(version)
+            )
+        index_end = _BUNDLE_HEADER.size + _BUNDLE_INDEX.size * count
+        if len(buffer) < index_end:
+            raise TableFormatError("Truncated precomputation tables")
+        self._index = {}
+        for pos in range(_BUNDLE_HEADER.size, index_end, _BUNDLE_INDEX.size):
+            digest, offset, length = _BUNDLE_INDEX.unpack(
+                bytes(buffer[pos : pos + _BUNDLE_INDEX.size])
+            )
+            self._index[digest] = (offset, length)
+
+    @classmethod
+    def from_file(cls, path):
+        """
+        Create the store from a file written with :func:`pack_tables`.
+
+        The file is memory mapped read-only, so all processes that open it
+        share the same physical memory.
+
+        :param str path: path to the file
+        :rtype: SharedTables
+        """
+        with open(path, "rb") as tables_file:
+            buffer = mmap.mmap(
+                tables_file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        return cls(buffer)
+
+    def get(self, point):
+        """Return the table for point from the buffer, or None."""
+        location = self._index.get(_params_digest(point))
+        if location is None:
+            return None
+        offset, length = location
+        if offset + length > len(self.buffer):
+            return None
+        try:
+            count, width, kind = _check_table(
+                point, self.buffer[offset : offset + length]
+            )
+        except TableFormatError:
+            return None
+        return PackedTable(
+            self.buffer,
+            offset + _HEADER.size,
+            count,
+            width,
+            _entry_len(kind),
+        )
+
+    def put(self, point, table):
+        """Ignored, the shared tables are read-only."""
+        pass
+
+
+class DiskTableCache(object):
+    """
+    Table store that saves the calculated tables to a directory.
+
+    Useful for processes that verify signatures using many precomputed
+    public keys (see :func:`~ecdsa.keys.VerifyingKey.precompute`) and
+    need to restart quickly. Enable it with ``add_table_store(cache)``.
+
+    Every table is stored in a separate file, named after the digest of
+    the curve parameters and the point coordinates, in the format used by
+    :func:`dump_table`, so it's checked for corruption when loaded.
+    Corrupted files are removed. Files are loaded only when the point is
+    first used for multiplication.
+
+    When the total size of the files exceeds `max_size`, the least recently
+    used files are removed.
+
+    The tables are not authenticated: a table planted in the directory
+    can make :func:`~ecdsa.keys.VerifyingKey.verify` accept forged
+    signatures or make signing leak the private key. Use only a directory
+    that can't be written by other users. On POSIX systems the directory
+    is created with mode 0o700, and directories owned by a different user
+    or writable by group or others are rejected.
+
+    :ivar str path: directory with the cached tables
+    :ivar int max_size: maximum total size of the files in bytes
+    :ivar bool packed: whether loaded tables are used directly from the
+        memory mapped file
+    """
+
+    def __init__(self, path, max_size=64 * 1024 * 1024, packed=False):
+        """
+        :param str path: directory for the cached tables, will be created if
+            it doesn't exist
+        :param int max_size: maximum total size of the files in bytes,
+            64MiB by default
+        :param bool packed: if True, the tables are returned as
+            :class:`PackedTable` views of memory mapped files, using less
+            memory at the cost of slower multiplication; if False, they are
+            decoded to lists of integers
+
+        :raises ValueError: if the directory is owned by a different user
+            or is writable by group or others
+        """
+        self.path = path
+        self.max_size = max_size
+        self.packed = packed
+        if not os.path.isdir(path):
+            os.makedirs(path, 0o700)
+        self._check_permissions()
+
+    def _check_permissions(self):
+        """Refuse directories that other users can write to."""
+        if not hasattr(os, "getuid"):  # pragma: no cover
+            # no POSIX permissions to check on Windows
+            return
+        stat = os.stat(self.path)
+        if stat.st_uid != os.getuid():
+            raise ValueError(
+                "Table cache directory {0} is owned by a different "
+                "user".format(self.path)
+            )
+        if stat.st_mode & 0o022:
+            raise ValueError(
+                "Table cache directory {0} is writable by group or "
+                "others".format(self.path)
+            )
+
+    def _file_name(self, point):
+        """Return path to the file with the table for point."""
+        name = hexlify(_params_digest(point)).decode("ascii") + ".tbl"
+        return os.path.join(self.path, name)
+
+    def _remove(self, file_name):
+        try:
+            os.remove(file_name)
+        except OSError:
+            pass
+
+    def get(self, point):
+        """Return the cached table for point, or None."""
+        file_name = self._file_name(point)
+        try:
+            with open(file_name, "rb") as table_file:
+                if self.packed:
+                    data = mmap.mmap(
+                        table_file.fileno(), 0, access=mmap.ACCESS_READ
+                    )
+                else:
+                    data = table_file.read()
+            # mark the file as recently used
+            os.utime(file_name, None)
+        except (IOError, OSError, ValueError):
+            return None
+        try:
+            count, width, kind = _check_table(point, data)
+        except TableFormatError:
+            self._remove(file_name)
+            return None
+        table = PackedTable(data, _HEADER.size, count, width, _entry_len(kind))
+        if self.packed:
+            return table
+        return list(table)
+
+    def put(self, point, table):
+        """Save the table for point and evict old tables if necessary."""
+        data = dump_table(point, table)
+        if len(data) > self.max_size:
+            return
+        handle, tmp_name = tempfile.mkstemp(suffix=".tmp", dir=self.path)
+        try:
+            with os.fdopen(handle, "wb") as table_file:
+                table_file.write(data)
+            replace_file(tmp_name, self._file_name(point))
+        except (IOError, OSError):
+            self._remove(tmp_name)
+            return
+        self._evict()
+
+    def _evict(self):
+        """Remove least recently used tables over the size limit."""
+        files = []
+        total = 0
+        for name in os.listdir(self.path):
+            if not name.endswith(".tbl"):
+                continue
+            file_name = os.path.join(self.path, name)
+            try:
+                stat = os.stat(file_name)
+            except OSError:
+                continue
+            files.append((stat.st_mtime, file_name, stat.st_size))
+            total += stat.st_size
+        files.sort()
+        for _, file_name, size in files:
+            if total <= self.max_size:
+                break
+            self._remove(file_name)
+            total -= size
+
+
+class WarmupFuture(object):
+    """
+    Handle for the result of :func:`warmup`.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._exception = None
+        self._count = 0
+
+    def done(self):
+        """Return True if the warm-up finished, successfully or not."""
+        return self._event.is_set()
+
+    def wait(self, timeout=None):
+        """
+        Wait for the warm-up to finish.
+
+        :param float timeout: maximum time to wait in seconds, None to wait
+            until finished
+
+        :return: True if the warm-up finished, False on timeout
+        :rtype: bool
+        """
+        self._event.wait(timeout)
+        return self.done()
+
+    def exception(self, timeout=None):
+        """
+        Return the exception that stopped the warm-up, or None.
+
+        :param float timeout: maximum time to wait in seconds, None to wait
+            until finished
+
+        :raises RuntimeError: if the warm-up didn't finish before timeout
+        """
+        if not self.wait(timeout):
+            raise RuntimeError("Warm-up not finished")
+        return self._exception
+
+    def result(self, timeout=None):
+        """
+        Return the number of points that have their tables ready.
+
+        :param float timeout: maximum time to wait in seconds, None to wait
+            until finished
+
+        :raises RuntimeError: if the warm-up didn't finish before timeout
+        :raises Exception: the exception that stopped the warm-up
+        :rtype: int
+        """
+        exception = self.exception(timeout)
+        if exception is not None:
+            raise exception
+        return self._count
+
+
+def _run_warmup(points, progress, future):
+    """Precompute tables for points, report progress, finish the future."""
+    try:
+        for point in points:
+            point._maybe_precompute(force=True)
+            ellipticcurve._precompute_deferred.pop(id(point), None)
+            future._count += 1
+            if progress:
+                progress(future._count, len(points))
+    except Exception as e:
+        future._exception = e
+    finally:
+        for point in points:
+            ellipticcurve._precompute_deferred.pop(id(point), None)
+        future._event.set()
+
+
+def warmup(curves=None, keys=(), background=True, progress=None):
+    """
+    Load or calculate precomputation tables before they are needed.
+
+    With `background` set, the tables are prepared in a daemon thread.
+    Until the table of a point is ready, scalar multiplications with
+    that point use the slower method that doesn't need the table,
+    instead of waiting for it or calculating it again.
+
+    Keys that weren't precomputed with
+    :func:`~ecdsa.keys.VerifyingKey.precompute` will be switched to use
+    precomputation (with `lazy=True`).
+
+    :param curves: curves for which to prepare the generator tables, all
+        well-known curves by default
+    :type curves: list(~ecdsa.curves.Curve)
+    :param keys: public keys for which to prepare the tables
+    :type keys: list(~ecdsa.keys.VerifyingKey)
+    :param bool background: if True, prepare the tables in a background
+        thread, otherwise prepare them before returning
+    :param progress: callable called after every prepared table with the
+        number of prepared tables and the total number of tables
+
+    :return: handle for the result of the warm-up
+    :rtype: WarmupFuture
+    """
+    if curves is None:
+        curves = well_known_curves
+    points = [curve.generator for curve in curves]
+    for key in keys:
+        if not key.pubkey.point._is_generator():
+            key.precompute(lazy=True)
+        points.append(key.pubkey.point)
+
+    future = WarmupFuture()
+    if not background:
+        _run_warmup(points, progress, future)
+        future.result()
+        return future
+
+    for point in points:
+        ellipticcurve._precompute_deferred[id(point)] = point
+    thread = threading.Thread(
+        target=_run_warmup, args=(points, progress, future)
+    )
+    thread.daemon = True
+    thread.start()
+    return future
@@ -10,18 +10,23 @@ Many thanks to Coda Hale for his implementation in Go language:
 """
 
 import hmac
-from binascii import hexlify
 from .util import number_to_string, number_to_string_crop, bit_length
-from ._compat import hmac_compat
+from ._compat import hmac_compat, bytes_to_int
 
 
 # bit_length was defined in this module previously so keep it for backwards
 # compatibility, will need to deprecate and remove it later
-__all__ = ["bit_length", "bits2int", "bits2octets", "generate_k"]
+__all__ = [
+    "bit_length",
+    "bits2int",
+    "bits2octets",
+    "generate_k",
+    "NonceGenerator",
+]
 
 
 def bits2int(data, qlen):
-    x = int(hexlify(data), 16)
+    x = bytes_to_int(data, "big")
     l = len(data) * 8
 
     if l > qlen:
@@ -39,6 +44,107 @@ def bits2octets(data, order):
     return number_to_string_crop(z2, order)
 
 
+def _mac(keyed, data):
+    """Return HMAC of data, using a copy of already keyed HMAC object."""
+    h = keyed.copy()
+    h.update(data)
+    return h.digest()
+
+
+class NonceGenerator(object):
+    """
+    Generator of the ``k`` values for a single private key and hash function.
+
+    Returns the same values as :func:`generate_k`, but the encoding of the
+    private key and the state of the HMAC in step D that doesn't depend on
+    the signed hash are calculated just once, and the HMAC objects are
+    keyed once for every key ``K``.
+
+    :ivar int order: order of the DSA generator used in the signatures
+    :ivar hash_func: the hash function used for HMAC
+    """
+
+    def __init__(self, order, secexp, hash_func):
+        """
+        Prepare the generator for the key.
+
+        :param int order: order of the DSA generator used in the signature
+        :param int secexp: secure exponent (private key) in numeric form
+        :param hash_func: reference to the same hash function used for
+            generating hash, like :py:class:`hashlib.sha1`
+        """
+        self.order = order
+        self.hash_func = hash_func
+        self.__qlen = bit_length(order)
+        self.__rolen = (self.__qlen + 7) // 8
+        holen = hash_func().digest_size
+        # Step B
+        self.__v = b"\x01" * holen
+        self.__x = hmac_compat(number_to_string(secexp, order))
+        # Step C and the start of step D
+        self.__step_d = hmac.new(b"\x00" * holen, digestmod=hash_func)
+        self.__step_d.update(self.__v + b"\x00")
+        self.__step_d.update(self.__x)
+
+    def generate_k(self, data, retry_gen=0, extra_entropy=b""):
+        """
+        Generate the ``k`` value - the nonce for DSA.
+
+        :param bytes data: hash in binary form of the signing data
+        :param int retry_gen: how many good 'k' values to skip before
+            returning
+        :param bytes extra_entropy: additional added data in binary form as
+            per section-3.6 of rfc6979
+        :rtype: int
+        """
+        order = self.order
+        hash_func = self.hash_func
+        bx = (
+            hmac_compat(bits2octets(data, order)),
+            hmac_compat(extra_entropy),
+        )
+
+        # Step D
+        k = self.__step_d.copy()
+        for i in bx:
+            k.update(i)
+        keyed = hmac.new(k.digest(), digestmod=hash_func)
+
+        # Step E
+        v = _mac(keyed, self.__v)
+
+        # Step F
+        keyed.update(v + b"\x01")
+        keyed.update(self.__x)
+        for i in bx:
+            keyed.update(i)
+        keyed = hmac.new(keyed.digest(), digestmod=hash_func)
+
+        # Step G
+        v = _mac(keyed, v)
+
+        # Step H
+        while True:
+            # Step H1
+            t = b""
+
+            # Step H2
+            while len(t) < self.__rolen:
+                v = _mac(keyed, v)
+                t += v
+
+            # Step H3
+            secret = bits2int(t, self.__qlen)
+
+            if 1 <= secret < order:
+                if retry_gen <= 0:
+                    return secret
+                retry_gen -= 1
+
+            keyed = hmac.new(_mac(keyed, v + b"\x00"), digestmod=hash_func)
+            v = _mac(keyed, v)
+
+
 # https://tools.ietf.org/html/rfc6979#section-3.2
 def generate_k(order, secexp, hash_func, data, retry_gen=0, extra_entropy=b""):
     """
@@ -54,60 +160,6 @@ def generate_k(order, secexp, hash_func, data, retry_gen=0, extra_entropy=b""):
         section-3.6 of rfc6979
     :rtype: int
     """
-
-    qlen = bit_length(order)
-    holen = hash_func().digest_size
-    rolen = (qlen + 7) // 8
-    bx = (
-        hmac_compat(number_to_string(secexp, order)),
-        hmac_compat(bits2octets(data, order)),
-        hmac_compat(extra_entropy),
+    return NonceGenerator(order, secexp, hash_func).generate_k(
+        data, retry_gen, extra_entropy
     )
-
-    # Step B
-    v = b"\x01" * holen
-
-    # Step C
-    k = b"\x00" * holen
-
-    # Step D
-
-    k = hmac.new(k, digestmod=hash_func)
-    k.update(v + b"\x00")
-    for i in bx:
-        k.update(i)
-    k = k.digest()
-
-    # Step E
-    v = hmac.new(k, v, hash_func).digest()
-
-    # Step F
-    k = hmac.new(k, digestmod=hash_func)
-    k.update(v + b"\x01")
-    for i in bx:
-        k.update(i)
-    k = k.digest()
-
-    # Step G
-    v = hmac.new(k, v, hash_func).digest()
-
-    # Step H
-    while True:
-        # Step H1
-        t = b""
-
-        # Step H2
-        while len(t) < rolen:
-            v = hmac.new(k, v, hash_func).digest()
-            t += v
-
-        # Step H3
-        secret = bits2int(t, qlen)
-
-        if 1 <= secret < order:
-            if retry_gen <= 0:
-                return secret
-            retry_gen -= 1
-
-        k = hmac.new(k, v + b"\x00", hash_func).digest()
-        v = hmac.new(k, v, hash_func).digest()
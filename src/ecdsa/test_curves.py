@@ -3,16 +3,21 @@ try:
 except ImportError:
     import unittest
 
+import sys
 import base64
+import pickle
 import pytest
 from .curves import (
     Curve,
     NIST256p,
+    SECP112r1,
     curves,
     UnknownCurveError,
     PRIME_FIELD_OID,
     curve_by_name,
+    find_curve,
 )
+from . import curves as curves_module
 from .ellipticcurve import CurveFp, PointJacobi, CurveEdTw
 from . import der
 from .util import number_to_string
@@ -359,3 +364,160 @@ def test_curve_params_encode_decode_explicit_compressed(curve):
         ret = Curve.from_der(curve.to_der("explicit", "compressed"))
 
         assert curve == ret
+
+
+@pytest.mark.parametrize("curve", curves, ids=[i.name for i in curves])
+def test_curve_hash_matches_decoded_curve(curve):
+    if isinstance(curve.curve, CurveEdTw):
+        ret = Curve.from_der(curve.to_der())
+    else:
+        ret = Curve.from_der(curve.to_der("explicit"))
+
+    assert hash(curve) == hash(ret)
+    assert {curve: True}[ret]
+
+
+def test_curves_in_a_set():
+    assert len(set(curves + curves)) == len(curves)
+
+
+@pytest.mark.parametrize("curve", curves, ids=[i.name for i in curves])
+def test_pickle_well_known_curve(curve):
+    assert pickle.loads(pickle.dumps(curve)) is curve
+
+
+def test_pickle_custom_curve():
+    curve = Curve("custom", NIST256p.curve, NIST256p.generator, None)
+
+    unpickled = pickle.loads(pickle.dumps(curve))
+
+    assert unpickled is not curve
+    assert unpickled == curve
+    assert unpickled.name == "custom"
+    assert unpickled.oid is None
+
+
+# SECP112r1 parameters with "old" name, pickled by the previous release
+OLD_CURVE_PICKLE = base64.b64decode(
+    "gAJjZWNkc2EuY3VydmVzCkN1cnZlCnEAKYFxAX1xAihYBAAAAG5hbWVxA1gDAAAA"
+    "b2xkcQRYDAAAAG9wZW5zc2xfbmFtZXEFTlgFAAAAY3VydmVxBmNlY2RzYS5lbGxp"
+    "cHRpY2N1cnZlCkN1cnZlRnAKcQcpgXEIfXEJKFgLAAAAX0N1cnZlRnBfX3BxCooP"
+    "iyCtvnaAZl7jYr8qfNsAWAsAAABfQ3VydmVGcF9fYXELig+IIK2+doBmXuNivyp8"
+    "2wBYCwAAAF9DdXJ2ZUZwX19icQyKDiIrcBGJ3u4WOQS6+J5lWAsAAABfQ3VydmVG"
+    "cF9faHENSwF1YlgJAAAAZ2VuZXJhdG9ycQ5jZWNkc2EuZWxsaXB0aWNjdXJ2ZQpQ"
+    "b2ludEphY29iaQpxDymBcRB9cREoWBMAAABfUG9pbnRKYWNvYmlfX2N1cnZlcRJo"
+    "CFgUAAAAX1BvaW50SmFjb2JpX19jb29yZHNxE4oOmPDC+VVr515amTlySAmKDwB1"
+    "9w8OPqLAJIev5ZyoAEsBh3EUWBMAAABfUG9pbnRKYWNvYmlfX29yZGVycRWKD8Vh"
+    "ZazfKHZe42K/KnzbAFgXAAAAX1BvaW50SmFjb2JpX19nZW5lcmF0b3JxFolYGAAA"
+    "AF9Qb2ludEphY29iaV9fcHJlY29tcHV0ZXEXXXEYdWJYBQAAAG9yZGVycRmKD8Vh"
+    "ZazfKHZe42K/KnzbAFgHAAAAYmFzZWxlbnEaSw5YFAAAAHZlcmlmeWluZ19rZXlf"
+    "bGVuZ3RocRtLHFgQAAAAc2lnbmF0dXJlX2xlbmd0aHEcSxxYAwAAAG9pZHEdKEsB"
+    "SwNLhEsASwZ0cR5YCwAAAGVuY29kZWRfb2lkcR9jX2NvZGVjcwplbmNvZGUKcSBY"
+    "CAAAAAYFK8KBBAAGcSFYBgAAAGxhdGluMXEihnEjUnEkdWIu"
+)
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 0), reason="pickled with the Python 3 classes"
+)
+def test_unpickle_curve_pickled_by_old_version():
+    curve = pickle.loads(OLD_CURVE_PICKLE)
+
+    assert curve.name == "old"
+    assert curve == SECP112r1
+    assert curve.to_der() == SECP112r1.to_der()
+    assert curve.to_der("explicit") == SECP112r1.to_der("explicit")
+
+
+@pytest.mark.parametrize("curve", curves, ids=[i.name for i in curves])
+def test_find_curve_by_oid(curve):
+    assert find_curve(curve.oid) is curve
+
+
+@pytest.mark.parametrize("curve", curves, ids=[i.name for i in curves])
+def test_curve_by_name_and_openssl_name(curve):
+    assert curve_by_name(curve.name) is curve
+    if curve.openssl_name:
+        assert curve_by_name(curve.openssl_name) is curve
+
+
+@pytest.mark.parametrize(
+    "curve",
+    [i for i in curves if not isinstance(i.curve, CurveEdTw)],
+    ids=[i.name for i in curves if not isinstance(i.curve, CurveEdTw)],
+)
+def test_explicit_params_return_well_known_curve(curve):
+    assert Curve.from_der(curve.to_der("explicit")) is curve
+    assert Curve.from_der(curve.to_der("explicit", "compressed")) is curve
+
+
+class TestCurveRegistry(unittest.TestCase):
+    def setUp(self):
+        curve_fp = CurveFp(23, 1, 7)
+        base_point = PointJacobi(curve_fp, 13, 3, 1, 9, generator=True)
+        self.curve = Curve("unknown", curve_fp, base_point, None)
+
+    def test_explicit_custom_curve_is_reused(self):
+        curve_a = Curve.from_der(self.curve.to_der())
+        curve_b = Curve.from_der(self.curve.to_der())
+
+        self.assertIsNot(curve_a, self.curve)
+        self.assertEqual(curve_a, self.curve)
+        self.assertIs(curve_a, curve_b)
+
+    def test_explicit_custom_curve_with_different_point_encoding(self):
+        curve_a = Curve.from_der(self.curve.to_der("explicit"))
+        curve_b = Curve.from_der(self.curve.to_der("explicit", "compressed"))
+
+        self.assertIs(curve_a, curve_b)
+
+    def test_explicit_custom_curve_generator_table_built_once(self):
+        curve_a = Curve.from_der(self.curve.to_der())
+        curve_a.generator * 3
+
+        curve_b = Curve.from_der(self.curve.to_der())
+
+        self.assertTrue(curve_b.generator._PointJacobi__precompute)
+
+    def test_explicit_curve_with_different_order_is_different(self):
+        other_fp = CurveFp(23, 1, 7, 2)
+        other = Curve(
+            "unknown",
+            other_fp,
+            PointJacobi(other_fp, 13, 3, 1, 18, generator=True),
+            None,
+        )
+
+        curve_a = Curve.from_der(self.curve.to_der())
+        curve_b = Curve.from_der(other.to_der())
+
+        self.assertIsNot(curve_a, curve_b)
+        self.assertEqual(curve_b.order, 18)
+
+    def test_explicit_curve_cache_is_bounded(self):
+        for i in range(curves_module._EXPLICIT_CURVES_LIMIT + 10):
+            curve_fp = CurveFp(23, 1, 7)
+            base_point = PointJacobi(curve_fp, 13, 3, 1, 9 + i)
+            Curve.from_der(
+                Curve("unknown", curve_fp, base_point, None).to_der()
+            )
+
+        self.assertLessEqual(
+            len(curves_module._explicit_curves),
+            curves_module._EXPLICIT_CURVES_LIMIT,
+        )
+
+    def test_added_curve_can_be_found(self):
+        curve = Curve(
+            "CustomCurve", self.curve.curve, self.curve.generator, (1, 2, 3)
+        )
+        curves.append(curve)
+        try:
+            self.assertIs(find_curve((1, 2, 3)), curve)
+            self.assertIs(curve_by_name("CustomCurve"), curve)
+            self.assertIs(Curve.from_der(curve.to_der("explicit")), curve)
+        finally:
+            curves.remove(curve)
+
+        with self.assertRaises(UnknownCurveError):
+            find_curve((1, 2, 3))
@@ -25,8 +25,10 @@ from .ecdh import (
     NoKeyError,
     NoCurveError,
 )
-from .keys import SigningKey, VerifyingKey
+from .keys import SigningKey, VerifyingKey, MalformedPointError
+from .keys import set_verifying_key_cache
 from .ellipticcurve import CurveEdTw
+from . import numbertheory
 
 
 @pytest.mark.parametrize(
@@ -439,3 +441,68 @@ def test_ecdh_with_openssl(vcurve):
 
     assert ssl_secret1 == ssl_secret2
     assert secret1 == ssl_secret1
+
+
+def test_ecdh_does_not_decompress_own_points(monkeypatch):
+    calls = []
+    sqrt = numbertheory.square_root_mod_prime
+
+    def counting_sqrt(a, p):
+        calls.append(a)
+        return sqrt(a, p)
+
+    monkeypatch.setattr(numbertheory, "square_root_mod_prime", counting_sqrt)
+    ecdh1 = ECDH(curve=NIST256p)
+    ecdh2 = ECDH(curve=NIST256p)
+    ecdh1.generate_private_key()
+    ecdh2.generate_private_key()
+    ecdh1.load_received_public_key(ecdh2.get_public_key())
+    ecdh2.load_received_public_key(ecdh1.get_public_key())
+
+    assert ecdh1.generate_sharedsecret() == ecdh2.generate_sharedsecret()
+    assert not calls
+
+    ecdh1.load_received_public_key_bytes(
+        ecdh2.get_public_key().to_string("compressed")
+    )
+
+    assert ecdh1.generate_sharedsecret() == ecdh2.generate_sharedsecret()
+    assert len(calls) == 1
+
+
+def test_load_received_public_key_bytes_with_valid_encodings():
+    ecdh1 = ECDH(curve=NIST256p)
+    ecdh2 = ECDH(curve=NIST256p)
+    ecdh2.generate_private_key()
+    pub = ecdh2.get_public_key()
+
+    ecdh1.load_received_public_key_bytes(
+        pub.to_string("compressed"), valid_encodings=["compressed"]
+    )
+
+    assert ecdh1.public_key == pub
+    assert ecdh1.public_key.default_hashfunc is not None
+    with pytest.raises(MalformedPointError):
+        ecdh1.load_received_public_key_bytes(
+            pub.to_string("uncompressed"), valid_encodings=["compressed"]
+        )
+
+
+def test_ecdh_uses_verifying_key_cache():
+    set_verifying_key_cache(8)
+    try:
+        ecdh1 = ECDH(curve=NIST256p)
+        ecdh1.generate_private_key()
+        ecdh2 = ECDH(curve=NIST256p)
+        ecdh2.generate_private_key()
+        der = ecdh2.get_public_key().to_der()
+
+        ecdh1.load_received_public_key_der(der)
+        vk = ecdh1.public_key
+        ecdh1.load_received_public_key_der(der)
+
+        assert ecdh1.public_key is vk
+        assert VerifyingKey.from_der(der) is vk
+        assert ecdh1.generate_sharedsecret_bytes()
+    finally:
+        set_verifying_key_cache(None)
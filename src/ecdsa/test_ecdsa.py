@@ -1,5 +1,7 @@
 from __future__ import print_function
 import sys
+import pickle
+import weakref
 import hypothesis.strategies as st
 from hypothesis import given, settings, note, example
 
@@ -659,3 +661,158 @@ def test_sig_verify(args):
 
 def test_int_to_string_with_zero():
     assert int_to_string(0) == b"\x00"
+
+
+def test_Private_key_with_lazy_public_key():
+    priv = Private_key(None, 12, generator_256)
+
+    assert priv._Private_key__public_key is None
+    assert priv.public_key.point == generator_256 * 12
+    assert priv.public_key is priv.public_key
+
+
+def test_Private_key_sign_without_public_key():
+    priv = Private_key(None, 12, generator_256)
+    pub = Public_key(generator_256, generator_256 * 12)
+
+    sig = priv.sign(1234, 5678)
+
+    assert priv._Private_key__public_key is None
+    assert pub.verifies(1234, sig)
+
+
+def test_Private_key_requires_public_key_or_generator():
+    with pytest.raises(ValueError):
+        Private_key(None, 12)
+
+
+def test_Private_key_equality_with_lazy_public_key():
+    priv1 = Private_key(None, 12, generator_256)
+    priv2 = Private_key(Public_key(generator_256, generator_256 * 12), 12)
+
+    assert priv1 == priv2
+    assert priv1 != Private_key(None, 13, generator_256)
+    assert priv1 != Private_key(None, 12, generator_224)
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        Signature(12, 34),
+        Public_key(generator_256, generator_256 * 12),
+        Private_key(None, 12, generator_256),
+    ],
+    ids=["Signature", "Public_key", "Private_key"],
+)
+def test_objects_use_slots(obj):
+    assert not hasattr(obj, "__dict__")
+    with pytest.raises(AttributeError):
+        obj.some_attribute = 1
+    assert weakref.ref(obj)() is obj
+
+
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_pickle_Signature(protocol):
+    sig = Signature(12, 34)
+
+    sig2 = pickle.loads(pickle.dumps(sig, protocol))
+
+    assert (sig2.r, sig2.s) == (12, 34)
+
+
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_pickle_Public_key(protocol):
+    pub = Public_key(generator_256, generator_256 * 12)
+    pub.order = generator_256.order()
+
+    pub2 = pickle.loads(pickle.dumps(pub, protocol))
+
+    assert pub2 == pub
+    assert pub2.curve == pub.curve
+    assert pub2.order == pub.order
+    assert pub2.verifies(1234, Private_key(pub, 12).sign(1234, 5678))
+
+
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_pickle_Private_key(protocol):
+    priv = Private_key(None, 12, generator_256)
+
+    priv2 = pickle.loads(pickle.dumps(priv, protocol))
+
+    assert priv2._Private_key__public_key is None
+    assert not hasattr(priv2, "order")
+    assert priv2 == priv
+
+
+def test_Public_key_setstate_with_old_dict_state():
+    pub = Public_key(generator_256, generator_256 * 12)
+    pub2 = Public_key.__new__(Public_key)
+
+    pub2.__setstate__(
+        {
+            "curve": pub.curve,
+            "generator": pub.generator,
+            "point": pub.point,
+        }
+    )
+
+    assert pub2 == pub
+    assert pub2.curve is pub.curve
+    assert not hasattr(pub2, "order")
+
+
+def test_Private_key_setstate_with_old_dict_state():
+    pub = Public_key(generator_256, generator_256 * 12)
+    priv = Private_key.__new__(Private_key)
+
+    priv.__setstate__({"public_key": pub, "secret_multiplier": 12})
+
+    assert priv == Private_key(pub, 12)
+    assert priv.public_key is pub
+
+
+def test_Signature_setstate_with_old_dict_state():
+    sig = Signature.__new__(Signature)
+
+    sig.__setstate__({"r": 12, "s": 34})
+
+    assert (sig.r, sig.s) == (12, 34)
+
+
+def test_sign_ints_and_verifies_ints():
+    pub = Public_key(generator_256, generator_256 * 12)
+    priv = Private_key(pub, 12)
+
+    r, s = priv.sign_ints(1234, 5678)
+
+    assert priv.sign(1234, 5678).r == r
+    assert priv.sign(1234, 5678).s == s
+    assert pub.verifies_ints(1234, r, s)
+    assert not pub.verifies_ints(1235, r, s)
+
+
+def test_sign_ints_many():
+    pub = Public_key(generator_256, generator_256 * 12)
+    priv = Private_key(pub, 12)
+    n = generator_256.order()
+    # the zero "s" value for the second signature
+    r = (generator_256 * 7).x() % n
+    e = (-r * 12) % n
+
+    sigs = priv.sign_ints_many([1234, e, 4321], [5678, 7, 2**200])
+
+    assert sigs[0] == priv.sign_ints(1234, 5678)
+    assert sigs[1] is None
+    assert sigs[2] == priv.sign_ints(4321, 2**200)
+
+
+def test_sign_ints_many_with_affine_generator():
+    gen = ellipticcurve.Point(
+        curve_192, generator_192.x(), generator_192.y(), generator_192.order()
+    )
+    pub = Public_key(gen, gen * 12)
+    priv = Private_key(pub, 12)
+
+    sigs = priv.sign_ints_many([1, 2], [3, 4])
+
+    assert sigs == [priv.sign_ints(1, 3), priv.sign_ints(2, 4)]
@@ -1,4 +1,5 @@
 import pickle
+import weakref
 import hashlib
 import pytest
 
@@ -183,6 +184,23 @@ def test_ed25519_test_normalisation_and_scaling():
     assert a.y() == y
 
 
+def test_ed25519_scale_many():
+    points = [generator_ed25519 * i for i in (2, 3, 4)]
+    points.append(generator_ed25519)
+    expected = [(i.x(), i.y()) for i in points]
+
+    ret = PointEdwards.scale_many(points)
+
+    assert ret is points
+    assert [(i.x(), i.y()) for i in points] == expected
+    assert all(i._PointEdwards__coords[2] == 1 for i in points)
+    assert all(
+        i._PointEdwards__coords[3] == i.x() * i.y() % curve_ed25519.p()
+        for i in points
+    )
+    assert PointEdwards.scale_many([]) == []
+
+
 def test_ed25519_add_three_times():
     a = generator_ed25519
 
@@ -336,6 +354,52 @@ def test_ed25519_pickle():
     assert pickle.loads(pickle.dumps(g)) == g
 
 
+def test_ed25519_pickle_without_precomputation_table():
+    g = generator_ed25519
+    g * 2
+    assert g._PointEdwards__precompute
+
+    data = pickle.dumps(g)
+    unpickled = pickle.loads(data)
+
+    assert len(data) < 1024
+    assert unpickled.order() == g.order()
+    assert unpickled._PointEdwards__precompute == []
+    assert unpickled * 3 == g * 3
+    assert unpickled._PointEdwards__precompute
+
+
+@pytest.mark.parametrize(
+    "generator,size",
+    [(generator_ed25519, 32), (generator_ed448, 57)],
+    ids=["Ed25519", "Ed448"],
+)
+def test_keys_pickled_by_old_versions(generator, size):
+    key = PrivateKey(generator, b"\x01" * size)
+    pub_key = key.public_key()
+    sig = key.sign(b"message")
+    # old versions didn't store the prefixes with the keys
+    old_key = PrivateKey(generator, key.private_key)
+    del old_key._PrivateKey__dom
+    del old_key._PrivateKey__r_prefix
+    old_pub_key = PublicKey(generator, pub_key.public_key())
+    del old_pub_key._PublicKey__dom
+
+    key2 = pickle.loads(pickle.dumps(old_key))
+    pub_key2 = pickle.loads(pickle.dumps(old_pub_key))
+
+    assert key2 == key
+    assert key2.sign(b"message") == sig
+    assert key2.sign_many([b"message"]) == [sig]
+    assert pub_key2 == pub_key
+    assert pub_key2.verify(b"message", sig)
+
+
+def test_point_edwards_uses_slots():
+    assert not hasattr(generator_ed25519, "__dict__")
+    assert weakref.ref(generator_ed25519)() is generator_ed25519
+
+
 def test_ed448_eq_against_different_curve():
     assert generator_ed25519 != generator_ed448
 
@@ -1081,3 +1145,19 @@ def test_vectors(generator, private_key, public_key, message, signature):
     assert gen_sig == signature
 
     assert ver_key.verify(message, signature)
+
+
+@pytest.mark.parametrize(
+    "generator,length", [(generator_ed25519, 32), (generator_ed448, 57)]
+)
+def test_sign_many(generator, length):
+    key = PrivateKey(generator, b"\x42" * length)
+    messages = [b"", b"message", bytearray(b"other message"), b"\x00" * 200]
+
+    sigs = key.sign_many(messages)
+
+    assert sigs == [key.sign(i) for i in messages]
+    pub = key.public_key()
+    for sig, msg in zip(sigs, messages):
+        assert pub.verify(msg, sig)
+    assert key.sign_many([]) == []
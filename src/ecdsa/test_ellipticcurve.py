@@ -1,3 +1,5 @@
+import pickle
+import weakref
 import pytest
 
 try:
@@ -197,3 +199,32 @@ class TestPoint(unittest.TestCase):
     def test_inequality_points_diff_types(self):
         c = CurveFp(100, -3, 100)
         self.assertNotEqual(self.g_23, c)
+
+    def test_point_uses_slots(self):
+        self.assertFalse(hasattr(self.g_23, "__dict__"))
+        self.assertIs(weakref.ref(self.g_23)(), self.g_23)
+
+    def test_pickle_point(self):
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            p = pickle.loads(pickle.dumps(self.g_23, protocol))
+            self.assertEqual(p, self.g_23)
+            self.assertEqual(p.order(), 7)
+
+    def test_pickle_infinity(self):
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assertIs(
+                pickle.loads(pickle.dumps(INFINITY, protocol)), INFINITY
+            )
+
+    def test_setstate_with_old_dict_state(self):
+        p = Point.__new__(Point)
+        p.__setstate__(
+            {
+                "_Point__curve": self.c_23,
+                "_Point__x": 13,
+                "_Point__y": 7,
+                "_Point__order": 7,
+            }
+        )
+
+        self.assertEqual(p, self.g_23)
@@ -1,4 +1,5 @@
 import pickle
+import weakref
 
 try:
     import unittest2 as unittest
@@ -553,10 +554,52 @@ class TestJacobi(unittest.TestCase):
 
         self.assertNotEqual(p_a, p_b)
 
+    def test_scale_many(self):
+        points = [generator_256 * i for i in range(2, 6)]
+        points.append(points[0].double())
+        expected = [(i.x(), i.y()) for i in points]
+
+        ret = PointJacobi.scale_many(points)
+
+        self.assertIs(ret, points)
+        for point, (x, y) in zip(points, expected):
+            self.assertEqual(point._PointJacobi__coords[2], 1)
+            self.assertEqual((point.x(), point.y()), (x, y))
+
+    def test_scale_many_with_scaled_points(self):
+        points = [PointJacobi.from_affine(generator_256)]
+
+        PointJacobi.scale_many(points)
+
+        self.assertEqual(points[0], generator_256)
+
     def test_pickle(self):
         pj = PointJacobi(curve=CurveFp(23, 1, 1, 1), x=2, y=3, z=1, order=1)
         self.assertEqual(pickle.loads(pickle.dumps(pj)), pj)
 
+    def test_pickle_without_precomputation_table(self):
+        gen = generator_256
+        gen = PointJacobi(gen.curve(), gen.x(), gen.y(), 1, gen.order(), True)
+        gen * 2
+        self.assertTrue(gen._PointJacobi__precompute)
+
+        data = pickle.dumps(gen)
+        unpickled = pickle.loads(data)
+
+        self.assertLess(len(data), 1024)
+        self.assertEqual(unpickled, gen)
+        self.assertEqual(unpickled.order(), gen.order())
+        self.assertEqual(unpickled._PointJacobi__precompute, [])
+        self.assertEqual(unpickled * 3, gen * 3)
+        self.assertTrue(unpickled._PointJacobi__precompute)
+
+    def test_point_uses_slots(self):
+        pj = PointJacobi(curve=CurveFp(23, 1, 1, 1), x=2, y=3, z=1, order=1)
+        self.assertFalse(hasattr(pj, "__dict__"))
+        with self.assertRaises(AttributeError):
+            pj.some_attribute = 1
+        self.assertIs(weakref.ref(pj)(), pj)
+
     @settings(**NO_OLD_SETTINGS)
     @pytest.mark.skipif(
         platform.python_implementation() == "PyPy",
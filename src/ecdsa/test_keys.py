@@ -9,17 +9,25 @@ except NameError:
     buffer = memoryview
 
 import os
+import pickle
+import weakref
+import gc
 import array
 import pytest
 import hashlib
 
-from .keys import VerifyingKey, SigningKey, MalformedPointError
+from .keys import VerifyingKey, SigningKey, MalformedPointError, BadDigestError
+from .keys import BadSignatureError
+from .keys import set_point_cache, set_verifying_key_cache
 from .der import (
     unpem,
     UnexpectedDER,
     encode_sequence,
     encode_oid,
     encode_bitstring,
+    encode_integer,
+    encode_octet_string,
+    encode_constructed,
 )
 from .util import (
     sigencode_string,
@@ -28,10 +36,16 @@ from .util import (
     sigdecode_string,
     sigdecode_der,
     sigdecode_strings,
+    string_to_number,
+    number_to_string,
+    PRNG,
 )
 from .curves import NIST256p, Curve, BRAINPOOLP160r1, Ed25519, Ed448
 from .ellipticcurve import Point, PointJacobi, CurveFp, INFINITY
 from .ecdsa import generator_brainpoolp160r1
+from . import numbertheory
+from . import keys
+from . import rfc6979
 
 
 class TestVerifyingKeyFromString(unittest.TestCase):
@@ -957,3 +971,1536 @@ def test_SigningKey_from_pem_pkcs8v2_EdDSA():
 
     sk = SigningKey.from_pem(pem)
     assert sk.curve == Ed25519
+
+
+class TestVerifyingKeyLazy(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.sk = SigningKey.from_secret_exponent(12345, NIST256p)
+        cls.vk = cls.sk.verifying_key
+        cls.sig = cls.sk.sign(b"message")
+
+    def test_from_string(self):
+        vk = VerifyingKey.from_string(
+            self.vk.to_string("compressed"), NIST256p, lazy=True
+        )
+
+        self.assertTrue(vk.verify(self.sig, b"message"))
+        self.assertEqual(vk, self.vk)
+
+    def test_from_string_of_subclass_uses_from_public_point(self):
+        points = []
+
+        class MyKey(VerifyingKey):
+            __slots__ = ()
+
+            @classmethod
+            def from_public_point(cls, point, *args, **kwargs):
+                points.append(point)
+                return super(MyKey, cls).from_public_point(
+                    point, *args, **kwargs
+                )
+
+        enc = self.vk.to_string("compressed")
+
+        vk = MyKey.from_string(enc, NIST256p)
+        lazy_vk = MyKey.from_string(enc, NIST256p, lazy=True)
+
+        self.assertIs(type(vk), MyKey)
+        self.assertIs(type(lazy_vk), MyKey)
+        self.assertEqual(points, [self.vk.pubkey.point])
+        self.assertEqual(vk, self.vk)
+        self.assertEqual(lazy_vk, self.vk)
+
+    def test_from_string_makes_copy_of_buffer(self):
+        enc = bytearray(self.vk.to_string())
+        vk = VerifyingKey.from_string(enc, NIST256p, lazy=True)
+        enc[:] = b"\x00" * len(enc)
+
+        self.assertEqual(vk, self.vk)
+
+    def test_from_der(self):
+        vk = VerifyingKey.from_der(self.vk.to_der(), lazy=True)
+
+        self.assertEqual(vk.curve, NIST256p)
+        self.assertTrue(vk.verify(self.sig, b"message"))
+
+    def test_from_pem(self):
+        vk = VerifyingKey.from_pem(self.vk.to_pem(), lazy=True)
+
+        self.assertEqual(vk, self.vk)
+
+    def test_malformed_point_raises_on_use(self):
+        enc = bytearray(self.vk.to_string())
+        enc[-1] ^= 1
+        vk = VerifyingKey.from_string(enc, NIST256p, lazy=True)
+
+        with self.assertRaises(MalformedPointError):
+            vk.verify(self.sig, b"message")
+
+    def test_malformed_point_raises_on_every_use(self):
+        vk = VerifyingKey.from_string(
+            b"\x04" + b"\x00" * 64, NIST256p, lazy=True
+        )
+
+        with self.assertRaises(MalformedPointError):
+            vk.to_string()
+        with self.assertRaises(MalformedPointError):
+            vk.to_string()
+
+    def test_malformed_encoding_raises_on_use(self):
+        vk = VerifyingKey.from_string(b"\x04" * 3, NIST256p, lazy=True)
+
+        with self.assertRaises(MalformedPointError):
+            vk.pubkey
+
+    def test_disallowed_encoding_raises_on_use(self):
+        vk = VerifyingKey.from_string(
+            self.vk.to_string("compressed"),
+            NIST256p,
+            valid_encodings=["uncompressed"],
+            lazy=True,
+        )
+
+        with self.assertRaises(MalformedPointError):
+            vk.verify(self.sig, b"message")
+
+    def test_ed25519(self):
+        sk = SigningKey.from_string(b"\x01" * 32, Ed25519)
+        sig = sk.sign(b"message")
+        vk = VerifyingKey.from_string(
+            sk.verifying_key.to_string(), Ed25519, lazy=True
+        )
+
+        self.assertTrue(vk.verify(sig, b"message"))
+
+    def test_ed25519_malformed_raises_malformed_point(self):
+        vk = VerifyingKey.from_string(
+            b"\x02" + b"\x00" * 31, Ed25519, lazy=True
+        )
+
+        with self.assertRaises(MalformedPointError):
+            vk.verify(b"\x00" * 64, b"message")
+
+
+def test_VerifyingKey_lazy_load_does_not_decompress(monkeypatch):
+    vk = SigningKey.from_secret_exponent(12345, NIST256p).verifying_key
+    enc = vk.to_string("compressed")
+    calls = []
+    sqrt = numbertheory.square_root_mod_prime
+
+    def counting_sqrt(a, p):
+        calls.append(a)
+        return sqrt(a, p)
+
+    monkeypatch.setattr(numbertheory, "square_root_mod_prime", counting_sqrt)
+
+    lazy_vk = VerifyingKey.from_string(enc, NIST256p, lazy=True)
+    assert not calls
+
+    assert lazy_vk == vk
+    assert len(calls) == 1
+
+
+class TestSigningKeyLazyPublicKey(unittest.TestCase):
+    def test_from_secret_exponent_does_not_calculate_public_key(self):
+        sk = SigningKey.from_secret_exponent(12345, NIST256p)
+
+        self.assertIsNone(sk._SigningKey__verifying_key)
+        self.assertIsNone(sk.privkey._Private_key__public_key)
+
+    def test_sign_does_not_calculate_public_key(self):
+        sk = SigningKey.from_secret_exponent(12345, NIST256p)
+
+        sig = sk.sign_deterministic(b"message")
+
+        self.assertIsNone(sk._SigningKey__verifying_key)
+        self.assertTrue(sk.verifying_key.verify(sig, b"message"))
+
+    def test_get_verifying_key_returns_same_object(self):
+        sk = SigningKey.from_string(b"\x01" * 32, NIST256p)
+
+        vk = sk.get_verifying_key()
+
+        self.assertIs(vk, sk.verifying_key)
+        self.assertIs(vk.pubkey, sk.privkey.public_key)
+        self.assertEqual(
+            vk.pubkey.point, NIST256p.generator * sk.privkey.secret_multiplier
+        )
+
+    def test_verifying_key_uses_default_hashfunc(self):
+        sk = SigningKey.from_secret_exponent(
+            12345, NIST256p, hashfunc=hashlib.sha256
+        )
+
+        self.assertIs(sk.verifying_key.default_hashfunc, hashlib.sha256)
+
+    def test_to_der_calculates_public_key(self):
+        sk = SigningKey.from_secret_exponent(12345, NIST256p)
+
+        sk2 = SigningKey.from_der(sk.to_der())
+
+        self.assertEqual(sk2.verifying_key, sk.verifying_key)
+
+    def test_equality_without_public_keys(self):
+        sk1 = SigningKey.from_secret_exponent(12345, NIST256p)
+        sk2 = SigningKey.from_secret_exponent(12345, NIST256p)
+        sk3 = SigningKey.from_secret_exponent(12346, NIST256p)
+
+        self.assertEqual(sk1, sk2)
+        self.assertNotEqual(sk1, sk3)
+        self.assertIsNone(sk1._SigningKey__verifying_key)
+        self.assertIsNone(sk2._SigningKey__verifying_key)
+
+    def test_equality_with_one_public_key(self):
+        sk1 = SigningKey.from_secret_exponent(12345, NIST256p)
+        sk2 = SigningKey.from_secret_exponent(12345, NIST256p)
+        sk1.get_verifying_key()
+
+        self.assertEqual(sk1, sk2)
+
+    def test_edwards_public_key_calculated_on_use(self):
+        sk = SigningKey.from_string(b"\x01" * 32, Ed25519)
+
+        self.assertIsNone(sk._SigningKey__verifying_key)
+        sig = sk.sign(b"message")
+        self.assertTrue(sk.get_verifying_key().verify(sig, b"message"))
+
+
+class TestSigningKeyTrustPublicKey(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.sk = SigningKey.from_secret_exponent(12345, NIST256p)
+        cls.vk = cls.sk.verifying_key
+
+    def _der_with_public_key(self, pub_str):
+        return encode_sequence(
+            encode_integer(1),
+            encode_octet_string(self.sk.to_string()),
+            encode_constructed(0, encode_oid(*NIST256p.oid)),
+            encode_constructed(1, encode_bitstring(pub_str, 0)),
+        )
+
+    def test_ssleay_uses_embedded_public_key(self):
+        der = self._der_with_public_key(self.vk.to_string("uncompressed"))
+
+        sk = SigningKey.from_der(der, trust_public_key=True)
+
+        self.assertIsNotNone(sk._SigningKey__verifying_key)
+        self.assertIsNotNone(sk.verifying_key._VerifyingKey__encoded_point)
+        self.assertEqual(sk.verifying_key, self.vk)
+
+    def test_pkcs8_uses_embedded_public_key(self):
+        der = self.sk.to_der(format="pkcs8")
+
+        sk = SigningKey.from_der(der, trust_public_key=True)
+
+        self.assertIsNotNone(sk._SigningKey__verifying_key)
+        self.assertEqual(sk.verifying_key, self.vk)
+
+    def test_pem_uses_embedded_public_key(self):
+        pem = self.sk.to_pem(point_encoding="compressed")
+
+        sk = SigningKey.from_pem(pem, trust_public_key=True)
+
+        self.assertIsNotNone(sk._SigningKey__verifying_key)
+        self.assertEqual(sk.verifying_key, self.vk)
+
+    def test_embedded_public_key_ignored_by_default(self):
+        der = self._der_with_public_key(self.vk.to_string("uncompressed"))
+
+        sk = SigningKey.from_der(der)
+
+        self.assertIsNone(sk._SigningKey__verifying_key)
+        self.assertEqual(sk.verifying_key, self.vk)
+
+    def test_missing_public_key(self):
+        der = encode_sequence(
+            encode_integer(1),
+            encode_octet_string(self.sk.to_string()),
+            encode_constructed(0, encode_oid(*NIST256p.oid)),
+        )
+
+        sk = SigningKey.from_der(der, trust_public_key=True)
+
+        self.assertIsNone(sk._SigningKey__verifying_key)
+        self.assertEqual(sk.verifying_key, self.vk)
+
+    def test_malformed_public_key_detected_on_use(self):
+        pub_str = bytearray(self.vk.to_string("uncompressed"))
+        pub_str[-1] ^= 0xFF
+        der = self._der_with_public_key(bytes(pub_str))
+
+        sk = SigningKey.from_der(der, trust_public_key=True)
+
+        with self.assertRaises(MalformedPointError):
+            sk.verifying_key.pubkey
+
+    def test_mismatched_public_key_is_not_detected(self):
+        other_vk = SigningKey.from_secret_exponent(
+            54321, NIST256p
+        ).verifying_key
+        der = self._der_with_public_key(other_vk.to_string("uncompressed"))
+
+        sk = SigningKey.from_der(der, trust_public_key=True)
+        sig = sk.sign(b"message")
+
+        self.assertEqual(sk.verifying_key, other_vk)
+        self.assertTrue(self.vk.verify(sig, b"message"))
+        with self.assertRaises(BadSignatureError):
+            sk.verifying_key.verify(sig, b"message")
+
+    def test_mismatched_public_key_makes_keys_unequal(self):
+        other_vk = SigningKey.from_secret_exponent(
+            54321, NIST256p
+        ).verifying_key
+        der = self._der_with_public_key(other_vk.to_string("uncompressed"))
+        sk = SigningKey.from_der(der, trust_public_key=True)
+        sk2 = SigningKey.from_secret_exponent(12345, NIST256p)
+
+        # public key of sk2 not calculated yet, so only secrets compared
+        self.assertEqual(sk, sk2)
+        sk2.verifying_key
+        self.assertNotEqual(sk, sk2)
+        self.assertNotEqual(sk2, sk)
+
+        der = self._der_with_public_key(self.vk.to_string("raw"))
+
+        sk = SigningKey.from_der(der, trust_public_key=True)
+
+        with self.assertRaises(MalformedPointError):
+            sk.verifying_key.pubkey
+
+    def test_junk_after_public_key(self):
+        der = encode_sequence(
+            encode_integer(1),
+            encode_octet_string(self.sk.to_string()),
+            encode_constructed(0, encode_oid(*NIST256p.oid)),
+            encode_constructed(
+                1,
+                encode_bitstring(self.vk.to_string("uncompressed"), 0)
+                + b"\x00",
+            ),
+        )
+
+        with self.assertRaises(UnexpectedDER):
+            SigningKey.from_der(der, trust_public_key=True)
+
+    def test_eddsa_ignores_option(self):
+        sk = SigningKey.from_string(b"\x01" * 32, Ed25519)
+
+        sk2 = SigningKey.from_der(
+            sk.to_der(format="pkcs8"), trust_public_key=True
+        )
+
+        self.assertEqual(sk2.verifying_key, sk.verifying_key)
+
+
+class TestKeyHashing(unittest.TestCase):
+    def test_equal_verifying_keys_have_equal_hashes(self):
+        sk = SigningKey.from_secret_exponent(12345, NIST256p)
+        vk1 = sk.verifying_key
+        vk2 = VerifyingKey.from_string(vk1.to_string("compressed"), NIST256p)
+        vk3 = VerifyingKey.from_public_point(
+            sk.verifying_key.pubkey.point.scale(), NIST256p
+        )
+
+        self.assertEqual(hash(vk1), hash(vk2))
+        self.assertEqual(hash(vk1), hash(vk3))
+        self.assertEqual(len(set([vk1, vk2, vk3])), 1)
+
+    def test_different_verifying_keys_in_a_set(self):
+        vks = [
+            SigningKey.from_secret_exponent(i, NIST256p).verifying_key
+            for i in range(1, 11)
+        ]
+
+        self.assertEqual(len(set(vks + vks)), 10)
+
+    def test_verifying_key_as_dict_key(self):
+        sk = SigningKey.from_secret_exponent(12345, NIST256p)
+        vk = VerifyingKey.from_der(sk.verifying_key.to_der())
+        keys = {sk.verifying_key: "key"}
+
+        self.assertEqual(keys[vk], "key")
+
+    def test_edwards_verifying_keys(self):
+        vk1 = SigningKey.from_string(b"\x01" * 32, Ed25519).verifying_key
+        vk2 = VerifyingKey.from_string(vk1.to_string(), Ed25519)
+        vk3 = SigningKey.from_string(b"\x02" * 32, Ed25519).verifying_key
+
+        self.assertEqual(hash(vk1), hash(vk2))
+        self.assertEqual(len(set([vk1, vk2, vk3])), 2)
+
+    def test_equality_uses_cached_encodings(self):
+        vk1 = SigningKey.from_secret_exponent(12345, NIST256p).verifying_key
+        vk2 = SigningKey.from_secret_exponent(12345, NIST256p).verifying_key
+        vk3 = SigningKey.from_secret_exponent(12346, NIST256p).verifying_key
+        hash(vk1)
+        hash(vk2)
+        hash(vk3)
+
+        self.assertIn("compressed", vk1._VerifyingKey__encodings)
+        self.assertEqual(vk1, vk2)
+        self.assertNotEqual(vk1, vk3)
+
+    def test_cached_encoding_reset_with_new_public_key(self):
+        vk = SigningKey.from_secret_exponent(12345, NIST256p).verifying_key
+        other = SigningKey.from_secret_exponent(12346, NIST256p).verifying_key
+        hash(vk)
+
+        vk.pubkey = other.pubkey
+
+        self.assertEqual(hash(vk), hash(other))
+        self.assertEqual(vk, other)
+
+    def test_verifying_keys_on_different_curves(self):
+        vk1 = SigningKey.from_secret_exponent(12345, NIST256p).verifying_key
+        vk2 = SigningKey.from_secret_exponent(
+            12345, BRAINPOOLP160r1
+        ).verifying_key
+
+        self.assertNotEqual(vk1, vk2)
+
+    def test_signing_keys_in_a_set(self):
+        sk1 = SigningKey.from_secret_exponent(12345, NIST256p)
+        sk2 = SigningKey.from_string(sk1.to_string(), NIST256p)
+        sk3 = SigningKey.from_secret_exponent(12346, NIST256p)
+
+        self.assertEqual(hash(sk1), hash(sk2))
+        self.assertEqual(len(set([sk1, sk2, sk3])), 2)
+        self.assertIsNone(sk1._SigningKey__verifying_key)
+
+
+class TestMemoisedEncodings(unittest.TestCase):
+    def setUp(self):
+        self.sk = SigningKey.from_secret_exponent(12345, NIST256p)
+        self.vk = self.sk.verifying_key
+
+    def test_verifying_key_encodings_are_cached(self):
+        for encoding in ("raw", "uncompressed", "compressed", "hybrid"):
+            self.assertIs(
+                self.vk.to_string(encoding), self.vk.to_string(encoding)
+            )
+        self.assertIs(self.vk.to_der(), self.vk.to_der())
+        self.assertIs(
+            self.vk.to_der("compressed", "explicit"),
+            self.vk.to_der("compressed", "explicit"),
+        )
+        self.assertIs(self.vk.to_pem(), self.vk.to_pem())
+
+    def test_verifying_key_encodings_differ_by_parameters(self):
+        self.assertNotEqual(self.vk.to_der(), self.vk.to_der("compressed"))
+        self.assertNotEqual(
+            self.vk.to_der(),
+            self.vk.to_der(curve_parameters_encoding="explicit"),
+        )
+        self.assertNotEqual(
+            self.vk.to_pem(),
+            self.vk.to_pem(curve_parameters_encoding="explicit"),
+        )
+
+    def test_verifying_key_cache_reset_on_new_public_key(self):
+        other = SigningKey.from_secret_exponent(12346, NIST256p).verifying_key
+        der = self.vk.to_der()
+
+        self.vk.pubkey = other.pubkey
+
+        self.assertEqual(self.vk.to_der(), other.to_der())
+        self.assertNotEqual(self.vk.to_der(), der)
+
+    def test_verifying_key_cache_reset_on_new_point(self):
+        other = SigningKey.from_secret_exponent(12346, NIST256p).verifying_key
+        string = self.vk.to_string()
+
+        self.vk.pubkey.point = other.pubkey.point
+
+        self.assertEqual(self.vk.to_string(), other.to_string())
+        self.assertNotEqual(self.vk.to_string(), string)
+
+    def test_verifying_key_cache_reset_on_new_curve(self):
+        curve = Curve("custom", NIST256p.curve, NIST256p.generator, None, None)
+        der = self.vk.to_der()
+
+        self.vk.curve = curve
+
+        self.assertNotEqual(self.vk.to_der(), der)
+        self.assertEqual(VerifyingKey.from_der(self.vk.to_der()), self.vk)
+
+    def test_edwards_to_string_returns_copy(self):
+        vk = SigningKey.from_string(b"\x01" * 32, Ed25519).verifying_key
+        string = vk.to_string()
+        string[0] ^= 0xFF
+
+        self.assertNotEqual(vk.to_string(), string)
+        self.assertIs(vk.to_der(), vk.to_der())
+
+    def test_signing_key_der_is_cached(self):
+        self.assertIs(self.sk.to_der(), self.sk.to_der())
+        self.assertIs(
+            self.sk.to_der(format="pkcs8"), self.sk.to_der(format="pkcs8")
+        )
+        self.assertNotEqual(self.sk.to_der(), self.sk.to_der("compressed"))
+
+    def test_signing_key_der_is_cached_with_lazy_public_key(self):
+        for curve in (NIST256p, Ed25519):
+            sk = SigningKey.from_string(b"\x01" * curve.baselen, curve)
+            der = sk.to_der(format="pkcs8")
+
+            self.assertIs(sk.to_der(format="pkcs8"), der)
+            self.assertIs(sk.to_der(format="pkcs8"), der)
+
+    def test_signing_key_der_cache_reset_on_new_key(self):
+        other = SigningKey.from_secret_exponent(12346, NIST256p)
+        der = self.sk.to_der()
+
+        self.sk.privkey = other.privkey
+        self.sk.verifying_key = other.verifying_key
+
+        self.assertNotEqual(self.sk.to_der(), der)
+        self.assertEqual(self.sk.to_der(), other.to_der())
+
+    def test_signing_key_der_with_raw_encoding(self):
+        with self.assertRaises(ValueError):
+            self.sk.to_der("raw")
+
+    def test_curve_der_is_cached(self):
+        self.assertIs(NIST256p.to_der("explicit"), NIST256p.to_der("explicit"))
+        self.assertIs(NIST256p.to_der(), NIST256p.to_der())
+
+    def test_curve_der_cache_reset_on_new_oid(self):
+        curve = Curve("custom", NIST256p.curve, NIST256p.generator, None, None)
+        der = curve.to_der()
+
+        curve.oid = NIST256p.oid
+
+        self.assertNotEqual(curve.to_der(), der)
+        self.assertEqual(curve.to_der(), NIST256p.to_der())
+
+
+class TestPickling(unittest.TestCase):
+    def test_verifying_key(self):
+        vk = SigningKey.from_secret_exponent(12345, NIST256p).verifying_key
+
+        vk2 = pickle.loads(pickle.dumps(vk))
+
+        self.assertEqual(vk, vk2)
+        self.assertIs(vk2.curve, NIST256p)
+        self.assertIs(vk2.pubkey.generator, NIST256p.generator)
+        self.assertIs(vk2.default_hashfunc, vk.default_hashfunc)
+
+    def test_precomputed_verifying_key(self):
+        sk = SigningKey.from_secret_exponent(12345, NIST256p)
+        vk = sk.verifying_key
+        vk.precompute()
+        sig = sk.sign(b"message")
+
+        data = pickle.dumps(vk)
+        vk2 = pickle.loads(data)
+
+        self.assertLess(len(data), 1024)
+        point = vk2.pubkey.point
+        self.assertTrue(point._PointJacobi__generator)
+        self.assertEqual(point._PointJacobi__precompute, [])
+        self.assertTrue(vk2.verify(sig, b"message"))
+        self.assertTrue(point._PointJacobi__precompute)
+
+    def test_lazy_verifying_key_stays_lazy(self):
+        vk = SigningKey.from_secret_exponent(12345, NIST256p).verifying_key
+        lazy_vk = VerifyingKey.from_string(
+            vk.to_string("compressed"), NIST256p, lazy=True
+        )
+
+        vk2 = pickle.loads(pickle.dumps(lazy_vk))
+
+        self.assertIsNotNone(vk2._VerifyingKey__encoded_point)
+        self.assertEqual(vk2, vk)
+
+    def test_edwards_verifying_key(self):
+        vk = SigningKey.from_string(b"\x01" * 32, Ed25519).verifying_key
+        vk.precompute()
+
+        vk2 = pickle.loads(pickle.dumps(vk))
+
+        self.assertEqual(vk, vk2)
+        self.assertIs(vk2.curve, Ed25519)
+        self.assertEqual(vk2.pubkey.point._PointEdwards__precompute, [])
+
+    def test_signing_key_without_verifying_key(self):
+        sk = SigningKey.from_secret_exponent(
+            12345, NIST256p, hashfunc=hashlib.sha256
+        )
+
+        sk2 = pickle.loads(pickle.dumps(sk))
+
+        self.assertEqual(sk, sk2)
+        self.assertIs(sk2.default_hashfunc, hashlib.sha256)
+        self.assertIsNone(sk2._SigningKey__verifying_key)
+        self.assertEqual(sk2.verifying_key, sk.verifying_key)
+
+    def test_signing_key_with_verifying_key(self):
+        sk = SigningKey.from_secret_exponent(12345, NIST256p)
+        sk.verifying_key.precompute()
+
+        sk2 = pickle.loads(pickle.dumps(sk))
+
+        self.assertEqual(sk, sk2)
+        self.assertEqual(sk2._SigningKey__verifying_key, sk.verifying_key)
+        sig = sk2.sign(b"message")
+        self.assertTrue(sk.verifying_key.verify(sig, b"message"))
+
+    def test_edwards_signing_key(self):
+        sk = SigningKey.from_string(b"\x01" * 57, Ed448)
+
+        sk2 = pickle.loads(pickle.dumps(sk))
+
+        self.assertEqual(sk, sk2)
+        self.assertEqual(sk2.sign(b"message"), sk.sign(b"message"))
+
+    def test_custom_curve(self):
+        curve = Curve(
+            "BRAINPOOLP160r1",
+            generator_brainpoolp160r1.curve(),
+            generator_brainpoolp160r1,
+            (1, 3, 36, 3, 3, 2, 8, 1, 1, 1),
+        )
+        sk = SigningKey.from_secret_exponent(12345, curve)
+
+        sk2 = pickle.loads(pickle.dumps(sk))
+
+        self.assertEqual(sk, sk2)
+        self.assertEqual(sk2.curve, curve)
+        self.assertEqual(sk2.verifying_key, sk.verifying_key)
+
+    def test_keys_use_slots(self):
+        sk = SigningKey.from_secret_exponent(12345, NIST256p)
+
+        self.assertFalse(hasattr(sk, "__dict__"))
+        self.assertFalse(hasattr(sk.verifying_key, "__dict__"))
+
+    def test_keys_are_weakly_referenceable(self):
+        sk = SigningKey.from_secret_exponent(12345, NIST256p)
+        vk = sk.verifying_key
+        refs = weakref.WeakValueDictionary({"sk": sk, "vk": vk})
+
+        self.assertIs(refs["sk"], sk)
+        self.assertIs(refs["vk"], vk)
+        del sk, vk
+        gc.collect()
+        self.assertEqual(len(refs), 0)
+
+    def test_verifying_key_setstate_with_old_dict_state(self):
+        vk = SigningKey.from_secret_exponent(12345, NIST256p).verifying_key
+        vk2 = VerifyingKey.__new__(VerifyingKey)
+
+        vk2.__setstate__(
+            {
+                "curve": vk.curve,
+                "default_hashfunc": vk.default_hashfunc,
+                "pubkey": vk.pubkey,
+            }
+        )
+
+        self.assertEqual(vk2, vk)
+        self.assertEqual(vk2.to_string(), vk.to_string())
+
+    def test_signing_key_setstate_with_old_dict_state(self):
+        sk = SigningKey.from_secret_exponent(12345, NIST256p)
+        sk2 = SigningKey.__new__(SigningKey)
+
+        sk2.__setstate__(
+            {
+                "curve": sk.curve,
+                "default_hashfunc": sk.default_hashfunc,
+                "baselen": sk.baselen,
+                "privkey": sk.privkey,
+                "verifying_key": sk.verifying_key,
+            }
+        )
+
+        self.assertEqual(sk2, sk)
+        self.assertEqual(sk2.to_der(), sk.to_der())
+        self.assertEqual(
+            sk2.sign_deterministic(b"a"), sk.sign_deterministic(b"a")
+        )
+        self.assertIsNone(sk2.nonce_pool)
+        self.assertTrue(sk.verifying_key.verify(sk2.sign(b"a"), b"a"))
+
+
+def test_VerifyingKey_precompute_after_from_string():
+    sk = SigningKey.from_secret_exponent(12345, NIST256p)
+    vk = VerifyingKey.from_string(sk.verifying_key.to_string(), NIST256p)
+    sig = sk.sign(b"message")
+
+    vk.precompute()
+
+    assert vk.pubkey.point._PointJacobi__precompute
+    assert vk.verify(sig, b"message")
+
+
+class TestIntegerSignatures(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.sk = SigningKey.from_secret_exponent(12345, NIST256p)
+        cls.vk = cls.sk.verifying_key
+        cls.digest = hashlib.sha256(b"message").digest()
+        cls.e = string_to_number(cls.digest)
+
+    def test_sign_ints_verify_digest(self):
+        r, s = self.sk.sign_ints(self.e)
+
+        self.assertTrue(
+            self.vk.verify_digest(
+                sigencode_string(r, s, self.vk.pubkey.order), self.digest
+            )
+        )
+
+    def test_sign_digest_verify_ints(self):
+        sig = self.sk.sign_digest(self.digest)
+        r, s = sigdecode_string(sig, self.vk.pubkey.order)
+
+        self.assertIs(self.vk.verify_ints(self.e, r, s), True)
+
+    def test_verify_ints_with_wrong_digest(self):
+        r, s = self.sk.sign_ints(self.e)
+
+        self.assertIs(self.vk.verify_ints(self.e + 1, r, s), False)
+
+    def test_verify_ints_with_out_of_range_values(self):
+        r, s = self.sk.sign_ints(self.e)
+        n = self.vk.pubkey.order
+
+        self.assertFalse(self.vk.verify_ints(self.e, 0, s))
+        self.assertFalse(self.vk.verify_ints(self.e, r, 0))
+        self.assertFalse(self.vk.verify_ints(self.e, r + n, s))
+        self.assertFalse(self.vk.verify_ints(self.e, r, s + n))
+        self.assertFalse(self.vk.verify_ints(self.e, -r, s))
+
+    def test_sign_ints_with_entropy(self):
+        entropy = PRNG(b"seed")
+        r, s = self.sk.sign_ints(self.e, entropy)
+
+        self.assertEqual((r, s), self.sk.sign_ints(self.e, PRNG(b"seed")))
+        self.assertTrue(self.vk.verify_ints(self.e, r, s))
+
+    def test_edwards_keys(self):
+        sk = SigningKey.from_string(b"\x01" * 32, Ed25519)
+
+        with self.assertRaises(ValueError):
+            sk.sign_ints(self.e)
+        with self.assertRaises(ValueError):
+            sk.verifying_key.verify_ints(self.e, 1, 1)
+
+
+def test_SigningKey_sign_ints_retries_on_zero_s(monkeypatch):
+    sk = SigningKey.from_secret_exponent(12345, NIST256p)
+    n = NIST256p.order
+    # with e == -r * secexp the s is zero for the first nonce
+    r = (NIST256p.generator * 7).x() % n
+    e = (-r * 12345) % n
+    nonces = iter([7, 8])
+    monkeypatch.setattr(keys, "randrange", lambda order, entropy: next(nonces))
+
+    r2, s2 = sk.sign_ints(e)
+
+    assert r2 == (NIST256p.generator * 8).x() % n
+    assert sk.verifying_key.verify_ints(e, r2, s2)
+
+
+class TestTweakAdd(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.sk = SigningKey.from_secret_exponent(
+            12345, NIST256p, hashfunc=hashlib.sha256
+        )
+        cls.vk = cls.sk.verifying_key
+
+    def test_verifying_key_matches_signing_key(self):
+        tweak = 0xDEADBEEF
+
+        vk = self.vk.tweak_add(tweak)
+        sk = self.sk.tweak_add(tweak)
+
+        self.assertEqual(sk.privkey.secret_multiplier, 12345 + tweak)
+        self.assertEqual(sk.verifying_key, vk)
+        self.assertIs(vk.default_hashfunc, hashlib.sha256)
+        self.assertIs(sk.default_hashfunc, hashlib.sha256)
+        self.assertTrue(vk.verify(sk.sign(b"message"), b"message"))
+
+    def test_many(self):
+        tweaks = [1, 2, NIST256p.order - 1, 2**300]
+
+        vks = self.vk.tweak_add_many(tweaks)
+        sks = self.sk.tweak_add_many(tweaks)
+
+        self.assertEqual(len(vks), 4)
+        self.assertEqual(vks, [i.verifying_key for i in sks])
+        self.assertEqual(vks, [self.vk.tweak_add(i) for i in tweaks])
+        self.assertEqual(
+            vks[2],
+            SigningKey.from_secret_exponent(12344, NIST256p).verifying_key,
+        )
+
+    def test_many_with_no_tweaks(self):
+        self.assertEqual(self.vk.tweak_add_many([]), [])
+        self.assertEqual(self.sk.tweak_add_many([]), [])
+
+    def test_zero_tweak(self):
+        self.assertEqual(self.vk.tweak_add(0), self.vk)
+        self.assertEqual(self.sk.tweak_add(NIST256p.order), self.sk)
+
+    def test_tweak_to_infinity(self):
+        with self.assertRaises(ValueError):
+            self.vk.tweak_add(NIST256p.order - 12345)
+        with self.assertRaises(ValueError):
+            self.sk.tweak_add(NIST256p.order - 12345)
+
+    def test_subclasses(self):
+        class MyVerifyingKey(VerifyingKey):
+            __slots__ = ()
+
+        class MySigningKey(SigningKey):
+            __slots__ = ()
+
+        vk = MyVerifyingKey.from_string(self.vk.to_string(), NIST256p)
+        sk = MySigningKey.from_secret_exponent(12345, NIST256p)
+
+        self.assertIs(type(vk.tweak_add(1)), MyVerifyingKey)
+        self.assertIs(type(sk.tweak_add(1)), MySigningKey)
+        self.assertEqual(sk.tweak_add(1).verifying_key, vk.tweak_add(1))
+
+    def test_key_from_cache(self):
+        set_verifying_key_cache(4)
+        try:
+            vk = VerifyingKey.from_string(self.vk.to_string(), NIST256p)
+            vk2 = vk.tweak_add(1)
+        finally:
+            set_verifying_key_cache(None)
+
+        self.assertIsNot(type(vk), VerifyingKey)
+        self.assertIs(type(vk2), VerifyingKey)
+        self.assertEqual(vk2, self.vk.tweak_add(1))
+        vk2.default_hashfunc = hashlib.sha256
+
+    def test_derived_point_is_affine(self):
+        vk = self.vk.tweak_add(0xDEADBEEF)
+
+        self.assertEqual(vk.pubkey.point._PointJacobi__coords[2], 1)
+
+    def test_edwards_keys(self):
+        sk = SigningKey.from_string(b"\x01" * 32, Ed25519)
+
+        with self.assertRaises(ValueError):
+            sk.tweak_add(1)
+        with self.assertRaises(ValueError):
+            sk.verifying_key.tweak_add(1)
+
+
+@pytest.fixture
+def sqrt_calls(monkeypatch):
+    calls = []
+    sqrt = numbertheory.square_root_mod_prime
+
+    def counting_sqrt(a, p):
+        calls.append(a)
+        return sqrt(a, p)
+
+    monkeypatch.setattr(numbertheory, "square_root_mod_prime", counting_sqrt)
+    return calls
+
+
+@pytest.mark.parametrize("curve", [NIST256p, Ed25519, Ed448])
+def test_generate_does_not_decompress(curve, sqrt_calls):
+    sk = SigningKey.generate(curve)
+
+    vk = sk.verifying_key
+    vk.to_string()
+
+    assert not sqrt_calls
+
+
+@pytest.mark.parametrize("curve", [Ed25519, Ed448])
+def test_edwards_from_string_does_not_decompress(curve, sqrt_calls):
+    sk = SigningKey.from_string(b"\x01" * curve.baselen, curve)
+
+    sig = sk.sign(b"message")
+    sk.verifying_key.verify(sig, b"message")
+
+    # only the R point of the signature needs decoding
+    assert len(sqrt_calls) == 1
+
+
+@pytest.mark.parametrize("curve", [NIST256p, Ed25519])
+def test_precompute_does_not_decompress(curve, sqrt_calls):
+    vk = SigningKey.generate(curve).verifying_key
+
+    vk.precompute()
+
+    assert not sqrt_calls
+
+
+@pytest.mark.parametrize("curve", [NIST256p, Ed25519])
+def test_pickled_keys_do_not_decompress(curve, sqrt_calls):
+    sk = SigningKey.generate(curve)
+    sk.verifying_key
+
+    sk2 = pickle.loads(pickle.dumps(sk))
+
+    assert sk2.verifying_key == sk.verifying_key
+    assert not sqrt_calls
+
+
+def test_from_string_decompresses_once(sqrt_calls):
+    vk = SigningKey.from_secret_exponent(12345, NIST256p).verifying_key
+
+    vk2 = VerifyingKey.from_string(vk.to_string("compressed"), NIST256p)
+    vk2.precompute()
+
+    assert vk2 == vk
+    assert len(sqrt_calls) == 1
+
+
+class TestPointCache(unittest.TestCase):
+    def setUp(self):
+        set_point_cache(16)
+        self.sk = SigningKey.from_secret_exponent(12345, NIST256p)
+        self.enc = self.sk.verifying_key.to_string("compressed")
+        self.sqrt_calls = []
+        self.old_sqrt = numbertheory.square_root_mod_prime
+
+        def counting_sqrt(a, p):
+            self.sqrt_calls.append(a)
+            return self.old_sqrt(a, p)
+
+        numbertheory.square_root_mod_prime = counting_sqrt
+
+    def tearDown(self):
+        numbertheory.square_root_mod_prime = self.old_sqrt
+        set_point_cache(None)
+
+    def test_disabled_by_default(self):
+        set_point_cache(None)
+
+        vk1 = VerifyingKey.from_string(self.enc, NIST256p)
+        vk2 = VerifyingKey.from_string(self.enc, NIST256p)
+
+        self.assertEqual(vk1, vk2)
+        self.assertEqual(len(self.sqrt_calls), 2)
+
+    def test_from_string(self):
+        vk1 = VerifyingKey.from_string(self.enc, NIST256p)
+        vk2 = VerifyingKey.from_string(self.enc, NIST256p)
+
+        self.assertEqual(len(self.sqrt_calls), 1)
+        self.assertEqual(vk1, vk2)
+        self.assertEqual(vk2, self.sk.verifying_key)
+        self.assertIs(vk1.pubkey.point, vk2.pubkey.point)
+        self.assertTrue(vk2.verify(self.sk.sign(b"message"), b"message"))
+
+    def test_from_der(self):
+        der = self.sk.verifying_key.to_der("compressed")
+
+        vk1 = VerifyingKey.from_der(der)
+        vk2 = VerifyingKey.from_der(der)
+
+        self.assertEqual(len(self.sqrt_calls), 1)
+        self.assertEqual(vk1, vk2)
+
+    def test_lazy_keys(self):
+        vk1 = VerifyingKey.from_string(self.enc, NIST256p, lazy=True)
+        vk2 = VerifyingKey.from_string(self.enc, NIST256p, lazy=True)
+
+        self.assertEqual(vk1, vk2)
+        self.assertEqual(len(self.sqrt_calls), 1)
+
+    def test_respects_valid_encodings(self):
+        VerifyingKey.from_string(self.enc, NIST256p)
+
+        with self.assertRaises(MalformedPointError):
+            VerifyingKey.from_string(
+                self.enc, NIST256p, valid_encodings=["uncompressed"]
+            )
+
+    def test_unvalidated_points_are_not_cached(self):
+        VerifyingKey.from_string(self.enc, NIST256p, validate_point=False)
+        VerifyingKey.from_string(self.enc, NIST256p)
+
+        self.assertEqual(len(self.sqrt_calls), 2)
+
+    def test_invalid_points_are_not_cached(self):
+        enc = self.sk.verifying_key.to_string()
+        enc = enc[:-1] + bytes(bytearray([enc[-1] ^ 1]))
+
+        for _ in range(2):
+            with self.assertRaises(MalformedPointError):
+                VerifyingKey.from_string(enc, NIST256p)
+
+    def test_curve_is_part_of_key(self):
+        VerifyingKey.from_string(self.enc, NIST256p)
+        sk = SigningKey.from_secret_exponent(12345, BRAINPOOLP160r1)
+        enc = sk.verifying_key.to_string("compressed")
+
+        vk = VerifyingKey.from_string(enc, BRAINPOOLP160r1)
+
+        self.assertEqual(vk, sk.verifying_key)
+        self.assertEqual(len(self.sqrt_calls), 2)
+
+    def test_edwards_keys(self):
+        vk = SigningKey.from_string(b"\x01" * 32, Ed25519).verifying_key
+        enc = vk.to_string()
+
+        vk1 = VerifyingKey.from_string(enc, Ed25519)
+        vk2 = VerifyingKey.from_string(enc, Ed25519)
+
+        self.assertEqual(len(self.sqrt_calls), 1)
+        self.assertEqual(vk1, vk2)
+        self.assertEqual(vk2, vk)
+
+
+class TestVerifyingKeyCache(unittest.TestCase):
+    def setUp(self):
+        set_verifying_key_cache(4)
+        self.sk = SigningKey.from_secret_exponent(12345, NIST256p)
+        self.vk = self.sk.verifying_key
+
+    def tearDown(self):
+        set_verifying_key_cache(None)
+
+    def test_disabled_by_default(self):
+        set_verifying_key_cache(None)
+        enc = self.vk.to_string()
+
+        vk1 = VerifyingKey.from_string(enc, NIST256p)
+        vk2 = VerifyingKey.from_string(enc, NIST256p)
+
+        self.assertIsNot(vk1, vk2)
+        vk1.default_hashfunc = hashlib.sha256
+
+    def test_from_string(self):
+        enc = self.vk.to_string()
+
+        vk1 = VerifyingKey.from_string(enc, NIST256p)
+        vk2 = VerifyingKey.from_string(bytearray(enc), NIST256p)
+
+        self.assertIs(vk1, vk2)
+        self.assertEqual(vk1, self.vk)
+        self.assertIsInstance(vk1, VerifyingKey)
+
+    def test_from_der(self):
+        der = self.vk.to_der()
+
+        vk1 = VerifyingKey.from_der(der)
+        vk2 = VerifyingKey.from_der(der)
+
+        self.assertIs(vk1, vk2)
+        self.assertEqual(vk1, self.vk)
+
+    def test_from_pem(self):
+        pem = self.vk.to_pem()
+
+        vk1 = VerifyingKey.from_pem(pem)
+        vk2 = VerifyingKey.from_pem(pem)
+
+        self.assertIs(vk1, vk2)
+
+    def test_edwards_key(self):
+        vk = SigningKey.from_string(b"\x01" * 32, Ed25519).verifying_key
+        der = vk.to_der()
+
+        vk1 = VerifyingKey.from_der(der)
+
+        self.assertIs(VerifyingKey.from_der(der), vk1)
+        self.assertEqual(vk1, vk)
+
+    def test_options_are_part_of_key(self):
+        enc = self.vk.to_string()
+
+        vk1 = VerifyingKey.from_string(enc, NIST256p)
+        vk2 = VerifyingKey.from_string(enc, NIST256p, hashlib.sha256)
+        vk3 = VerifyingKey.from_string(enc, NIST256p, valid_encodings=["raw"])
+
+        self.assertIsNot(vk1, vk2)
+        self.assertIsNot(vk1, vk3)
+        self.assertIs(vk2.default_hashfunc, hashlib.sha256)
+        with self.assertRaises(MalformedPointError):
+            VerifyingKey.from_string(
+                enc, NIST256p, valid_encodings=["uncompressed"]
+            )
+
+    def test_keys_are_read_only(self):
+        vk = VerifyingKey.from_string(self.vk.to_string(), NIST256p)
+
+        with self.assertRaises(AttributeError):
+            vk.default_hashfunc = hashlib.sha256
+        with self.assertRaises(AttributeError):
+            vk.pubkey = self.vk.pubkey
+        with self.assertRaises(AttributeError):
+            vk.curve = BRAINPOOLP160r1
+        self.assertEqual(
+            vk.to_string("compressed"), self.vk.to_string("compressed")
+        )
+        self.assertEqual(hash(vk), hash(self.vk))
+
+    def test_precomputation_is_shared(self):
+        enc = self.vk.to_string()
+        VerifyingKey.from_string(enc, NIST256p).precompute()
+
+        vk = VerifyingKey.from_string(enc, NIST256p)
+
+        self.assertTrue(vk.pubkey.point._PointJacobi__precompute)
+        self.assertTrue(vk.verify(self.sk.sign(b"message"), b"message"))
+
+    def test_lazy_keys_are_not_cached(self):
+        enc = self.vk.to_string()
+
+        vk1 = VerifyingKey.from_string(enc, NIST256p, lazy=True)
+        vk2 = VerifyingKey.from_string(enc, NIST256p)
+        vk3 = VerifyingKey.from_string(enc, NIST256p, lazy=True)
+
+        self.assertIsNot(vk1, vk2)
+        self.assertIs(vk2, vk3)
+        vk1.default_hashfunc = hashlib.sha256
+
+    def test_subclasses_are_not_cached(self):
+        class MyKey(VerifyingKey):
+            pass
+
+        enc = self.vk.to_string()
+
+        vk1 = MyKey.from_string(enc, NIST256p)
+        vk2 = MyKey.from_string(enc, NIST256p)
+
+        self.assertIsNot(vk1, vk2)
+        self.assertIs(type(vk1), MyKey)
+
+    def test_invalid_keys_are_not_cached(self):
+        enc = self.vk.to_string()
+        enc = enc[:-1] + bytes(bytearray([enc[-1] ^ 1]))
+
+        for _ in range(2):
+            with self.assertRaises(MalformedPointError):
+                VerifyingKey.from_string(enc, NIST256p)
+
+    def test_size_is_bounded(self):
+        first = VerifyingKey.from_string(self.vk.to_string(), NIST256p)
+        for i in range(5):
+            vk = SigningKey.from_secret_exponent(i + 1, NIST256p).verifying_key
+            VerifyingKey.from_string(vk.to_string(), NIST256p)
+
+        self.assertIsNot(
+            VerifyingKey.from_string(self.vk.to_string(), NIST256p), first
+        )
+
+    def test_pickled_key_is_writable(self):
+        vk = VerifyingKey.from_string(self.vk.to_string(), NIST256p)
+
+        vk2 = pickle.loads(pickle.dumps(vk))
+
+        self.assertIs(type(vk2), VerifyingKey)
+        self.assertEqual(vk2, vk)
+        vk2.default_hashfunc = hashlib.sha256
+
+
+class TestBatchSigning(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.sk = SigningKey.from_secret_exponent(12345, NIST256p)
+        cls.digests = [
+            hashlib.sha256(str(i).encode()).digest() for i in range(5)
+        ]
+
+    def test_sign_digests_deterministic(self):
+        sigs = self.sk.sign_digests_deterministic(self.digests)
+
+        self.assertEqual(
+            sigs,
+            [self.sk.sign_digest_deterministic(i) for i in self.digests],
+        )
+
+    def test_sign_digests_deterministic_with_options(self):
+        sigs = self.sk.sign_digests_deterministic(
+            (bytearray(i) for i in self.digests),
+            hashfunc=hashlib.sha1,
+            sigencode=sigencode_der,
+            extra_entropy=b"extra",
+        )
+
+        self.assertEqual(
+            sigs,
+            [
+                self.sk.sign_digest_deterministic(
+                    i,
+                    hashfunc=hashlib.sha1,
+                    sigencode=sigencode_der,
+                    extra_entropy=b"extra",
+                )
+                for i in self.digests
+            ],
+        )
+
+    def test_sign_digests_deterministic_truncate(self):
+        digests = [hashlib.sha512(i).digest() for i in self.digests]
+
+        with self.assertRaises(BadDigestError):
+            self.sk.sign_digests_deterministic(digests)
+
+        sigs = self.sk.sign_digests_deterministic(digests, allow_truncate=True)
+
+        self.assertEqual(
+            sigs,
+            [
+                self.sk.sign_digest_deterministic(i, allow_truncate=True)
+                for i in digests
+            ],
+        )
+
+    def test_sign_digests(self):
+        sigs = self.sk.sign_digests(self.digests, sigencode=sigencode_der)
+
+        self.assertEqual(len(sigs), len(self.digests))
+        self.assertEqual(len(set(sigs)), len(sigs))
+        for sig, digest in zip(sigs, self.digests):
+            self.assertTrue(
+                self.sk.verifying_key.verify_digest(
+                    sig, digest, sigdecode=sigdecode_der
+                )
+            )
+
+    def test_sign_digests_empty(self):
+        self.assertEqual(self.sk.sign_digests([]), [])
+        self.assertEqual(self.sk.sign_digests_deterministic([]), [])
+
+    def test_sign_digests_with_edwards_key(self):
+        sk = SigningKey.from_string(b"\x01" * 32, Ed25519)
+
+        with self.assertRaises(ValueError):
+            sk.sign_digests(self.digests)
+        with self.assertRaises(ValueError):
+            sk.sign_digests_deterministic(self.digests)
+
+
+def test_SigningKey_sign_digests_retries_on_zero_s(monkeypatch):
+    sk = SigningKey.from_secret_exponent(12345, NIST256p)
+    n = NIST256p.order
+    r = (NIST256p.generator * 7).x() % n
+    e = (-r * 12345) % n
+    digest = number_to_string(e, n)
+    nonces = iter([7, 9, 8])
+    monkeypatch.setattr(keys, "randrange", lambda order, entropy: next(nonces))
+
+    sigs = sk.sign_digests([digest, b"\x01" * 32], sigencode=lambda *a: a)
+
+    assert sigs[0][0] == (NIST256p.generator * 8).x() % n
+    assert sigs[1][0] == (NIST256p.generator * 9).x() % n
+    assert sk.verifying_key.verify_ints(e, sigs[0][0], sigs[0][1])
+
+
+def test_SigningKey_sign_digests_deterministic_retries(monkeypatch):
+    sk = SigningKey.from_secret_exponent(12345, NIST256p)
+    n = NIST256p.order
+    r = (NIST256p.generator * 7).x() % n
+    e = (-r * 12345) % n
+    digest = number_to_string(e, n)
+    calls = []
+
+    def generate_k(self, data, retry_gen=0, extra_entropy=b""):
+        calls.append(retry_gen)
+        return 7 + retry_gen
+
+    monkeypatch.setattr(keys.rfc6979.NonceGenerator, "generate_k", generate_k)
+
+    sig = sk.sign_digests_deterministic([digest], sigencode=lambda *a: a)
+
+    assert calls == [0, 1]
+    assert sig == [
+        sk.sign_digest_deterministic(digest, sigencode=lambda *a: a)
+    ]
+    assert sig[0][0] == (NIST256p.generator * 8).x() % n
+
+
+class TestNonceGeneratorCache(unittest.TestCase):
+    def setUp(self):
+        self.sk = SigningKey.from_secret_exponent(12345, NIST256p)
+
+    def test_generator_is_reused(self):
+        self.sk.sign_deterministic(b"a")
+        privkey, generator = self.sk._SigningKey__nonce_generator
+
+        self.sk.sign_deterministic(b"b")
+        self.sk.sign_digests_deterministic([b"\x01" * 20])
+
+        self.assertIs(self.sk._SigningKey__nonce_generator[1], generator)
+        self.assertIs(privkey, self.sk.privkey)
+        self.assertIs(generator.hash_func, hashlib.sha1)
+
+    def test_different_hash_function(self):
+        digest = hashlib.sha256(b"a").digest()
+        sig1 = self.sk.sign_digest_deterministic(digest)
+        sig256 = self.sk.sign_digest_deterministic(
+            digest, hashfunc=hashlib.sha256
+        )
+
+        self.assertIs(
+            self.sk._SigningKey__nonce_generator[1].hash_func, hashlib.sha256
+        )
+        self.assertNotEqual(sig1, sig256)
+        self.assertEqual(self.sk.sign_digest_deterministic(digest), sig1)
+        self.assertEqual(
+            self.sk.sign_digest_deterministic(digest, hashfunc=hashlib.sha256),
+            sig256,
+        )
+
+    def test_replaced_private_key(self):
+        self.sk.sign_deterministic(b"a")
+        other = SigningKey.from_secret_exponent(54321, NIST256p)
+
+        self.sk.privkey = other.privkey
+        sig = self.sk.sign_deterministic(b"a")
+
+        self.assertEqual(sig, other.sign_deterministic(b"a"))
+        self.assertIs(self.sk._SigningKey__nonce_generator[0], other.privkey)
+
+    def test_matches_generate_k(self):
+        digest = hashlib.sha256(b"a").digest()
+        k = rfc6979.generate_k(
+            NIST256p.order, 12345, hashlib.sha256, digest, extra_entropy=b"e"
+        )
+        r = (NIST256p.generator * k).x() % NIST256p.order
+
+        sig = self.sk.sign_digest_deterministic(
+            digest,
+            hashfunc=hashlib.sha256,
+            extra_entropy=b"e",
+            sigencode=lambda r, s, order: r,
+        )
+
+        self.assertEqual(sig, r)
+
+    def test_generator_is_not_pickled(self):
+        self.sk.sign_deterministic(b"a")
+
+        sk = pickle.loads(pickle.dumps(self.sk))
+
+        self.assertIsNone(sk._SigningKey__nonce_generator)
+        self.assertEqual(
+            sk.sign_deterministic(b"a"), self.sk.sign_deterministic(b"a")
+        )
+
+
+class TestGenerateMany(unittest.TestCase):
+    def test_same_keys_as_generate(self):
+        for curve in (NIST256p, BRAINPOOLP160r1, Ed25519, Ed448):
+            entropy = PRNG(b"seed")
+            expected = [
+                SigningKey.generate(curve, entropy=entropy) for _ in range(5)
+            ]
+
+            sks = SigningKey.generate_many(curve, 5, entropy=PRNG(b"seed"))
+
+            self.assertEqual(sks, expected)
+            self.assertEqual(
+                [i.verifying_key for i in sks],
+                [i.verifying_key for i in expected],
+            )
+            self.assertEqual(
+                [i.default_hashfunc for i in sks],
+                [i.default_hashfunc for i in expected],
+            )
+
+    def test_subclass(self):
+        class MySigningKey(SigningKey):
+            __slots__ = ()
+
+        for curve in (NIST256p, Ed25519):
+            sks = MySigningKey.generate_many(curve, 2)
+
+            self.assertEqual([type(i) for i in sks], [MySigningKey] * 2)
+
+    def test_public_keys_are_calculated(self):
+        sks = SigningKey.generate_many(NIST256p, 3, hashfunc=hashlib.sha256)
+
+        for sk in sks:
+            point = sk.privkey._Private_key__public_key.point
+            self.assertEqual(point._PointJacobi__coords[2], 1)
+            self.assertEqual(
+                point, NIST256p.generator * sk.privkey.secret_multiplier
+            )
+            self.assertIs(sk.default_hashfunc, hashlib.sha256)
+            self.assertTrue(
+                sk.verifying_key.verify(sk.sign(b"message"), b"message")
+            )
+            self.assertEqual(
+                VerifyingKey.from_der(sk.verifying_key.to_der()),
+                sk.verifying_key,
+            )
+
+    def test_keys_are_different(self):
+        sks = SigningKey.generate_many(NIST256p, 10)
+
+        self.assertEqual(len(set(i.to_string() for i in sks)), 10)
+
+    def test_no_keys(self):
+        self.assertEqual(SigningKey.generate_many(NIST256p, 0), [])
+        self.assertEqual(SigningKey.generate_many(Ed25519, 0), [])
+
+    def test_curve_with_affine_generator(self):
+        curve = Curve(
+            "BRAINPOOLP160r1 affine",
+            BRAINPOOLP160r1.curve,
+            BRAINPOOLP160r1.generator.to_affine(),
+            (1, 2, 3),
+        )
+
+        sks = SigningKey.generate_many(curve, 2)
+
+        for sk in sks:
+            self.assertTrue(
+                sk.verifying_key.verify(sk.sign(b"message"), b"message")
+            )
+
+
+class TestSignMany(unittest.TestCase):
+    messages = [b"", b"message", bytearray(b"other"), memoryview(b"third")]
+
+    def test_edwards(self):
+        for curve in (Ed25519, Ed448):
+            sk = SigningKey.generate(curve)
+
+            sigs = sk.sign_many(self.messages)
+
+            self.assertEqual(sigs, [sk.sign(i) for i in self.messages])
+            for sig, msg in zip(sigs, self.messages):
+                self.assertTrue(sk.verifying_key.verify(sig, msg))
+
+    def test_weierstrass(self):
+        sk = SigningKey.generate(NIST256p, hashfunc=hashlib.sha256)
+
+        sigs = sk.sign_many(self.messages, sigencode=sigencode_der)
+
+        for sig, msg in zip(sigs, self.messages):
+            self.assertTrue(
+                sk.verifying_key.verify(sig, msg, sigdecode=sigdecode_der)
+            )
+
+    def test_weierstrass_with_hashfunc(self):
+        sk = SigningKey.generate(NIST256p)
+        entropy = PRNG(b"seed")
+
+        sigs = sk.sign_many(
+            self.messages, entropy=entropy, hashfunc=hashlib.sha512
+        )
+
+        entropy = PRNG(b"seed")
+        self.assertEqual(
+            sigs,
+            [
+                sk.sign(i, entropy=entropy, hashfunc=hashlib.sha512)
+                for i in self.messages
+            ],
+        )
+
+
+class TestStreaming(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.sk = SigningKey.from_secret_exponent(
+            12345, NIST256p, hashfunc=hashlib.sha256
+        )
+        cls.vk = cls.sk.verifying_key
+        cls.data = b"some data " * 1000
+        cls.chunks = [cls.data[i : i + 777] for i in range(0, 10000, 777)]
+
+    def test_signer(self):
+        signer = self.sk.signer()
+        for chunk in self.chunks:
+            signer.update(chunk)
+        signer.update(b"")
+
+        self.assertEqual(
+            signer.finalize(), self.sk.sign_deterministic(self.data)
+        )
+
+    def test_signer_with_options(self):
+        signer = self.sk.signer(
+            hashfunc=hashlib.sha512,
+            sigencode=sigencode_der,
+            extra_entropy=b"extra",
+        )
+        signer.update(bytearray(self.data))
+        signer.update(memoryview(b"more"))
+
+        self.assertEqual(
+            signer.finalize(),
+            self.sk.sign_deterministic(
+                self.data + b"more",
+                hashfunc=hashlib.sha512,
+                sigencode=sigencode_der,
+                extra_entropy=b"extra",
+            ),
+        )
+
+    def test_probabilistic_signer(self):
+        signer = self.sk.signer(deterministic=False, entropy=PRNG(b"seed"))
+        for chunk in self.chunks:
+            signer.update(chunk)
+
+        self.assertEqual(
+            signer.finalize(),
+            self.sk.sign(self.data, entropy=PRNG(b"seed")),
+        )
+
+    def test_verifier(self):
+        sig = self.sk.sign(self.data, sigencode=sigencode_der)
+
+        verifier = self.vk.verifier(sig, sigdecode=sigdecode_der)
+        for chunk in self.chunks:
+            verifier.update(chunk)
+
+        self.assertTrue(verifier.finalize())
+
+    def test_verifier_with_hashfunc(self):
+        sig = self.sk.sign(self.data, hashfunc=hashlib.sha1)
+
+        verifier = self.vk.verifier(sig, hashfunc=hashlib.sha1)
+        verifier.update(self.data)
+
+        self.assertTrue(verifier.finalize())
+
+    def test_verifier_with_wrong_data(self):
+        sig = self.sk.sign(self.data)
+
+        verifier = self.vk.verifier(sig)
+        for chunk in self.chunks[:-1]:
+            verifier.update(chunk)
+
+        with self.assertRaises(BadSignatureError):
+            verifier.finalize()
+
+    def test_verifier_with_malformed_signature(self):
+        verifier = self.vk.verifier(b"\x30\x00", sigdecode=sigdecode_der)
+        verifier.update(self.data)
+
+        with self.assertRaises(BadSignatureError):
+            verifier.finalize()
+
+    def test_use_after_finalize(self):
+        signer = self.sk.signer()
+        signer.update(self.data)
+        sig = signer.finalize()
+        verifier = self.vk.verifier(sig)
+        verifier.update(self.data)
+        verifier.finalize()
+
+        for obj in (signer, verifier):
+            with self.assertRaises(ValueError):
+                obj.update(b"more")
+            with self.assertRaises(ValueError):
+                obj.finalize()
+
+    def test_edwards_keys(self):
+        sk = SigningKey.generate(Ed25519)
+
+        with self.assertRaises(ValueError):
+            sk.signer()
+        with self.assertRaises(ValueError):
+            sk.verifying_key.verifier(sk.sign(b"data"))
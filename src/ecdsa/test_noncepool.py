@@ -0,0 +1,277 @@
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+import os
+import gc
+import time
+import pickle
+import weakref
+import threading
+import hashlib
+import pytest
+
+from .curves import NIST256p, SECP256k1, Ed25519
+from .keys import SigningKey
+from .noncepool import NoncePool
+from .ecdsa import nonce_pairs
+from .util import PRNG, sigencode_der, sigdecode_der
+from . import keys
+
+
+def wait_for(condition, timeout=30):
+    end = time.time() + timeout
+    while not condition():
+        if time.time() > end:  # pragma: no cover
+            raise AssertionError("Timeout")
+        time.sleep(0.01)
+
+
+class TestNoncePool(unittest.TestCase):
+    def setUp(self):
+        self.sk = SigningKey.from_secret_exponent(12345, NIST256p)
+
+    def test_fill_and_take(self):
+        pool = NoncePool(NIST256p, size=4, background=False)
+
+        self.assertEqual(len(pool), 0)
+        self.assertEqual(pool.fill(), 4)
+        pair = pool.take()
+
+        self.assertEqual(len(pool), 3)
+        r, k_inv = pair
+        k = pow(k_inv, NIST256p.order - 2, NIST256p.order)
+        self.assertEqual((NIST256p.generator * k).x() % NIST256p.order, r)
+
+    def test_fill_count(self):
+        pool = NoncePool(NIST256p, size=4, background=False)
+
+        self.assertEqual(pool.fill(2), 2)
+        self.assertEqual(pool.fill(10), 4)
+
+    def test_pairs_are_used_once(self):
+        pool = NoncePool(NIST256p, size=8, background=False)
+        pool.fill()
+
+        pairs = [pool.take() for _ in range(8)]
+
+        self.assertEqual(len(set(pairs)), 8)
+        self.assertIsNone(pool.take())
+
+    def test_deterministic_entropy(self):
+        pool = NoncePool(
+            NIST256p, size=2, entropy=PRNG(b"seed"), background=False
+        )
+        pool.fill()
+        prng = PRNG(b"seed")
+        ks = [keys.randrange(NIST256p.order, prng) for _ in range(2)]
+
+        self.assertEqual(
+            [pool.take(), pool.take()],
+            nonce_pairs(NIST256p.generator, ks),
+        )
+
+    def test_stats(self):
+        pool = NoncePool(NIST256p, size=2, low_water=1, background=False)
+        pool.fill()
+        pool.take()
+        pool.take()
+        pool.take()
+
+        self.assertEqual(
+            pool.stats(),
+            {
+                "depth": 0,
+                "size": 2,
+                "low_water": 1,
+                "generated": 2,
+                "taken": 2,
+                "misses": 1,
+                "refills": 0,
+            },
+        )
+
+    def test_background_fill(self):
+        pool = NoncePool(NIST256p, size=4, low_water=2)
+        try:
+            wait_for(lambda: len(pool) == 4)
+            for _ in range(2):
+                self.assertIsNotNone(pool.take())
+
+            wait_for(lambda: len(pool) == 4)
+            stats = pool.stats()
+        finally:
+            pool.close()
+
+        self.assertEqual(stats["refills"], 2)
+        self.assertEqual(stats["generated"], 6)
+        self.assertEqual(len(pool), 0)
+
+    def test_close(self):
+        pool = NoncePool(NIST256p, size=2)
+        pool.close()
+
+        self.assertFalse(pool._thread.is_alive())
+        self.assertEqual(len(pool), 0)
+
+    def test_unclosed_pool_is_garbage_collected(self):
+        pool = NoncePool(NIST256p, size=2)
+        wait_for(lambda: len(pool) == 2)
+        thread = pool._thread
+        ref = weakref.ref(pool)
+
+        del pool
+        gc.collect()
+
+        self.assertIsNone(ref())
+        thread.join(30)
+        self.assertFalse(thread.is_alive())
+
+    def test_fork_empties_pool(self):
+        pool = NoncePool(NIST256p, size=2, background=False)
+        pool.fill()
+        pid = os.getpid()
+        pool._pid = pid + 1
+
+        self.assertIsNone(pool.take())
+        self.assertEqual(pool.stats()["misses"], 1)
+        self.assertEqual(pool._pid, pid)
+
+    def test_fork_restarts_background_thread(self):
+        pool = NoncePool(NIST256p, size=2)
+        try:
+            wait_for(lambda: len(pool) == 2)
+            thread = pool._thread
+            pool._pid = os.getpid() + 1
+
+            pool.take()
+            self.assertIsNot(pool._thread, thread)
+            wait_for(lambda: len(pool) == 2)
+        finally:
+            pool.close()
+
+    def test_fork_restarts_background_thread_once(self):
+        pool = NoncePool(NIST256p, size=2, background=False)
+        pool._background = True
+        starts = []
+        pool._start = lambda: starts.append(1)
+        reset = pool._reset
+
+        def slow_reset():
+            time.sleep(0.1)
+            reset()
+
+        pool._reset = slow_reset
+        pool._pid = os.getpid() + 1
+        threads = [threading.Thread(target=pool.take) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(starts, [1])
+        self.assertEqual(pool._pid, os.getpid())
+
+    def test_invalid_parameters(self):
+        with self.assertRaises(ValueError):
+            NoncePool(Ed25519)
+        with self.assertRaises(ValueError):
+            NoncePool(NIST256p, size=0)
+        with self.assertRaises(ValueError):
+            NoncePool(NIST256p, size=2, low_water=2)
+        with self.assertRaises(ValueError):
+            NoncePool(NIST256p, batch_size=0)
+
+    def test_sign_with_pool(self):
+        pool = NoncePool(NIST256p, size=2, background=False)
+        pool.fill()
+        self.sk.nonce_pool = pool
+
+        sig = self.sk.sign(b"message")
+        sig2 = self.sk.sign_digest(hashlib.sha256(b"message").digest())
+        r, s = self.sk.sign_ints(1234)
+
+        self.assertEqual(len(pool), 0)
+        self.assertEqual(pool.stats()["taken"], 2)
+        self.assertTrue(self.sk.verifying_key.verify(sig, b"message"))
+        self.assertTrue(
+            self.sk.verifying_key.verify_digest(
+                sig2, hashlib.sha256(b"message").digest()
+            )
+        )
+        self.assertTrue(self.sk.verifying_key.verify_ints(1234, r, s))
+
+    def test_sign_with_explicit_entropy_skips_pool(self):
+        pool = NoncePool(NIST256p, size=2, background=False)
+        pool.fill()
+        self.sk.nonce_pool = pool
+
+        self.sk.sign(b"message", entropy=PRNG(b"seed"))
+        self.sk.sign_number(1, k=12)
+        self.sk.sign_ints(1, PRNG(b"seed"))
+        self.sk.sign_deterministic(b"message")
+
+        self.assertEqual(len(pool), 2)
+
+    def test_sign_der_with_pool(self):
+        self.sk.nonce_pool = NoncePool(NIST256p, size=2, background=False)
+        self.sk.nonce_pool.fill()
+        vk = self.sk.verifying_key
+
+        sigs = [self.sk.sign(b"msg", sigencode=sigencode_der)]
+        sigs.append(self.sk.sign(b"msg", sigencode=sigencode_der))
+
+        self.assertNotEqual(sigs[0], sigs[1])
+        for sig in sigs:
+            self.assertTrue(vk.verify(sig, b"msg", sigdecode=sigdecode_der))
+
+    def test_pool_for_different_curve(self):
+        with self.assertRaises(ValueError):
+            self.sk.nonce_pool = NoncePool(SECP256k1, background=False)
+
+    def test_pool_is_not_pickled(self):
+        self.sk.nonce_pool = NoncePool(NIST256p, size=2, background=False)
+
+        sk = pickle.loads(pickle.dumps(self.sk))
+
+        self.assertIsNone(sk.nonce_pool)
+        self.assertEqual(sk, self.sk)
+
+
+def test_zero_s_takes_next_pair(monkeypatch):
+    sk = SigningKey.from_secret_exponent(12345, NIST256p)
+    n = NIST256p.order
+    pool = NoncePool(NIST256p, size=2, background=False)
+    r, k_inv = nonce_pairs(NIST256p.generator, [7])[0]
+    pool._pairs.extend([(r, k_inv), (r, k_inv)])
+    sk.nonce_pool = pool
+    # with e == -r * secexp the s is zero
+    e = (-r * 12345) % n
+    monkeypatch.setattr(keys, "randrange", lambda order, entropy: 8)
+
+    r2, s2 = sk.sign_ints(e)
+
+    assert len(pool) == 0
+    assert r2 == (NIST256p.generator * 8).x() % n
+    assert sk.verifying_key.verify_ints(e, r2, s2)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork()")
+def test_fork_does_not_reuse_nonces():
+    pool = NoncePool(NIST256p, size=2, background=False)
+    pool.fill()
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover
+        try:
+            os.write(write_fd, b"1" if pool.take() is None else b"0")
+        finally:
+            os._exit(0)
+    os.close(write_fd)
+    os.waitpid(pid, 0)
+    result = os.read(read_fd, 1)
+    os.close(read_fd)
+
+    assert result == b"1"
+    assert len(pool) == 2
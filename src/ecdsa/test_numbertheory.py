@@ -23,6 +23,7 @@ from .numbertheory import (
     lcm,
     jacobi,
     inverse_mod,
+    inverse_mod_many,
     is_prime,
     next_prime,
     smallprimes,
@@ -431,3 +432,12 @@ class TestNumbertheory(unittest.TestCase):
 
     def test_inverse_mod_with_zero(self):
         assert 0 == inverse_mod(0, 11)
+
+    @given(st.lists(st.integers(min_value=0, max_value=2 * 1009)))
+    def test_inverse_mod_many(self, nums):
+        invs = inverse_mod_many(nums, 1009)
+
+        assert invs == [inverse_mod(i % 1009, 1009) for i in nums]
+
+    def test_inverse_mod_many_with_empty_list(self):
+        assert inverse_mod_many([], 11) == []
@@ -0,0 +1,763 @@
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+import os
+import sys
+import shutil
+import tempfile
+import pytest
+
+from .ellipticcurve import PointJacobi, PointEdwards
+from .curves import (
+    Curve,
+    curves,
+    NIST256p,
+    NIST521p,
+    SECP112r1,
+    Ed25519,
+    Ed448,
+)
+from .precompute import (
+    TABLE_FORMAT_VERSION,
+    TableFormatError,
+    dump_table,
+    load_table,
+    add_table_store,
+    remove_table_store,
+    PrebuiltTables,
+    write_tables,
+    WarmupFuture,
+    warmup,
+    PackedTable,
+    pack_table,
+    set_packed_tables,
+    pack_tables,
+    SharedTables,
+    DiskTableCache,
+)
+from .keys import SigningKey, VerifyingKey
+from . import ellipticcurve
+import ecdsa
+
+
+def fresh_generator(curve):
+    gen = curve.generator
+    if isinstance(gen, PointEdwards):
+        return PointEdwards(
+            gen.curve(),
+            gen.x(),
+            gen.y(),
+            1,
+            gen.x() * gen.y() % gen.curve().p(),
+            gen.order(),
+            True,
+        )
+    return PointJacobi(gen.curve(), gen.x(), gen.y(), 1, gen.order(), True)
+
+
+class FixedStore(object):
+    def __init__(self, table):
+        self.table = table
+
+    def get(self, point):
+        return self.table
+
+    def put(self, point, table):
+        pass
+
+
+class CountingStore(object):
+    def __init__(self, store=None):
+        self.store = store
+        self.gets = 0
+        self.puts = 0
+
+    def get(self, point):
+        self.gets += 1
+        if self.store:
+            return self.store.get(point)
+        return None
+
+    def put(self, point, table):
+        self.puts += 1
+        if self.store:
+            self.store.put(point, table)
+
+
+@pytest.mark.parametrize("curve", curves, ids=[i.name for i in curves])
+def test_dump_and_load_table(curve):
+    gen = fresh_generator(curve)
+    table = gen._maybe_precompute()
+
+    data = dump_table(gen, table)
+
+    assert load_table(gen, data) == table
+
+
+class TestTableFormat(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.gen = fresh_generator(NIST256p)
+        cls.table = cls.gen._maybe_precompute()
+        cls.data = dump_table(cls.gen, cls.table)
+
+    def test_loaded_table_is_usable(self):
+        gen = PointJacobi.from_affine(NIST256p.generator)
+        table = load_table(gen, self.data)
+        store = CountingStore()
+        store.get = lambda point: table
+        add_table_store(store, first=True)
+        try:
+            point = fresh_generator(NIST256p)
+            self.assertEqual(point * 12345, NIST256p.generator * 12345)
+            self.assertIs(point._PointJacobi__precompute, table)
+        finally:
+            remove_table_store(store)
+
+    def test_version(self):
+        self.assertEqual(bytearray(self.data)[8], TABLE_FORMAT_VERSION)
+
+    def test_unsupported_version(self):
+        data = bytearray(self.data)
+        data[8] = TABLE_FORMAT_VERSION + 1
+
+        with self.assertRaises(TableFormatError) as e:
+            load_table(self.gen, bytes(data))
+
+        self.assertIn("version", str(e.exception))
+
+    def test_wrong_magic(self):
+        data = bytearray(self.data)
+        data[0] ^= 0xFF
+
+        with self.assertRaises(TableFormatError):
+            load_table(self.gen, bytes(data))
+
+    def test_corrupted_table(self):
+        data = bytearray(self.data)
+        data[100] ^= 0x01
+
+        with self.assertRaises(TableFormatError) as e:
+            load_table(self.gen, bytes(data))
+
+        self.assertIn("Checksum", str(e.exception))
+
+    def test_truncated_table(self):
+        with self.assertRaises(TableFormatError):
+            load_table(self.gen, self.data[:-1])
+
+    def test_too_short_table(self):
+        with self.assertRaises(TableFormatError):
+            load_table(self.gen, self.data[:20])
+
+    def test_different_point(self):
+        with self.assertRaises(TableFormatError):
+            load_table(NIST256p.generator * 2, self.data)
+
+    def test_different_curve(self):
+        with self.assertRaises(TableFormatError):
+            load_table(NIST521p.generator, self.data)
+
+    def test_edwards_table_for_weierstrass_point(self):
+        gen = fresh_generator(Ed25519)
+        data = dump_table(gen, gen._maybe_precompute())
+
+        with self.assertRaises(TableFormatError):
+            load_table(self.gen, data)
+
+    def test_remove_unknown_store(self):
+        with self.assertRaises(ValueError):
+            remove_table_store(CountingStore())
+
+
+class TestPrebuiltTables(unittest.TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def test_write_tables(self):
+        write_tables(self.path, [NIST256p, Ed448])
+
+        self.assertEqual(
+            sorted(os.listdir(self.path)), ["Ed448.tbl", "NIST256p.tbl"]
+        )
+
+    def test_write_tables_creates_directory(self):
+        path = os.path.join(self.path, "tables")
+
+        write_tables(path, [SECP112r1])
+
+        self.assertEqual(os.listdir(path), ["SECP112r1.tbl"])
+
+    def test_get_weierstrass(self):
+        write_tables(self.path, [NIST256p])
+        store = PrebuiltTables(self.path)
+        gen = fresh_generator(NIST256p)
+
+        table = store.get(gen)
+
+        self.assertEqual(table, NIST256p.generator._maybe_precompute())
+
+    def test_get_edwards(self):
+        write_tables(self.path, [Ed25519])
+        store = PrebuiltTables(self.path)
+        gen = fresh_generator(Ed25519)
+
+        table = store.get(gen)
+
+        self.assertEqual(table, Ed25519.generator._maybe_precompute())
+
+    def test_get_for_point_that_is_not_a_generator(self):
+        write_tables(self.path, [NIST256p])
+        store = PrebuiltTables(self.path)
+        point = PointJacobi.from_affine(NIST256p.generator * 2, True)
+
+        self.assertIsNone(store.get(point))
+
+    def test_missing_file(self):
+        store = PrebuiltTables(self.path)
+
+        self.assertIsNone(store.get(fresh_generator(NIST256p)))
+
+    def test_corrupted_file(self):
+        write_tables(self.path, [NIST256p])
+        file_name = os.path.join(self.path, "NIST256p.tbl")
+        with open(file_name, "rb") as table_file:
+            data = bytearray(table_file.read())
+        data[-1] ^= 0xFF
+        with open(file_name, "wb") as table_file:
+            table_file.write(data)
+        store = PrebuiltTables(self.path)
+
+        self.assertIsNone(store.get(fresh_generator(NIST256p)))
+
+    def test_table_for_different_curve(self):
+        write_tables(self.path, [SECP112r1])
+        os.rename(
+            os.path.join(self.path, "SECP112r1.tbl"),
+            os.path.join(self.path, "NIST256p.tbl"),
+        )
+        store = PrebuiltTables(self.path)
+
+        self.assertIsNone(store.get(fresh_generator(NIST256p)))
+
+    def test_used_for_precomputation(self):
+        write_tables(self.path, [NIST256p])
+        store = CountingStore(PrebuiltTables(self.path))
+        add_table_store(store, first=True)
+        try:
+            gen = fresh_generator(NIST256p)
+            self.assertEqual(gen * 12345, NIST256p.generator * 12345)
+        finally:
+            remove_table_store(store)
+
+        self.assertEqual(store.gets, 1)
+        self.assertEqual(store.puts, 0)
+
+    def test_fallback_to_calculation(self):
+        store = CountingStore(PrebuiltTables(self.path))
+        add_table_store(store, first=True)
+        try:
+            gen = fresh_generator(NIST256p)
+            self.assertEqual(gen * 12345, NIST256p.generator * 12345)
+        finally:
+            remove_table_store(store)
+
+        self.assertEqual(store.gets, 1)
+        self.assertEqual(store.puts, 1)
+        self.assertTrue(gen._PointJacobi__precompute)
+
+    def test_installed_by_default(self):
+        self.assertTrue(
+            any(
+                isinstance(i, PrebuiltTables)
+                for i in ellipticcurve._precompute_stores
+            )
+        )
+
+
+class TestWarmup(unittest.TestCase):
+    def setUp(self):
+        self.curves = [
+            Curve("fresh " + i.name, i.curve, fresh_generator(i), None)
+            for i in (NIST256p, Ed25519)
+        ]
+
+    def test_background(self):
+        progress = []
+
+        future = warmup(
+            self.curves, progress=lambda *args: progress.append(args)
+        )
+
+        self.assertEqual(future.result(), 2)
+        self.assertTrue(future.done())
+        self.assertIsNone(future.exception())
+        self.assertEqual(progress, [(1, 2), (2, 2)])
+        self.assertTrue(self.curves[0].generator._PointJacobi__precompute)
+        self.assertTrue(self.curves[1].generator._PointEdwards__precompute)
+        self.assertEqual(ellipticcurve._precompute_deferred, {})
+
+    def test_foreground(self):
+        future = warmup(self.curves, background=False)
+
+        self.assertTrue(future.done())
+        self.assertEqual(future.result(), 2)
+        self.assertTrue(self.curves[0].generator._PointJacobi__precompute)
+
+    def test_default_curves(self):
+        future = warmup(background=False)
+
+        self.assertEqual(future.result(), len(curves))
+
+    def test_keys(self):
+        sk = SigningKey.from_secret_exponent(12345, NIST256p)
+        vk = VerifyingKey.from_string(sk.verifying_key.to_string(), NIST256p)
+        sig = sk.sign(b"message")
+
+        future = warmup([], [vk])
+
+        self.assertEqual(future.result(), 1)
+        point = vk.pubkey.point
+        self.assertTrue(point._is_generator())
+        self.assertTrue(point._PointJacobi__precompute)
+        self.assertTrue(vk.verify(sig, b"message"))
+
+    def test_precomputed_keys_keep_their_tables(self):
+        vk = SigningKey.from_secret_exponent(12345, NIST256p).verifying_key
+        vk.precompute()
+        point = vk.pubkey.point
+        table = point._PointJacobi__precompute
+
+        warmup([], [vk]).result()
+
+        self.assertIs(vk.pubkey.point, point)
+        self.assertIs(point._PointJacobi__precompute, table)
+
+    def test_deferred_points_use_slow_path(self):
+        gen = self.curves[0].generator
+        ellipticcurve._precompute_deferred[id(gen)] = gen
+        try:
+            self.assertEqual(gen * 12345, NIST256p.generator * 12345)
+            self.assertEqual(gen._PointJacobi__precompute, [])
+        finally:
+            del ellipticcurve._precompute_deferred[id(gen)]
+
+    def test_point_with_reused_id_is_not_deferred(self):
+        gen = self.curves[0].generator
+        other = fresh_generator(NIST256p)
+        # simulate a deferred point that was freed and its id() reused
+        ellipticcurve._precompute_deferred[id(gen)] = other
+        try:
+            self.assertEqual(gen * 12345, NIST256p.generator * 12345)
+            self.assertTrue(gen._PointJacobi__precompute)
+        finally:
+            del ellipticcurve._precompute_deferred[id(gen)]
+
+    def test_failure(self):
+        def progress(done, total):
+            raise ValueError("failed")
+
+        future = warmup(self.curves, progress=progress)
+
+        self.assertIsInstance(future.exception(), ValueError)
+        with self.assertRaises(ValueError):
+            future.result()
+        self.assertEqual(ellipticcurve._precompute_deferred, {})
+
+    def test_failure_in_foreground(self):
+        def progress(done, total):
+            raise ValueError("failed")
+
+        with self.assertRaises(ValueError):
+            warmup(self.curves, background=False, progress=progress)
+
+    def test_timeout(self):
+        future = WarmupFuture()
+
+        self.assertFalse(future.wait(0.01))
+        with self.assertRaises(RuntimeError):
+            future.result(0.01)
+
+    def test_exported_from_package(self):
+        self.assertIs(ecdsa.warmup, warmup)
+
+
+class TestSharedTables(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.data = pack_tables([NIST256p.generator, Ed25519.generator])
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def check_store(self, store):
+        for curve in (NIST256p, Ed25519):
+            gen = fresh_generator(curve)
+            table = store.get(gen)
+            self.assertIsInstance(table, PackedTable)
+            self.assertEqual(list(table), curve.generator._maybe_precompute())
+
+    def test_from_bytes(self):
+        self.check_store(SharedTables(self.data))
+
+    def test_from_file(self):
+        file_name = os.path.join(self.path, "tables")
+        with open(file_name, "wb") as tables_file:
+            tables_file.write(self.data)
+
+        store = SharedTables.from_file(file_name)
+
+        self.check_store(store)
+
+    @pytest.mark.skipif(
+        sys.version_info < (3, 8), reason="requires shared_memory"
+    )
+    def test_from_shared_memory(self):
+        from multiprocessing import shared_memory
+
+        shm = shared_memory.SharedMemory(create=True, size=len(self.data))
+        try:
+            shm.buf[: len(self.data)] = self.data
+            store = SharedTables(shm.buf[: len(self.data)])
+            self.check_store(store)
+            del store
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def test_multiplication_with_packed_tables(self):
+        store = SharedTables(self.data)
+        add_table_store(store, first=True)
+        try:
+            gen = fresh_generator(NIST256p)
+            ed_gen = fresh_generator(Ed25519)
+            self.assertEqual(gen * 12345, NIST256p.generator * 12345)
+            self.assertEqual(ed_gen * 12345, Ed25519.generator * 12345)
+        finally:
+            remove_table_store(store)
+
+        self.assertIsInstance(gen._PointJacobi__precompute, PackedTable)
+        self.assertIsInstance(ed_gen._PointEdwards__precompute, PackedTable)
+
+    def test_unknown_point(self):
+        store = SharedTables(self.data)
+
+        self.assertIsNone(store.get(fresh_generator(NIST521p)))
+
+    def test_corrupted_table(self):
+        data = bytearray(self.data)
+        data[-1] ^= 0xFF
+        store = SharedTables(bytes(data))
+
+        self.assertIsNone(store.get(fresh_generator(Ed25519)))
+        self.assertIsNotNone(store.get(fresh_generator(NIST256p)))
+
+    def test_truncated_buffer(self):
+        store = SharedTables(self.data[:-100])
+
+        self.assertIsNone(store.get(fresh_generator(Ed25519)))
+
+    def test_truncated_index(self):
+        with self.assertRaises(TableFormatError):
+            SharedTables(self.data[:20])
+
+    def test_too_short(self):
+        with self.assertRaises(TableFormatError):
+            SharedTables(self.data[:5])
+
+    def test_wrong_magic(self):
+        with self.assertRaises(TableFormatError):
+            SharedTables(b"\x00" + self.data[1:])
+
+    def test_unsupported_version(self):
+        data = bytearray(self.data)
+        data[8] = TABLE_FORMAT_VERSION + 1
+
+        with self.assertRaises(TableFormatError):
+            SharedTables(bytes(data))
+
+    def test_put_is_ignored(self):
+        store = SharedTables(self.data)
+
+        store.put(NIST521p.generator, [])
+
+        self.assertIsNone(store.get(NIST521p.generator))
+
+
+class TestPackedTable(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.table = NIST256p.generator._maybe_precompute()
+        data = pack_tables([NIST256p.generator])
+        cls.packed = SharedTables(data).get(NIST256p.generator)
+
+    def test_len(self):
+        self.assertEqual(len(self.packed), len(self.table))
+
+    def test_getitem(self):
+        self.assertEqual(self.packed[0], self.table[0])
+        self.assertEqual(self.packed[5], self.table[5])
+        self.assertEqual(self.packed[-1], self.table[-1])
+
+    def test_getitem_out_of_range(self):
+        with self.assertRaises(IndexError):
+            self.packed[len(self.table)]
+        with self.assertRaises(IndexError):
+            self.packed[-len(self.table) - 1]
+
+    def test_iter(self):
+        self.assertEqual(list(self.packed), self.table)
+
+
+class TestPackedTables(unittest.TestCase):
+    def tearDown(self):
+        set_packed_tables(False)
+
+    def test_pack_table(self):
+        table = NIST256p.generator._maybe_precompute()
+
+        packed = pack_table(NIST256p.generator, table)
+
+        self.assertIsInstance(packed, PackedTable)
+        self.assertEqual(list(packed), table)
+
+    def test_pack_edwards_table(self):
+        table = Ed448.generator._maybe_precompute()
+
+        packed = pack_table(Ed448.generator, table)
+
+        self.assertEqual(list(packed), table)
+
+    def test_disabled_by_default(self):
+        gen = fresh_generator(NIST256p)
+
+        self.assertIsInstance(gen._maybe_precompute(), list)
+
+    def test_calculated_tables(self):
+        set_packed_tables()
+        for curve in (NIST256p, Ed25519):
+            gen = fresh_generator(curve)
+
+            table = gen._maybe_precompute()
+
+            self.assertIsInstance(table, PackedTable)
+            self.assertEqual(gen * 12345, curve.generator * 12345)
+
+    def test_loaded_tables(self):
+        table = NIST256p.generator._maybe_precompute()
+        store = CountingStore(FixedStore(table))
+        add_table_store(store, first=True)
+        try:
+            set_packed_tables(True)
+            gen = fresh_generator(NIST256p)
+
+            packed = gen._maybe_precompute()
+        finally:
+            remove_table_store(store)
+
+        self.assertEqual(store.gets, 1)
+        self.assertIsInstance(packed, PackedTable)
+        self.assertEqual(list(packed), table)
+
+    def test_disable(self):
+        set_packed_tables(True)
+        set_packed_tables(False)
+        gen = fresh_generator(NIST256p)
+
+        self.assertIsInstance(gen._maybe_precompute(), list)
+
+    def test_signing_with_packed_tables(self):
+        set_packed_tables(True)
+        sk = SigningKey.from_secret_exponent(12345, NIST256p)
+        vk = VerifyingKey.from_string(sk.verifying_key.to_string(), NIST256p)
+        vk.precompute()
+        sig = sk.sign(b"message")
+
+        self.assertIsInstance(
+            vk.pubkey.point._PointJacobi__precompute, PackedTable
+        )
+        self.assertTrue(vk.verify(sig, b"message"))
+
+
+class TestDiskTableCache(unittest.TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def key_point(self, secexp, curve=NIST256p):
+        if curve is Ed25519:
+            sk = SigningKey.from_string(
+                bytes(bytearray([secexp % 256] * 32)), curve
+            )
+        else:
+            sk = SigningKey.from_secret_exponent(secexp, curve)
+        vk = sk.verifying_key
+        vk.precompute(lazy=True)
+        return vk.pubkey.point
+
+    def tables(self):
+        return sorted(i for i in os.listdir(self.path) if i.endswith(".tbl"))
+
+    def test_creates_directory(self):
+        path = os.path.join(self.path, "cache")
+
+        DiskTableCache(path)
+
+        self.assertTrue(os.path.isdir(path))
+
+    @unittest.skipUnless(hasattr(os, "getuid"), "POSIX permissions only")
+    def test_creates_private_directory(self):
+        path = os.path.join(self.path, "cache")
+
+        DiskTableCache(path)
+
+        self.assertEqual(os.stat(path).st_mode & 0o077, 0)
+
+    @unittest.skipUnless(hasattr(os, "getuid"), "POSIX permissions only")
+    def test_rejects_world_writable_directory(self):
+        os.chmod(self.path, 0o777)
+
+        with self.assertRaises(ValueError) as e:
+            DiskTableCache(self.path)
+
+        self.assertIn("writable", str(e.exception))
+
+    @unittest.skipUnless(hasattr(os, "getuid"), "POSIX permissions only")
+    def test_rejects_group_writable_directory(self):
+        os.chmod(self.path, 0o770)
+
+        with self.assertRaises(ValueError):
+            DiskTableCache(self.path)
+
+    def test_put_and_get(self):
+        cache = DiskTableCache(self.path)
+        point = self.key_point(12345)
+        table = point._maybe_precompute()
+
+        cache.put(point, table)
+
+        self.assertEqual(len(self.tables()), 1)
+        self.assertEqual(cache.get(self.key_point(12345)), table)
+        self.assertIsNone(cache.get(self.key_point(12346)))
+
+    def test_put_replaces_existing_table(self):
+        cache = DiskTableCache(self.path)
+        point = self.key_point(12345)
+        table = point._maybe_precompute()
+        cache.put(point, table)
+        # a table written by a different process in the meantime
+        cache2 = DiskTableCache(self.path)
+
+        cache2.put(self.key_point(12345), table)
+
+        self.assertEqual(os.listdir(self.path), self.tables())
+        self.assertEqual(len(self.tables()), 1)
+        self.assertEqual(cache.get(self.key_point(12345)), table)
+
+    def test_packed(self):
+        cache = DiskTableCache(self.path, packed=True)
+        point = self.key_point(12345, Ed25519)
+        table = point._maybe_precompute()
+        cache.put(point, table)
+
+        loaded = cache.get(self.key_point(12345, Ed25519))
+
+        self.assertIsInstance(loaded, PackedTable)
+        self.assertEqual(list(loaded), table)
+
+    def test_used_after_restart(self):
+        sk = SigningKey.from_secret_exponent(12345, NIST256p)
+        sig = sk.sign(b"message")
+        encoding = sk.verifying_key.to_string()
+        store = CountingStore(DiskTableCache(self.path))
+        add_table_store(store, first=True)
+        try:
+            vk = VerifyingKey.from_string(encoding, NIST256p)
+            vk.precompute()
+            self.assertEqual(store.puts, 1)
+
+            vk = VerifyingKey.from_string(encoding, NIST256p)
+            vk.precompute()
+            self.assertTrue(vk.verify(sig, b"message"))
+        finally:
+            remove_table_store(store)
+
+        self.assertEqual(store.puts, 1)
+        self.assertEqual(store.gets, 2)
+        self.assertTrue(vk.pubkey.point._PointJacobi__precompute)
+
+    def test_corrupted_file_is_removed(self):
+        cache = DiskTableCache(self.path)
+        point = self.key_point(12345)
+        cache.put(point, point._maybe_precompute())
+        file_name = os.path.join(self.path, self.tables()[0])
+        with open(file_name, "r+b") as table_file:
+            table_file.seek(100)
+            table_file.write(b"\xff\xff")
+
+        self.assertIsNone(cache.get(point))
+        self.assertEqual(self.tables(), [])
+
+    def test_empty_file(self):
+        cache = DiskTableCache(self.path, packed=True)
+        point = self.key_point(12345)
+        cache.put(point, point._maybe_precompute())
+        file_name = os.path.join(self.path, self.tables()[0])
+        open(file_name, "wb").close()
+
+        self.assertIsNone(cache.get(point))
+
+    def test_eviction(self):
+        point = self.key_point(1)
+        table_size = len(dump_table(point, point._maybe_precompute()))
+        cache = DiskTableCache(self.path, max_size=table_size * 2)
+        points = [point, self.key_point(2), self.key_point(3)]
+        cache.put(points[0], points[0]._maybe_precompute())
+        cache.put(points[1], points[1]._maybe_precompute())
+        # make the first table recently used
+        for i, name in enumerate(self.tables()):
+            os.utime(os.path.join(self.path, name), (1000 + i, 1000 + i))
+        cache.get(points[0])
+        first = os.path.basename(cache._file_name(points[0]))
+
+        cache.put(points[2], points[2]._maybe_precompute())
+
+        self.assertEqual(len(self.tables()), 2)
+        self.assertIn(first, self.tables())
+        self.assertIsNone(cache.get(points[1]))
+        self.assertIsNotNone(cache.get(points[2]))
+
+    def test_table_over_size_limit(self):
+        cache = DiskTableCache(self.path, max_size=100)
+        point = self.key_point(1)
+
+        cache.put(point, point._maybe_precompute())
+
+        self.assertEqual(os.listdir(self.path), [])
+
+
+def test_explicit_precompute_is_not_deferred(monkeypatch):
+    vk = SigningKey.from_secret_exponent(12345, NIST256p).verifying_key
+    calls = []
+    maybe_precompute = PointJacobi._maybe_precompute
+
+    def _maybe_precompute(self, force=False):
+        calls.append(force)
+        return maybe_precompute(self, force)
+
+    monkeypatch.setattr(PointJacobi, "_maybe_precompute", _maybe_precompute)
+
+    vk.precompute()
+
+    assert calls == [True]
+    assert vk.pubkey.point._PointJacobi__precompute
@@ -10,6 +10,8 @@ import shutil
 import subprocess
 import pytest
 from binascii import hexlify, unhexlify
+import hmac
+import struct
 import hashlib
 from functools import partial
 
@@ -1827,6 +1829,192 @@ class Util(unittest.TestCase):
             n = util.randrange(order, entropy=entropy)
             self.assertTrue(1 <= n < order, (1, n, order))
 
+    @given(st.integers(min_value=0, max_value=10**200))
+    def test_randrange_uses_most_significant_bits(self, i):
+        for order in (2**8 - 2, 2**16 + 1, NIST256p.order, 2**521 - 1):
+            ent = util.PRNG("seed-%d" % i)(util.bit_length(order - 2) // 8 + 1)
+            bits = util.entropy_to_bits(ent)[: util.bit_length(order - 2)]
+            expected = int(bits, 2) + 1
+            if expected >= order:
+                continue
+
+            self.assertEqual(
+                util.randrange(order, lambda n: ent[:n]), expected
+            )
+
+    def test_randrange_many(self):
+        for order in (2**8 - 2, 2**8 - 1, 2**16 + 1, NIST256p.order):
+            entropy = util.PRNG("seed")
+            expected = [util.randrange(order, entropy) for _ in range(20)]
+
+            entropy = util.PRNG("seed")
+            self.assertEqual(util.randrange_many(order, 20, entropy), expected)
+            # the same amount of entropy was used
+            self.assertEqual(
+                util.randrange(order, entropy),
+                util.randrange_many(order, 21, util.PRNG("seed"))[20],
+            )
+
+    def test_randrange_many_with_default_entropy(self):
+        nums = util.randrange_many(2**8 - 1, 100)
+
+        self.assertEqual(len(nums), 100)
+        self.assertTrue(all(1 <= i < 2**8 - 1 for i in nums))
+        self.assertEqual(util.randrange_many(5, 0), [])
+
+    def test_entropy_pool(self):
+        pool = util.EntropyPool(64)
+
+        data = [pool(20) for _ in range(10)]
+
+        self.assertEqual([len(i) for i in data], [20] * 10)
+        self.assertEqual(len(set(data)), 10)
+        self.assertEqual(len(pool(100)), 100)
+        self.assertEqual(pool(0), b"")
+
+    def test_entropy_pool_reads_in_blocks(self):
+        reads = []
+        old_urandom = os.urandom
+
+        def urandom(n):
+            reads.append(n)
+            return old_urandom(n)
+
+        pool = util.EntropyPool(100)
+        util.os.urandom = urandom
+        try:
+            data = b"".join(pool(33) for _ in range(6))
+        finally:
+            util.os.urandom = old_urandom
+
+        self.assertEqual(reads, [100, 100])
+        self.assertEqual(len(data), 33 * 6)
+
+    def test_entropy_pool_after_fork(self):
+        pool = util.EntropyPool(100)
+        first = pool(10)
+        buf = pool._buffer
+        pool._pid = os.getpid() + 1
+
+        second = pool(10)
+
+        self.assertIsNot(pool._buffer, buf)
+        self.assertNotEqual(first, second)
+        self.assertEqual(pool._pid, os.getpid())
+
+    def test_entropy_pool_with_invalid_size(self):
+        with self.assertRaises(ValueError):
+            util.EntropyPool(0)
+
+    def test_keys_with_entropy_pool(self):
+        pool = util.EntropyPool()
+        sk = SigningKey.generate(NIST256p, entropy=pool)
+
+        sig = sk.sign(b"message", entropy=pool)
+
+        self.assertTrue(sk.verifying_key.verify(sig, b"message"))
+
+    def test_PRNG_matches_block_generator(self):
+        for seed in ("seed", b("seed"), 12):
+            prng = util.PRNG(seed)
+            blocks = prng.block_generator(seed)
+            expected = bytearray(next(blocks) for _ in range(200))
+
+            data = b("").join(prng(i) for i in (0, 1, 31, 33, 64, 71))
+
+            self.assertEqual(bytearray(data), expected)
+
+    def test_CounterKDF(self):
+        kdf = util.CounterKDF(b("seed"), b("label"))
+        expected = b("").join(
+            hmac.new(
+                b("seed"),
+                struct.pack(">Q", i) + b("label"),
+                hashlib.sha256,
+            ).digest()
+            for i in (1, 2, 3)
+        )
+
+        self.assertEqual(kdf(10) + kdf(0) + kdf(50) + kdf(36), expected)
+
+    def test_CounterKDF_with_long_seed(self):
+        seed = b("s") * 200
+
+        self.assertEqual(
+            util.CounterKDF(seed, hashmod=hashlib.sha512)(64),
+            hmac.new(seed, struct.pack(">Q", 1), hashlib.sha512).digest(),
+        )
+
+    def test_CounterKDF_with_different_seeds_and_labels(self):
+        outputs = set(
+            [
+                util.CounterKDF(b("seed"))(32),
+                util.CounterKDF(b("seed2"))(32),
+                util.CounterKDF(b("seed"), b("label"))(32),
+                util.CounterKDF(b("seed"), hashmod=hashlib.sha512)(32),
+            ]
+        )
+
+        self.assertEqual(len(outputs), 4)
+        self.assertEqual(len(util.CounterKDF(bytearray(200))(1000)), 1000)
+
+    def test_keys_from_CounterKDF(self):
+        for curve in (NIST256p, Ed25519):
+            sks = SigningKey.generate_many(
+                curve, 10, entropy=util.CounterKDF(b("seed"))
+            )
+            sks2 = SigningKey.generate_many(
+                curve, 10, entropy=util.CounterKDF(b("seed"))
+            )
+            kdf = util.CounterKDF(b("seed"))
+            expected = [
+                SigningKey.generate(curve, entropy=kdf) for _ in range(10)
+            ]
+
+            self.assertEqual(sks, sks2)
+            self.assertEqual(sks, expected)
+            self.assertEqual(len(set(i.to_string() for i in sks)), 10)
+            self.assertNotEqual(
+                sks,
+                SigningKey.generate_many(
+                    curve, 10, entropy=util.CounterKDF(b("seed"), b("label"))
+                ),
+            )
+
+    def test_lru_cache(self):
+        cache = util.LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+
+        self.assertEqual(cache.get("a"), 1)
+        cache.put("c", 3)
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("c"), 3)
+
+    def test_lru_cache_replace_value(self):
+        cache = util.LRUCache(2)
+        cache.put("a", 1)
+        cache.put("a", 2)
+
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.get("a"), 2)
+
+    def test_lru_cache_get_default_and_clear(self):
+        cache = util.LRUCache(2)
+        cache.put("a", 1)
+
+        cache.clear()
+
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.get("a", 5), 5)
+
+    def test_lru_cache_with_invalid_size(self):
+        with self.assertRaises(ValueError):
+            util.LRUCache(0)
+
     def OFF_test_prove_uniformity(self):  # pragma: no cover
         order = 2**8 - 2
         counts = dict([(i, 0) for i in range(1, order)])
@@ -1847,6 +2035,61 @@ class RFC6979(unittest.TestCase):
     def _do(self, generator, secexp, hsh, hash_func, expected):
         actual = rfc6979.generate_k(generator.order(), secexp, hash_func, hsh)
         self.assertEqual(expected, actual)
+        nonces = rfc6979.NonceGenerator(generator.order(), secexp, hash_func)
+        self.assertEqual(expected, nonces.generate_k(hsh))
+        # the generator is reusable
+        self.assertEqual(expected, nonces.generate_k(hsh))
+
+    def test_NonceGenerator_with_retries_and_extra_entropy(self):
+        # RFC 6979 doesn't include vectors for retries and extra entropy,
+        # the expected values were computed with the implementation from
+        # before the NonceGenerator was introduced
+        order = SECP256k1.generator.order()
+        nonces = rfc6979.NonceGenerator(order, 12345, hashlib.sha256)
+        vectors = [
+            (
+                b("message 0"),
+                0,
+                b"",
+                "09e5456b46940d4510d52689d335eb37d348aa6a37bb7c0d908f6ba730915a6c",
+            ),
+            (
+                b("message 0"),
+                2,
+                b"x",
+                "0ce641702d59c6b55ee98db0097e8d7d76bb2705939f94020cd01a8eb485da8b",
+            ),
+            (
+                b("message 0"),
+                1,
+                b"",
+                "b1f58ce84901de751b62ab8fde642151ef5b866b199207a51e3d1cabab7c6248",
+            ),
+            (
+                b("message 1"),
+                2,
+                b"x",
+                "2eb5dae09226b985fe1c4380df4280511acc0114f2bb780d487581f8bc2ced2b",
+            ),
+            (
+                b("message 2"),
+                1,
+                b"",
+                "8e8a76ab04acb8d96f7adbe158c2df23f53e5ddfb33c42c95aa60ce33b546b44",
+            ),
+        ]
+        for message, retry_gen, extra_entropy, expected in vectors:
+            hsh = hashlib.sha256(message).digest()
+            self.assertEqual(
+                nonces.generate_k(hsh, retry_gen, extra_entropy),
+                int(expected, 16),
+            )
+            self.assertEqual(
+                rfc6979.generate_k(
+                    order, 12345, hashlib.sha256, hsh, retry_gen, extra_entropy
+                ),
+                int(expected, 16),
+            )
 
     def test_SECP256k1(self):
         """RFC doesn't contain test vectors for SECP256k1 used in bitcoin.
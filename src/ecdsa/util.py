@@ -15,12 +15,21 @@ from __future__ import division
 
 import os
 import math
+import struct
 import binascii
+import hmac
 import sys
+import threading
 from hashlib import sha256
-from six import PY2, int2byte, b, next
+from six import int2byte, b
 from . import der
-from ._compat import normalise_bytes
+from ._compat import normalise_bytes, bytes_to_int
+
+try:
+    from collections import OrderedDict
+except ImportError:  # pragma: no cover
+    # Python 2.6
+    OrderedDict = None
 
 
 # RFC5480:
@@ -91,14 +100,88 @@ def randrange(order, entropy=None):
         entropy = os.urandom
     upper_2 = bit_length(order - 2)
     upper_256 = upper_2 // 8 + 1
+    # use the most significant upper_2 bits of the entropy
+    shift = upper_256 * 8 - upper_2
     while True:  # I don't think this needs a counter with bit-wise randrange
-        ent_256 = entropy(upper_256)
-        ent_2 = entropy_to_bits(ent_256)
-        rand_num = int(ent_2[:upper_2], base=2) + 1
-        if 0 < rand_num < order:
+        rand_num = (bytes_to_int(entropy(upper_256), "big") >> shift) + 1
+        if rand_num < order:
             return rand_num
 
 
+def randrange_many(order, count, entropy=None):
+    """Return a list of `count` random integers k such that 1 <= k < order.
+
+    Returns the same numbers as `count` calls to :func:`randrange` with
+    the same entropy source, but reads the entropy for all of them at once.
+
+    :param int order: the upper bound (exclusive) for the numbers
+    :param int count: number of integers to return
+    :param callable entropy: source of random bytes, like os.urandom
+        (the default)
+    :rtype: list(int)
+    """
+    assert order > 1
+    if entropy is None:
+        entropy = os.urandom
+    upper_2 = bit_length(order - 2)
+    upper_256 = upper_2 // 8 + 1
+    shift = upper_256 * 8 - upper_2
+    ret = []
+    while len(ret) < count:
+        ent = entropy(upper_256 * (count - len(ret)))
+        for i in range(0, len(ent), upper_256):
+            rand_num = (
+                bytes_to_int(ent[i : i + upper_256], "big") >> shift
+            ) + 1
+            if rand_num < order:
+                ret.append(rand_num)
+    return ret
+
+
+class EntropyPool(object):
+    """
+    Thread-safe source of random bytes that reads os.urandom in large
+    blocks.
+
+    Behaves like :func:`os.urandom`, so it can be passed as the `entropy`
+    parameter of key generation and signing methods, but replaces many
+    small reads of the system source with few large ones. Every byte of
+    the buffer is returned just once. After fork, the child process
+    discards the buffer inherited from the parent.
+    """
+
+    def __init__(self, buffer_size=4096):
+        """
+        :param int buffer_size: number of bytes read from os.urandom at once
+        """
+        if buffer_size < 1:
+            raise ValueError("buffer_size must be positive")
+        self.buffer_size = buffer_size
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._buffer = b""
+        self._offset = 0
+
+    def __call__(self, numbytes):
+        """Return `numbytes` random bytes."""
+        if numbytes > self.buffer_size:
+            return os.urandom(numbytes)
+        with self._lock:
+            if self._pid != os.getpid():
+                # don't return the same bytes as the parent process
+                self._pid = os.getpid()
+                self._buffer = b""
+                self._offset = 0
+            end = self._offset + numbytes
+            if end > len(self._buffer):
+                self._buffer = os.urandom(self.buffer_size)
+                self._offset = 0
+                end = numbytes
+            ret = self._buffer[self._offset : end]
+            self._offset = end
+            return ret
+
+
 class PRNG:
     # this returns a callable which, when invoked with an integer N, will
     # return N pseudorandom bytes. Note: this is a short-term PRNG, meant
@@ -106,15 +189,25 @@ class PRNG:
     # only needs to run it a few times per seed. It does not provide
     # protection against state compromise (forward security).
     def __init__(self, seed):
-        self.generator = self.block_generator(seed)
+        self.__seed = seed
+        self.__counter = 0
+        self.__buffer = b("")
 
     def __call__(self, numbytes):
-        a = [next(self.generator) for i in range(numbytes)]
-
-        if PY2:  # pragma: no branch
-            return "".join(a)
-        else:
-            return bytes(a)
+        # returns the same bytes as block_generator(), but whole blocks at
+        # a time
+        blocks = [self.__buffer]
+        available = len(self.__buffer)
+        while available < numbytes:
+            block = sha256(
+                ("prng-%d-%s" % (self.__counter, self.__seed)).encode()
+            ).digest()
+            self.__counter += 1
+            blocks.append(block)
+            available += len(block)
+        data = b("").join(blocks)
+        self.__buffer = data[numbytes:]
+        return data[:numbytes]
 
     def block_generator(self, seed):
         counter = 0
@@ -126,6 +219,108 @@ class PRNG:
             counter += 1
 
 
+# the counter of CounterKDF
+_COUNTER = struct.Struct(">Q")
+
+
+class CounterKDF(object):
+    """
+    Deterministic source of pseudorandom bytes derived from a seed.
+
+    Uses the KDF in counter mode from NIST SP 800-108 with HMAC: the
+    output is the concatenation of HMAC(seed, counter || label) for
+    counter equal 1, 2, 3, ... (encoded as 64 bit big-endian integers).
+
+    Like :class:`PRNG` it can be passed as the `entropy` parameter,
+    for example to :func:`~ecdsa.keys.SigningKey.generate_many`, to
+    derive many reproducible keys from a single seed. The returned bytes
+    don't depend on the sizes of the individual reads. It does not
+    provide protection against state compromise (forward security).
+    """
+
+    def __init__(self, seed, label=b(""), hashmod=sha256):
+        """
+        :param seed: the secret the bytes are derived from
+        :type seed: :term:`bytes-like object`
+        :param label: the purpose of the derived bytes, different labels
+            give independent outputs for the same seed
+        :type label: :term:`bytes-like object`
+        :param hashmod: the hash function used with HMAC
+        """
+        # the HMAC is keyed just once, every block uses a copy of it
+        self.__hmac = hmac.new(bytes(seed), digestmod=hashmod)
+        self.__label = bytes(label)
+        self.__counter = 0
+        self.__buffer = b("")
+
+    def __call__(self, numbytes):
+        """Return the next `numbytes` bytes."""
+        blocks = [self.__buffer]
+        available = len(self.__buffer)
+        while available < numbytes:
+            self.__counter += 1
+            mac = self.__hmac.copy()
+            mac.update(_COUNTER.pack(self.__counter) + self.__label)
+            block = mac.digest()
+            blocks.append(block)
+            available += len(block)
+        data = b("").join(blocks)
+        self.__buffer = data[numbytes:]
+        return data[:numbytes]
+
+
+class LRUCache(object):
+    """
+    Thread-safe mapping that keeps a limited number of entries.
+
+    When the size limit is reached, the least recently used entries are
+    removed (on Python 2.6 arbitrary entries are removed instead).
+    """
+
+    def __init__(self, max_size):
+        """
+        :param int max_size: maximum number of entries kept in the cache
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be positive")
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        if OrderedDict is not None:  # pragma: no branch
+            self._data = OrderedDict()
+        else:  # pragma: no cover
+            self._data = {}
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=None):
+        """Return the value for key (marking it as recently used)."""
+        with self._lock:
+            try:
+                value = self._data.pop(key)
+            except KeyError:
+                return default
+            self._data[key] = value
+            return value
+
+    def put(self, key, value):
+        """Save the value for key, remove old entries if necessary."""
+        with self._lock:
+            data = self._data
+            data.pop(key, None)
+            data[key] = value
+            while len(data) > self.max_size:
+                if OrderedDict is not None:  # pragma: no branch
+                    data.popitem(last=False)
+                else:  # pragma: no cover
+                    data.popitem()
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+
 def randrange_from_seed__overshoot_modulo(seed, order):
     # hash the data, then turn the digest into a number in [1,order).
     #